@@ -16,9 +16,161 @@ try:
     ## TODO: Will the `_version.py` file *always* be present?
     ## TODO: What if the person doesn't do "pip install"?
     from ._version import __version__, __version_tuple__
-except:
+except ImportError:
     __version__ = "unknown"
     __version_tuple__ = (999, 999, 999)
 
 
-from synoptic.services import *
+import contextlib
+import importlib
+import importlib.util
+import sys
+
+# Public names and the module each is imported from. They are imported
+# when first used, so `import synoptic` doesn't import Polars, requests,
+# or the token config until a request is made.
+_lazy_modules = {
+    "synoptic.services": [
+        "TOKEN",
+        "SynopticAPI",
+        "SynopticAPIError",
+        "TimeSeries",
+        "Latest",
+        "NearestTime",
+        "Precipitation",
+        "Latency",
+        "QCSegments",
+        "Metadata",
+        "QCTypes",
+        "Variables",
+        "Networks",
+        "NetworkTypes",
+        "fetch_many",
+        "merge_json",
+        "response_json",
+        "parse_chunk",
+        "parse_obrange",
+        "split_time_range",
+        "string_to_timedelta",
+    ],
+    "synoptic.aio": [
+        "AsyncSynopticAPI",
+        "AsyncTimeSeries",
+        "AsyncLatest",
+        "AsyncNearestTime",
+        "AsyncPrecipitation",
+        "AsyncLatency",
+        "AsyncMetadata",
+    ],
+    "synoptic.scan": ["scan_timeseries"],
+    "synoptic.token": ["ANSI", "Token", "configure"],
+    "synoptic.budget": [
+        "MemoryBudgetError",
+        "estimate_size",
+        "format_size",
+        "parse_size",
+        "plan_budget",
+    ],
+    "synoptic.cache": ["CACHE", "configure_cache"],
+    "synoptic.chunking": ["CHUNK_CONFIG", "ChunkPlanner", "configure_chunking"],
+    "synoptic.deadline": ["Deadline", "DeadlineExceeded", "RequestCancelled"],
+    "synoptic.params": ["station_selectors", "validate_params"],
+    "synoptic.retry": ["configure_rate_limit", "configure_retry"],
+    "synoptic.session": [
+        "api_url",
+        "configure_session",
+        "configure_timeout",
+        "get_session",
+        "http_get",
+        "set_session",
+    ],
+    "synoptic.singleflight": ["IN_FLIGHT"],
+    "synoptic.json_parsers": [
+        "parse_stations_latency",
+        "parse_stations_latest_nearesttime",
+        "parse_stations_metadata",
+        "parse_stations_precipitation",
+        "parse_stations_timeseries",
+    ],
+}
+_lazy_names = {
+    name: module for module, names in _lazy_modules.items() for name in names
+}
+_submodules = {
+    "aio",
+    "budget",
+    "cache",
+    "chunking",
+    "deadline",
+    "decode",
+    "json_parsers",
+    "params",
+    "polars_namespace",
+    "retry",
+    "scan",
+    "server",
+    "services",
+    "session",
+    "singleflight",
+    "token",
+    "transport",
+}
+
+__all__ = list(_lazy_names)
+
+
+def __getattr__(name: str):
+    """Import a public name or submodule when it is first used."""
+    if name in _submodules:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _lazy_names:
+        module = _lazy_names[name]
+    elif not name.startswith("_"):
+        # Anything else `synoptic.services` has, as before names were
+        # imported lazily.
+        module = "synoptic.services"
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(importlib.import_module(module), name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names) | _submodules)
+
+
+class _RegisterNamespace:
+    """Register the `df.synoptic` namespace as soon as Polars is imported.
+
+    Importing Polars is slow, so `import synoptic` doesn't. This finder
+    runs the namespace module right after Polars is first imported.
+    """
+
+    def find_spec(self, name, path=None, target=None):  # noqa: D102
+        if name != "polars":
+            return None
+        with contextlib.suppress(ValueError):
+            sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(name)
+        if spec is None or spec.loader is None:
+            return spec
+
+        exec_module = spec.loader.exec_module
+
+        def exec_and_register(module):
+            exec_module(module)
+            importlib.import_module("synoptic.polars_namespace")
+
+        spec.loader.exec_module = exec_and_register
+        return spec
+
+
+if "polars" in sys.modules:
+    import synoptic.polars_namespace  # noqa: E402, F401
+else:
+    sys.meta_path.insert(0, _RegisterNamespace())
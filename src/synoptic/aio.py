@@ -0,0 +1,374 @@
+"""
+⚡ Asynchronous requests to the Synoptic API.
+
+The async service classes take the same arguments as their synchronous
+counterparts, but the request is not made until the instance is
+awaited. This lets many requests run concurrently from one event loop.
+
+Requires ``httpx`` (``pip install SynopticPy[async]``).
+
+Examples
+--------
+>>> import asyncio
+>>> from synoptic.aio import AsyncLatest
+>>> async def main():
+...     stations = ["wbb", "ukbkb", "kslc"]
+...     results = await asyncio.gather(*[AsyncLatest(stid=i) for i in stations])
+...     return [s.df() for s in results]
+>>> dfs = asyncio.run(main())
+"""
+
+import asyncio
+import weakref
+from datetime import datetime, timedelta
+
+from synoptic import decode
+from synoptic.cache import CACHE
+from synoptic.deadline import Deadline
+from synoptic.services import (
+    Latency,
+    Latest,
+    Metadata,
+    NearestTime,
+    Precipitation,
+    ServiceType,
+    TOKEN,
+    SynopticAPI,
+    SynopticAPIError,
+    TimeSeries,
+    response_json,
+)
+from synoptic.retry import RATE_LIMITER, RETRY
+from synoptic.session import SESSION_CONFIG, TIMEOUT
+from synoptic.singleflight import IN_FLIGHT
+from synoptic.token import ANSI, Token
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# An httpx.AsyncClient can only be used by the event loop that created
+# it, so keep one shared client for each running event loop.
+_clients = weakref.WeakKeyDictionary()
+
+
+def new_async_client() -> "httpx.AsyncClient":
+    """Create a new connection-pooled async client.
+
+    The connection pool uses the same settings as the shared
+    synchronous session (see ``synoptic.configure_session``).
+    """
+    if httpx is None:
+        raise ImportError(
+            "Asynchronous requests require httpx; "
+            "install with `pip install SynopticPy[async]`."
+        )
+
+    limits = httpx.Limits(
+        max_connections=(
+            SESSION_CONFIG["pool_maxsize"] if SESSION_CONFIG["pool_block"] else None
+        ),
+        max_keepalive_connections=(
+            SESSION_CONFIG["pool_maxsize"] if SESSION_CONFIG["keep_alive"] else 0
+        ),
+    )
+    return httpx.AsyncClient(limits=limits)
+
+
+def get_async_client() -> "httpx.AsyncClient":
+    """Get the shared async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = new_async_client()
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the shared async client for the running event loop."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _httpx_timeout(timeout: float | tuple[float, float] | None) -> "httpx.Timeout":
+    """Make an ``httpx.Timeout`` from one number or a ``(connect, read)`` tuple."""
+    if timeout is None:
+        timeout = (TIMEOUT["connect"], TIMEOUT["read"])
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+async def http_get_async(
+    url: str,
+    params: dict,
+    *,
+    client: "httpx.AsyncClient | None" = None,
+    timeout: float | tuple[float, float] | None = None,
+    deadline: Deadline | None = None,
+) -> "httpx.Response":
+    """Make a GET request, subject to the rate limit and retry policy.
+
+    This is the async version of ``synoptic.session.http_get``; the
+    rate limiter is shared with threaded requests.
+    """
+    client = client or get_async_client()
+    deadline = deadline or Deadline()
+    attempt = 0
+    while True:
+        await RATE_LIMITER.acquire_async()
+        try:
+            response = await client.get(
+                url,
+                params=params,
+                timeout=_httpx_timeout(deadline.timeout(timeout)),
+            )
+        except httpx.TransportError as e:
+            if attempt >= RETRY.total:
+                raise
+            try:
+                await deadline.sleep_async(RETRY.backoff(attempt))
+            except Exception as stop:
+                raise stop from e
+        else:
+            if attempt >= RETRY.total or not RETRY.is_retryable(response.status_code):
+                return response
+            await deadline.sleep_async(
+                RETRY.backoff(attempt, response.headers.get("Retry-After"))
+            )
+        attempt += 1
+
+
+class AsyncSynopticAPI(SynopticAPI):
+    """
+    Asynchronously request data from Synoptic's Weather API.
+
+    This is the parent class for all async services. Parameters are
+    parsed when the instance is created, exactly like ``SynopticAPI``,
+    and the request is made when the instance is awaited.
+
+    Parameters
+    ----------
+    service : {'timeseries', 'latest', 'nearesttime', 'precipitation', ...}
+        The Synoptic API service to request data from.
+    token : str
+        A 32-character Synoptic account token.
+    client : httpx.AsyncClient, optional
+        The HTTP client used to make the request. If None, uses a
+        shared connection-pooled client for the running event loop.
+    max_workers : int
+        Maximum number of concurrent requests when a request is split
+        into several parts (e.g., ``AsyncTimeSeries(chunk=...)``).
+    batch_size : int
+        Maximum number of values in a ``stid``, ``network``, or ``county``
+        list for a single request. Longer lists are split into batches.
+    timeout : float or tuple[float, float], optional
+        Seconds to wait for each attempt to connect and read.
+    deadline : float, timedelta, or Deadline, optional
+        Time limit for the whole request, starting when it is awaited.
+    verbose : bool
+        If True, prints each step of the request process.
+    **params : dict, optional
+        Additional Synoptic API request parameters. See ``SynopticAPI``.
+
+    Examples
+    --------
+    >>> s = await AsyncSynopticAPI("latest", stid="wbb")
+    """
+
+    def __init__(
+        self,
+        service: ServiceType,
+        *,
+        token: str | Token | None = None,
+        client: "httpx.AsyncClient | None" = None,
+        max_workers: int = 4,
+        batch_size: int = 200,
+        timeout: float | tuple[float, float] | None = None,
+        deadline: Deadline | float | timedelta | None = None,
+        verbose=True,
+        **params,
+    ):
+        self._setup(service, token=token, verbose=verbose, **params)
+        self.client = client
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.deadline = deadline
+
+    def __await__(self):
+        """Make the request when the instance is awaited."""
+        return self.fetch().__await__()
+
+    async def fetch(self):
+        """Make the API request and return this instance."""
+        self.deadline = Deadline.of(self.deadline)
+        self.deadline.check()
+        try:
+            async with asyncio.timeout(self.deadline.remaining()):
+                if self.token is TOKEN:
+                    await asyncio.to_thread(
+                        TOKEN.check_once,
+                        timeout=self.timeout,
+                        deadline=self.deadline,
+                    )
+                return await self._fetch()
+        except TimeoutError:
+            self.deadline.check()
+            raise
+
+    async def _fetch(self):
+        if (
+            getattr(self, "chunk", None) == "auto"
+            or getattr(self, "memory_budget", None) is not None
+        ):
+            # Planning the size of the request needs a blocking Metadata request.
+            raise SynopticAPIError(
+                "`chunk='auto'` and `memory_budget` are not supported for async "
+                "requests; give the chunk length (e.g., `chunk='7d'`)."
+            )
+        parts = self._split_params()
+        if parts:
+            await self._fetch_parts(parts)
+            return self
+
+        # An identical request already being made by another task is
+        # shared instead of making another.
+        leader = await IN_FLIGHT.do_async(self._flight_key(), self._request_async)
+        if leader is not self:
+            self._follow(leader)
+        return self
+
+    async def _request_async(self):
+        """Make the request (or read it from the cache) and return this instance."""
+        timer = datetime.now()
+        cached = await asyncio.to_thread(CACHE.get, self.service, self.params)
+        if cached is not None:
+            self.response = None
+            self.timers["api_request"] = datetime.now() - timer
+
+            timer = datetime.now()
+            self.json = decode.loads(cached)
+            self.timers["decode_json"] = datetime.now() - timer
+
+            self._attach_json()
+            return self
+
+        if self.verbose:
+            print(
+                f"🚚💨 Speedy delivery from Synoptic's {ANSI.text(self.service, ANSI.GREEN)} service."
+            )
+
+        timer = datetime.now()
+
+        # httpx only accepts str, int, and float params (not Token).
+        params = {k: str(v) for k, v in self.params.items()}
+
+        self.response = await http_get_async(
+            self.endpoint,
+            params,
+            client=self.client,
+            timeout=self.timeout,
+            deadline=self.deadline,
+        )
+        self.url = str(self.response.url)
+        self.timers["api_request"] = datetime.now() - timer
+
+        timer = datetime.now()
+        self.json = response_json(self.response)
+        self.timers["decode_json"] = datetime.now() - timer
+
+        self._attach_json()
+        await asyncio.to_thread(
+            CACHE.put, self.service, self.params, self.response.content
+        )
+        return self
+
+    async def _fetch_parts(self, parts: list[dict]):
+        """Request each part concurrently and merge the returned JSON.
+
+        Each part's stations are parsed to a DataFrame in a worker thread
+        as soon as it is downloaded, while the other parts download.
+        """
+        if self.verbose:
+            print(
+                f"🚚💨 Speedy delivery from Synoptic's {ANSI.text(self.service, ANSI.GREEN)} service"
+                f" in {len(parts)} parts."
+            )
+
+        timer = datetime.now()
+        semaphore = asyncio.Semaphore(self.max_workers)
+        deadline = self.deadline.child()
+
+        async def fetch_part(params):
+            part = type(self)(
+                client=self.client,
+                timeout=self.timeout,
+                deadline=deadline,
+                verbose=False,
+                **params,
+            )
+            part._allow_empty = True
+            async with semaphore:
+                await part
+            if self._parser is not None and not part._is_empty():
+                # The DataFrame is cached by the part's `df` method.
+                await asyncio.to_thread(part.df)
+            return part
+
+        # If one part fails, the other parts are cancelled.
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(fetch_part(p)) for p in parts]
+        except BaseExceptionGroup as e:
+            deadline.cancel()
+            raise e.exceptions[0] from None
+        self.parts = [task.result() for task in tasks]
+        self.timers["api_request"] = datetime.now() - timer
+
+        self._merge_parts()
+
+
+class AsyncTimeSeries(TimeSeries, AsyncSynopticAPI):
+    """Asynchronously get time series data for one or more stations.
+
+    Takes the same arguments as ``TimeSeries``.
+    """
+
+
+class AsyncLatest(Latest, AsyncSynopticAPI):
+    """Asynchronously get the most recent data from one or more stations.
+
+    Takes the same arguments as ``Latest``.
+    """
+
+
+class AsyncNearestTime(NearestTime, AsyncSynopticAPI):
+    """Asynchronously get data nearest a specified time for one or more stations.
+
+    Takes the same arguments as ``NearestTime``.
+    """
+
+
+class AsyncPrecipitation(Precipitation, AsyncSynopticAPI):
+    """Asynchronously request derived precipitation total or intervals.
+
+    Takes the same arguments as ``Precipitation``.
+    """
+
+
+class AsyncLatency(Latency, AsyncSynopticAPI):
+    """Asynchronously request station latency.
+
+    Takes the same arguments as ``Latency``.
+    """
+
+
+class AsyncMetadata(Metadata, AsyncSynopticAPI):
+    """Asynchronously retrieve metadata for one or more stations.
+
+    Takes the same arguments as ``Metadata``.
+    """
@@ -0,0 +1,161 @@
+"""
+🧮 Keep a request within a memory budget.
+
+Before a ``TimeSeries`` request with a ``memory_budget`` is made, the
+number of values it returns is estimated from a ``Metadata`` request:
+stations × sensors × hours × observations per hour (see
+``synoptic.chunking.CHUNK_CONFIG``). If the request would need more
+memory than the budget, it is split into chunks, its data is spilled to
+Parquet files, or it is refused, before any data is downloaded.
+
+The estimate is rough; it assumes every sensor reports at the typical
+rate for the whole period.
+
+Examples
+--------
+>>> import synoptic
+>>> s = synoptic.TimeSeries(state="TX", recent="30d", lazy=True)
+>>> s.estimate()
+>>> s = synoptic.TimeSeries(
+...     state="TX", recent="30d", memory_budget="2GB", over_budget="spill"
+... )
+>>> lf = s.scan()
+"""
+
+import re
+from datetime import timedelta
+from typing import Literal
+
+# Approximate bytes of memory for each value,
+#   in the final DataFrame (long format, with station metadata),
+DATAFRAME_BYTES_PER_VALUE = 150
+#   and while a response is received and parsed (JSON text, decoded
+#   Python objects, and the DataFrame).
+REQUEST_BYTES_PER_VALUE = 250
+
+_units = {
+    "": 1,
+    "b": 1,
+    "kb": 10**3,
+    "mb": 10**6,
+    "gb": 10**9,
+    "tb": 10**12,
+    "kib": 2**10,
+    "mib": 2**20,
+    "gib": 2**30,
+    "tib": 2**40,
+}
+
+
+class MemoryBudgetError(MemoryError):
+    """A request would use more memory than its budget."""
+
+
+def parse_size(size: int | str) -> int:
+    """Parse a number of bytes, or a string like ``'500MB'`` or ``'2 GiB'``."""
+    if isinstance(size, int):
+        return size
+    match = re.fullmatch(r"\s*([\d.]+)\s*([a-zA-Z]*)\s*", str(size))
+    if not match or match.group(2).lower() not in _units:
+        raise ValueError(f"Can't parse {size!r} as a size, e.g., '500MB' or '2GB'.")
+    return int(float(match.group(1)) * _units[match.group(2).lower()])
+
+
+def format_size(size: float) -> str:
+    """Format a number of bytes as a string, e.g., ``'1.5 GB'``."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1000:
+            return f"{size:.3g} {unit}"
+        size /= 1000
+    return f"{size:.3g} TB"
+
+
+def estimate_size(values_per_hour: float, hours: float) -> dict:
+    """Estimate the number of values and the memory used by a request.
+
+    Parameters
+    ----------
+    values_per_hour : float
+        Values in one hour of data (e.g., stations × sensors × 12).
+    hours : float
+        Length of the requested period.
+
+    Returns
+    -------
+    A dict with the ``values``, ``values_per_hour``, ``hours``,
+    ``dataframe_bytes`` of the final DataFrame, and ``request_bytes``
+    needed to receive and parse the data in one request.
+    """
+    values = int(values_per_hour * hours)
+    return {
+        "values": values,
+        "values_per_hour": values_per_hour,
+        "hours": hours,
+        "dataframe_bytes": values * DATAFRAME_BYTES_PER_VALUE,
+        "request_bytes": values * REQUEST_BYTES_PER_VALUE,
+    }
+
+
+def plan_budget(
+    estimate: dict,
+    budget: int,
+    over_budget: Literal["chunk", "spill", "raise"],
+    max_workers: int,
+) -> tuple[timedelta | None, bool]:
+    """Plan a request to keep it within a memory budget.
+
+    Parameters
+    ----------
+    estimate : dict
+        Output of ``estimate_size``.
+    budget : int
+        Bytes of memory the request may use.
+    over_budget : {"chunk", "spill", "raise"}
+        What to do if the request would use more than the budget:
+
+        - ``"chunk"``: request the data in chunks small enough that the
+          parts being received and the final DataFrame fit the budget.
+        - ``"spill"``: request the data in chunks and write each to a
+          Parquet file, so only the parts being received are in memory.
+        - ``"raise"``: raise ``MemoryBudgetError``.
+    max_workers : int
+        Number of parts received at once.
+
+    Returns
+    -------
+    The longest chunk that fits the budget (None if the request fits
+    without chunks), and whether to spill the data to Parquet files.
+    """
+    if over_budget not in ("chunk", "spill", "raise"):
+        raise ValueError(
+            f"`over_budget` must be 'chunk', 'spill', or 'raise', not {over_budget!r}."
+        )
+    if estimate["request_bytes"] <= budget:
+        return None, False
+
+    message = (
+        f"The request is estimated to return {estimate['values']:,} values and need "
+        f"{format_size(estimate['request_bytes'])} of memory, more than the "
+        f"budget of {format_size(budget)}."
+    )
+    if over_budget == "raise":
+        raise MemoryBudgetError(message)
+
+    spill = over_budget == "spill"
+    available = budget if spill else budget - estimate["dataframe_bytes"]
+    if available <= 0:
+        raise MemoryBudgetError(
+            f"{message} The DataFrame alone needs "
+            f"{format_size(estimate['dataframe_bytes'])}; "
+            "use `over_budget='spill'` or select fewer stations or variables."
+        )
+
+    per_part = available / max_workers
+    hours = per_part / (estimate["values_per_hour"] * REQUEST_BYTES_PER_VALUE)
+    chunk = timedelta(minutes=int(hours * 60))
+    if chunk < timedelta(minutes=1):
+        raise MemoryBudgetError(
+            f"{message} Even one minute of data for these stations doesn't "
+            "fit; select fewer stations or use fewer `max_workers`."
+        )
+    return chunk, spill
@@ -0,0 +1,229 @@
+"""
+🗄️ Cache API responses on disk.
+
+When the cache is enabled, each successful response is stored as a
+gzip-compressed file in ``~/.config/SynopticPy/cache/`` (under
+``CONFIG_PATH``). A later request with the same service and parameters
+(ignoring the token) is read from disk instead of the network until the
+cached response is older than the service's time-to-live.
+
+When the cache is larger than ``max_size``, the least recently used
+responses are deleted.
+
+The cache is disabled unless you turn it on.
+
+Examples
+--------
+>>> import synoptic
+>>> synoptic.configure_cache(True, max_size=2e9, ttl={"timeseries": 86400})
+>>> s = synoptic.TimeSeries(stid="wbb", recent="1d")  # from the network
+>>> s = synoptic.TimeSeries(stid="wbb", recent="1d")  # from the cache
+>>> synoptic.CACHE.clear()
+"""
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from synoptic.token import CONFIG_PATH
+
+# Seconds a cached response is used for each service.
+# Data for recent times may still be updated, so those services have a
+# short TTL; metadata tables rarely change.
+DEFAULT_TTL = {
+    "timeseries": 60 * 60,
+    "latest": 60,
+    "nearesttime": 60 * 60,
+    "precipitation": 60 * 60,
+    "qcsegments": 60 * 60,
+    "latency": 60,
+    "metadata": 60 * 60 * 24,
+    "qctypes": 60 * 60 * 24 * 7,
+    "variables": 60 * 60 * 24 * 7,
+    "networks": 60 * 60 * 24 * 7,
+    "networktypes": 60 * 60 * 24 * 7,
+}
+
+
+class ResponseCache:
+    """A size-limited cache of compressed API responses on disk.
+
+    Parameters
+    ----------
+    path : Path
+        Directory the responses are stored in.
+    max_size : int
+        Maximum size of the cache, in bytes, after compression.
+    ttl : dict[str, float]
+        Seconds a cached response is used for each service. Services
+        not listed, or with a TTL of 0, are not cached.
+    enabled : bool
+        If False, nothing is read from or written to the cache.
+    """
+
+    def __init__(
+        self,
+        path: Path = CONFIG_PATH / "cache",
+        max_size: int = 1_000_000_000,
+        ttl: dict[str, float] | None = None,
+        enabled: bool = False,
+    ):
+        self.path = Path(path).expanduser()
+        self.max_size = int(max_size)
+        self.ttl = DEFAULT_TTL | (ttl or {})
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+    def __repr__(self):  # noqa: D105
+        return (
+            f"ResponseCache(path='{self.path}', max_size={self.max_size:,}, "
+            f"enabled={self.enabled})"
+        )
+
+    @staticmethod
+    def key(service: str, params: dict) -> str:
+        """Hash of the service and parameters, not including the token."""
+        canonical = json.dumps(
+            [service, sorted((k, str(v)) for k, v in params.items() if k != "token")]
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def file(self, service: str, params: dict) -> Path:
+        """Path of the cached response for a request."""
+        return self.path / f"{service}-{self.key(service, params)}.json.gz"
+
+    def use(self, service: str) -> bool:
+        """Whether responses from this service are cached."""
+        return self.enabled and self.ttl.get(service, 0) > 0
+
+    def open(self, service: str, params: dict):
+        """Open the cached response as a binary file, or None if not cached.
+
+        Expired responses are deleted.
+        """
+        if not self.use(service):
+            return None
+
+        file = self.file(service, params)
+        try:
+            stat = file.stat()
+            if time.time() - stat.st_mtime > self.ttl[service]:
+                file.unlink(missing_ok=True)
+                return None
+            # The access time marks when a response was last used.
+            os.utime(file, (time.time(), stat.st_mtime))
+            return gzip.open(file, "rb")
+        except FileNotFoundError:
+            return None
+
+    def get(self, service: str, params: dict) -> bytes | None:
+        """Return the cached response content, or None if not cached."""
+        f = self.open(service, params)
+        if f is None:
+            return None
+        with f:
+            try:
+                return f.read()
+            except (OSError, EOFError):
+                # A corrupt file is treated as a cache miss.
+                return None
+
+    @contextlib.contextmanager
+    def writer(self, service: str, params: dict):
+        """Write a response to the cache.
+
+        Yields a binary file to write the response content to. The
+        response is only added to the cache if the block completes
+        without an error.
+        """
+        if not self.use(service):
+            yield None
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                yield f
+            os.replace(tmp, self.file(service, params))
+        finally:
+            Path(tmp).unlink(missing_ok=True)
+
+        self.evict()
+
+    def put(self, service: str, params: dict, content: bytes) -> None:
+        """Add a response to the cache."""
+        with self.writer(service, params) as f:
+            if f is not None:
+                f.write(content)
+
+    def evict(self) -> None:
+        """Delete the least recently used responses until under ``max_size``."""
+        with self._lock:
+            files = []
+            for file in self.path.glob("*.json.gz"):
+                try:
+                    files.append((file.stat(), file))
+                except FileNotFoundError:
+                    pass
+
+            size = sum(stat.st_size for stat, _ in files)
+            for stat, file in sorted(files, key=lambda x: x[0].st_atime):
+                if size <= self.max_size:
+                    break
+                file.unlink(missing_ok=True)
+                size -= stat.st_size
+
+    def size(self) -> int:
+        """Total size of the cache, in bytes."""
+        return sum(f.stat().st_size for f in self.path.glob("*.json.gz"))
+
+    def clear(self) -> None:
+        """Delete all cached responses."""
+        for file in self.path.glob("*.json.gz"):
+            file.unlink(missing_ok=True)
+
+
+CACHE = ResponseCache()
+
+
+def configure_cache(
+    enabled: bool = True,
+    *,
+    path: str | Path | None = None,
+    max_size: float | None = None,
+    ttl: dict[str, float] | float | None = None,
+) -> ResponseCache:
+    """Turn the response cache on or off and configure it.
+
+    Arguments not given keep their current value.
+
+    Parameters
+    ----------
+    enabled : bool
+        If True, cache responses on disk.
+    path : str or Path
+        Directory to store cached responses in.
+        Default is ``~/.config/SynopticPy/cache``.
+    max_size : float
+        Maximum size of the cache in bytes. Default is 1 GB.
+    ttl : dict or float
+        Seconds a cached response is used, either for each service
+        (e.g., ``{"metadata": 86400}``) or one value for all services.
+    """
+    CACHE.enabled = enabled
+    if path is not None:
+        CACHE.path = Path(path).expanduser()
+    if max_size is not None:
+        CACHE.max_size = int(max_size)
+    if isinstance(ttl, dict):
+        CACHE.ttl |= ttl
+    elif ttl is not None:
+        CACHE.ttl = dict.fromkeys(DEFAULT_TTL, ttl)
+    return CACHE
@@ -0,0 +1,188 @@
+"""
+📐 Choose the chunk size of a long request while it is made.
+
+A chunk that is too small makes many requests, and the time is spent
+in per-request overhead. A chunk that is too big makes responses that
+are slow, time out, or use too much memory.
+
+With ``chunk="auto"``, the first chunk is sized from a ``Metadata``
+request: the number of stations and variables gives an estimate of the
+number of values per hour of data. After each chunk is received, the
+observed values per hour and seconds per hour update the estimate, and
+the next chunk grows or shrinks toward a target number of values and
+response time.
+
+Examples
+--------
+>>> import synoptic
+>>> synoptic.configure_chunking(target_values=500_000, target_seconds=5)
+>>> s = synoptic.TimeSeries(state="UT", recent="90d", chunk="auto")
+>>> s.planner.history
+"""
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+# Default settings for adaptive chunks.
+#   target_values : number of observed values in each response.
+#   target_seconds : time to request and decode each response.
+#   min_chunk, max_chunk : limits of the chunk length.
+#   obs_per_hour : observations of each variable per hour, assumed for
+#       the first chunk, before any data is received.
+CHUNK_CONFIG = {
+    "target_values": 1_000_000,
+    "target_seconds": 10.0,
+    "min_chunk": timedelta(hours=1),
+    "max_chunk": timedelta(days=31),
+    "obs_per_hour": 12,
+}
+
+# A chunk grows or shrinks by no more than this factor at a time.
+_MAX_CHANGE = 2.0
+
+
+def configure_chunking(
+    *,
+    target_values: int | None = None,
+    target_seconds: float | None = None,
+    min_chunk: timedelta | None = None,
+    max_chunk: timedelta | None = None,
+    obs_per_hour: float | None = None,
+) -> dict:
+    """Configure how ``chunk="auto"`` sizes each chunk.
+
+    Arguments not given keep their current value.
+
+    Parameters
+    ----------
+    target_values : int
+        Number of observed values in each response.
+    target_seconds : float
+        Time to request and decode each response.
+    min_chunk, max_chunk : timedelta
+        Limits of the chunk length.
+    obs_per_hour : float
+        Observations of each variable per hour, assumed for the first
+        chunk.
+
+    Returns
+    -------
+    The ``CHUNK_CONFIG`` settings.
+    """
+    for key, value in dict(
+        target_values=target_values,
+        target_seconds=target_seconds,
+        min_chunk=min_chunk,
+        max_chunk=max_chunk,
+        obs_per_hour=obs_per_hour,
+    ).items():
+        if value is not None:
+            CHUNK_CONFIG[key] = value
+    return CHUNK_CONFIG
+
+
+class ChunkPlanner:
+    """Split a time range into windows sized from the responses so far.
+
+    Iterating over the planner yields ``(start, end)`` windows. Call
+    ``record`` when the data for a window is received so the following
+    windows are sized from it. Adjacent windows share their boundary
+    time, like ``split_time_range``.
+
+    Parameters
+    ----------
+    start, end : datetime
+        The time range to split.
+    values_per_hour : float
+        Estimated number of values in one hour of data, used to size
+        the first windows.
+    step : timedelta
+        Window lengths are a multiple of this.
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        end: datetime,
+        *,
+        values_per_hour: float,
+        step: timedelta = timedelta(minutes=1),
+    ):
+        self.start = start
+        self.end = end
+        self.step = step
+        self.config = dict(CHUNK_CONFIG)
+        self.values_per_hour = values_per_hour
+        self.seconds_per_hour = None
+        self.history = []
+        self.chunk = self._clamp(self._target())
+
+    def __repr__(self):  # noqa: D105
+        return (
+            f"ChunkPlanner(chunk={self.chunk}, values_per_hour={self.values_per_hour}, "
+            f"seconds_per_hour={self.seconds_per_hour})"
+        )
+
+    def __iter__(self) -> Iterator[tuple[datetime, datetime]]:  # noqa: D105
+        window_start = self.start
+        while True:
+            window_end = min(window_start + self.chunk, self.end)
+            yield window_start, window_end
+            if window_end >= self.end:
+                return
+            window_start = window_end
+
+    def _target(self) -> timedelta:
+        """Return the window length that meets both targets."""
+        hours = []
+        if self.values_per_hour:
+            hours.append(self.config["target_values"] / self.values_per_hour)
+        if self.seconds_per_hour:
+            hours.append(self.config["target_seconds"] / self.seconds_per_hour)
+        if not hours:
+            return self.config["max_chunk"]
+        return timedelta(hours=min(hours))
+
+    def _clamp(self, chunk: timedelta) -> timedelta:
+        """Limit a window length and round it down to a multiple of ``step``."""
+        chunk = max(self.config["min_chunk"], min(self.config["max_chunk"], chunk))
+        return max(self.step, chunk // self.step * self.step)
+
+    def record(self, start: datetime, end: datetime, values: int, seconds: float):
+        """Update the estimates with the data received for a window.
+
+        Parameters
+        ----------
+        start, end : datetime
+            The window.
+        values : int
+            Number of observed values received.
+        seconds : float
+            Time to request and decode the response.
+        """
+        hours = (end - start) / timedelta(hours=1)
+        if hours <= 0:
+            return
+        self.history.append(
+            {
+                "start": start,
+                "end": end,
+                "chunk": end - start,
+                "values": values,
+                "seconds": seconds,
+            }
+        )
+
+        # The first observation replaces the estimate from metadata;
+        # later ones are averaged with the previous estimate.
+        observed = len(self.history) > 1
+        for name, value in (
+            ("values_per_hour", values / hours),
+            ("seconds_per_hour", seconds / hours),
+        ):
+            old = getattr(self, name)
+            setattr(self, name, (old + value) / 2 if observed and old else value)
+
+        chunk = self._target()
+        chunk = max(self.chunk / _MAX_CHANGE, min(self.chunk * _MAX_CHANGE, chunk))
+        self.chunk = self._clamp(chunk)
@@ -0,0 +1,204 @@
+"""
+⏱️ Deadlines and cancellation for requests.
+
+A ``Deadline`` is a time limit for a whole request: every retry, every
+part of a request split into chunks or batches, and the download of the
+response body. When the time is up, or the deadline is cancelled, the
+request stops with ``DeadlineExceeded`` or ``RequestCancelled`` instead
+of waiting on a slow server.
+
+Every attempt also has connect and read timeouts (see
+``synoptic.configure_timeout``), so one stalled connection can't hang a
+request even without a deadline.
+
+Examples
+--------
+Give up on a request after 10 seconds,
+
+>>> import synoptic
+>>> df = synoptic.TimeSeries(state="UT", recent="1d", deadline=10).df()
+
+or cancel it from another thread.
+
+>>> deadline = synoptic.Deadline()
+>>> s = synoptic.TimeSeries(state="UT", recent="30d", chunk="1d", deadline=deadline, lazy=True)
+>>> # ...in another thread
+>>> deadline.cancel()
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+import weakref
+from collections.abc import Iterable, Iterator
+from datetime import timedelta
+
+
+class DeadlineExceeded(TimeoutError):
+    """A request did not finish before its deadline."""
+
+
+class RequestCancelled(Exception):
+    """A request was cancelled."""
+
+
+class Deadline:
+    """A time limit, shared by every part of a request, that may be cancelled.
+
+    The time starts when the deadline is created.
+
+    Parameters
+    ----------
+    seconds : float or timedelta, optional
+        Time allowed. If None, there is no time limit, but the deadline
+        may still be cancelled.
+    """
+
+    def __init__(self, seconds: float | timedelta | None = None):
+        if isinstance(seconds, timedelta):
+            seconds = seconds.total_seconds()
+        self.seconds = seconds
+        self.expires = None if seconds is None else time.monotonic() + seconds
+        self._cancelled = threading.Event()
+        self._children = weakref.WeakSet()
+        self._lock = threading.Lock()
+        # Fails when cancelled, to wake threads waiting on futures.
+        self._signal = concurrent.futures.Future()
+
+    @classmethod
+    def of(cls, value: "Deadline | float | timedelta | None") -> "Deadline":
+        """Return a Deadline, or a new one that starts now for a number of seconds."""
+        return value if isinstance(value, Deadline) else cls(value)
+
+    def __repr__(self):  # noqa: D105
+        state = "cancelled" if self.cancelled else f"remaining={self.remaining()}"
+        return f"Deadline(seconds={self.seconds}, {state})"
+
+    def child(self) -> "Deadline":
+        """Make a deadline with the same expiry that is cancelled with this one.
+
+        Cancelling the child doesn't cancel this deadline, so a fan-out
+        of requests can be stopped without cancelling the caller's
+        deadline.
+        """
+        child = Deadline()
+        child.seconds, child.expires = self.seconds, self.expires
+        with self._lock:
+            self._children.add(child)
+        if self.cancelled:
+            child.cancel()
+        return child
+
+    def cancel(self) -> None:
+        """Cancel the requests using this deadline (and its children)."""
+        self._cancelled.set()
+        with self._lock:
+            children = list(self._children)
+            if not self._signal.done():
+                self._signal.set_exception(
+                    RequestCancelled("The request was cancelled.")
+                )
+        for child in children:
+            child.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the deadline was cancelled."""
+        return self._cancelled.is_set()
+
+    def remaining(self) -> float | None:
+        """Seconds left, or None if there is no time limit."""
+        if self.expires is None:
+            return None
+        return max(0.0, self.expires - time.monotonic())
+
+    def error(self) -> Exception | None:
+        """Return the error for a cancelled or passed deadline, or None."""
+        if self.cancelled:
+            return RequestCancelled("The request was cancelled.")
+        if self.remaining() == 0:
+            return DeadlineExceeded(
+                f"The request did not finish within {self.seconds} seconds."
+            )
+        return None
+
+    def check(self) -> None:
+        """Raise an error if the deadline was cancelled or has passed."""
+        if error := self.error():
+            raise error
+
+    def timeout(
+        self, timeout: float | tuple[float, float] | None
+    ) -> float | tuple[float, float] | None:
+        """Shorten a ``(connect, read)`` timeout to the time remaining."""
+        self.check()
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+        return min(timeout, remaining)
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep unless cancelled.
+
+        Raises ``DeadlineExceeded`` right away, instead of sleeping, if
+        the deadline would pass first.
+        """
+        self.check()
+        remaining = self.remaining()
+        if remaining is not None and seconds >= remaining:
+            raise DeadlineExceeded(
+                f"The request can't be retried within {self.seconds} seconds."
+            )
+        if self._cancelled.wait(seconds):
+            self.check()
+
+    async def sleep_async(self, seconds: float) -> None:
+        """Sleep without blocking the event loop (see ``sleep``)."""
+        self.check()
+        remaining = self.remaining()
+        if remaining is not None and seconds >= remaining:
+            raise DeadlineExceeded(
+                f"The request can't be retried within {self.seconds} seconds."
+            )
+        await asyncio.sleep(seconds)
+        self.check()
+
+    def as_completed(
+        self, futures: Iterable[concurrent.futures.Future]
+    ) -> Iterator[concurrent.futures.Future]:
+        """Yield futures as they finish, like ``concurrent.futures.as_completed``.
+
+        Raises ``DeadlineExceeded`` or ``RequestCancelled`` if the
+        deadline passes or is cancelled before every future is done.
+        """
+        futures = list(futures)
+        remaining = len(futures)
+        if not remaining:
+            return
+        try:
+            for future in concurrent.futures.as_completed(
+                [*futures, self._signal], timeout=self.remaining()
+            ):
+                if future is self._signal:
+                    break
+                yield future
+                remaining -= 1
+                if not remaining:
+                    return
+        except TimeoutError:
+            pass
+        self.check()
+        raise DeadlineExceeded(
+            f"The request did not finish within {self.seconds} seconds."
+        )
+
+    def guard(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Check the deadline as each chunk of a response is read."""
+        for chunk in chunks:
+            self.check()
+            yield chunk
@@ -0,0 +1,153 @@
+"""
+🏎️ Decode JSON returned by the Synoptic API.
+
+Large responses spend a lot of time in the JSON decoder. If a faster
+decoder is installed (``orjson`` or ``msgspec``), it is used instead of
+Python's built-in ``json`` module. Install one with
+``pip install SynopticPy[fast-json]``.
+
+The decoder being used is ``synoptic.decode.JSON_BACKEND``.
+
+To limit memory for very large responses, :func:`iter_json_stream`
+decodes the ``STATION`` array one station at a time while the response
+is downloaded.
+"""
+
+import codecs
+import json
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+try:
+    import orjson
+
+    JSON_BACKEND = "orjson"
+    _loads = orjson.loads
+    _decode_errors = (orjson.JSONDecodeError,)
+except ImportError:
+    try:
+        import msgspec
+
+        JSON_BACKEND = "msgspec"
+        _loads = msgspec.json.decode
+        _decode_errors = (msgspec.DecodeError,)
+    except ImportError:
+        JSON_BACKEND = "json"
+        _loads = json.loads
+        _decode_errors = ()
+
+
+def loads(content: bytes | str):
+    """Decode a JSON document with the fastest available decoder.
+
+    Raises a ValueError if the content is not valid JSON, regardless of
+    which decoder is used.
+    """
+    try:
+        return _loads(content)
+    except _decode_errors as e:
+        raise ValueError(str(e)) from e
+
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"\s*")
+
+
+def iter_json_stream(
+    chunks: Iterable[bytes], array_key: str = "STATION"
+) -> Iterator[tuple[str, Any]]:
+    """Incrementally decode a JSON object from a stream of bytes.
+
+    Yields a ``(key, value)`` pair for each key of the top-level object,
+    except the items of the ``array_key`` array are yielded one at a
+    time as ``(array_key, item)``. Only the item being decoded is held
+    in memory, not the whole document.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        The bytes of the document, e.g., ``response.iter_content(...)``.
+    array_key : str
+        The top-level key whose array items are yielded one by one.
+    """
+    chunks = iter(chunks)
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    exhausted = False
+
+    def fill(size: int):
+        """Read at least one more chunk and until the buffer is ``size`` long."""
+        nonlocal buf, pos, exhausted
+        pieces = [buf[pos:]]
+        length = len(pieces[0])
+        pos = 0
+        while True:
+            chunk = next(chunks, None)
+            if chunk is None:
+                exhausted = True
+                pieces.append(text_decoder.decode(b"", final=True))
+                break
+            pieces.append(text_decoder.decode(chunk))
+            length += len(pieces[-1])
+            if length >= size:
+                break
+        buf = "".join(pieces)
+
+    def peek() -> str:
+        """Skip whitespace and return the next character."""
+        nonlocal pos
+        while True:
+            pos = _whitespace.match(buf, pos).end()
+            if pos < len(buf):
+                return buf[pos]
+            if exhausted:
+                return ""
+            fill(1)
+
+    def decode_value():
+        """Decode the next value, reading more of the stream as needed."""
+        nonlocal pos
+        while True:
+            peek()
+            try:
+                value, end = _decoder.raw_decode(buf, pos)
+                # A number at the end of the buffer may be cut off.
+                if end == len(buf) and not exhausted:
+                    raise ValueError("Value may be incomplete.")
+            except ValueError:
+                if exhausted:
+                    raise
+                # Double the buffer before trying again, so a large value
+                # isn't decoded over and over for every small chunk.
+                fill(2 * (len(buf) - pos) + 1)
+                continue
+            pos = end
+            return value
+
+    def expect(char: str):
+        nonlocal pos
+        if peek() != char:
+            raise ValueError(f"Expected {char!r} at character {pos} of buffer.")
+        pos += 1
+
+    expect("{")
+    while (char := peek()) != "}":
+        if char == ",":
+            pos += 1
+            continue
+
+        key = decode_value()
+        expect(":")
+
+        if key == array_key and peek() == "[":
+            pos += 1
+            while (char := peek()) != "]":
+                if char == ",":
+                    pos += 1
+                    continue
+                yield key, decode_value()
+            pos += 1
+        else:
+            yield key, decode_value()
@@ -1,12 +1,76 @@
 """Parse Synoptic's JSON into DataFrames."""
 
+import json
+import re
+import warnings
+from collections.abc import Iterable, Iterator
+from itertools import chain, islice
 from typing import TYPE_CHECKING
 
+import numpy as np
 import polars as pl
 
 if TYPE_CHECKING:
     from synoptic.services import SynopticAPI
 
+# Observed variables with text values. Cloud layers (e.g., 'cloud_layer_1')
+# have a sky condition and a height; all other variables are numbers.
+STRING_VARIABLES = {
+    "metar",
+    "metar_origin",
+    "metar_remark",
+    "weather_condition",
+    "weather_summary",
+    "wind_cardinal_direction",
+}
+STRING_UNITS = {"text"}
+CLOUD_LAYER = pl.Struct({"sky_condition": pl.String, "height_agl": pl.Float64})
+
+# Types of the STATION metadata as returned by the API (numbers are strings).
+STATION_METADATA_SCHEMA = {
+    "ID": pl.String,
+    "STID": pl.String,
+    "NAME": pl.String,
+    "ELEVATION": pl.String,
+    "LATITUDE": pl.String,
+    "LONGITUDE": pl.String,
+    "STATUS": pl.String,
+    "MNET_ID": pl.String,
+    "STATE": pl.String,
+    "COUNTRY": pl.String,
+    "COUNTY": pl.String,
+    "TIMEZONE": pl.String,
+    "ELEV_DEM": pl.String,
+    "NWSZONE": pl.String,
+    "NWSFIREZONE": pl.String,
+    "GACC": pl.String,
+    "CWA": pl.String,
+    "SHORTNAME": pl.String,
+    "SGID": pl.String,
+    "PERIOD_OF_RECORD": pl.Struct({"start": pl.String, "end": pl.String}),
+    "UNITS": pl.Struct({"position": pl.String, "elevation": pl.String}),
+    "RESTRICTED": pl.Boolean,
+    "QC_FLAGGED": pl.Boolean,
+}
+
+# Format of each 'date_time' in a response (the default 'timeformat').
+DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+_raw_variable = re.compile(r"(?P<variable>.+)_(?:value|set)_\d+d?")
+
+
+def parse_date_time(date_time: pl.Series) -> pl.Series:
+    """Parse 'date_time' strings as UTC datetimes.
+
+    Strings in the API's ``DATE_TIME_FORMAT`` are parsed without
+    inferring the format, which is much faster; other strings are parsed
+    with the format inferred.
+    """
+    try:
+        return date_time.str.to_datetime(DATE_TIME_FORMAT, time_zone="UTC")
+    except pl.exceptions.InvalidOperationError:
+        return date_time.str.to_datetime(time_zone="UTC")
+
 
 def unnest_period_of_record(
     df: pl.DataFrame | pl.LazyFrame,
@@ -78,6 +142,223 @@ def attach_units(df, units_dict):
     )
 
 
+def observation_dtype(variable: str, units: str | None = None) -> pl.DataType:
+    """Type of the values of an observed variable.
+
+    Parameters
+    ----------
+    variable : str
+        The variable name, e.g., 'air_temp'.
+    units : str, optional
+        The variable's units, from ``SynopticAPI().UNITS``.
+    """
+    if re.fullmatch(r"cloud_layer_\d+", variable):
+        return CLOUD_LAYER
+    if variable in STRING_VARIABLES or units in STRING_UNITS:
+        return pl.String
+    return pl.Float64
+
+
+def timeseries_schema(
+    observations: list[dict], units: dict, sensor_variables: list[dict]
+) -> dict[str, pl.DataType]:
+    """Get the schema of the 'timeseries' OBSERVATIONS of some stations.
+
+    Each column's type is chosen from its variable (see
+    ``observation_dtype``), so the DataFrame can be built without
+    inferring the types from every value. A number column whose first
+    value is text is read as text instead, so no values are lost.
+
+    Parameters
+    ----------
+    observations : list[dict]
+        The OBSERVATIONS of each station, with its 'stid'.
+    units : dict
+        A mapping of the variable names to unit, as provided by
+        `SynopticAPI().UNITS`.
+    sensor_variables : list[dict]
+        The SENSOR_VARIABLES of each station, which map each variable to
+        its columns.
+    """
+    variables = {
+        column: variable
+        for sensors in sensor_variables
+        for variable, columns in sensors.items()
+        if isinstance(columns, dict)
+        for column in columns
+    }
+
+    schema = {"stid": pl.String, "date_time": pl.List(pl.String)}
+    numbers = set()
+    for obs in observations:
+        for column in obs:
+            if column in schema:
+                continue
+            variable = variables.get(column)
+            if variable is None:
+                match = _raw_variable.fullmatch(column)
+                variable = match["variable"] if match else column
+            dtype = observation_dtype(variable, units.get(variable))
+            schema[column] = pl.List(dtype)
+            if dtype == pl.Float64:
+                numbers.add(column)
+
+    # Check the first value of each number column.
+    for obs in observations:
+        if not numbers:
+            break
+        for column in [c for c in numbers if obs.get(c)]:
+            value = next((v for v in obs[column] if v is not None), None)
+            if value is not None:
+                numbers.discard(column)
+                if isinstance(value, str):
+                    schema[column] = pl.List(pl.String)
+
+    return schema
+
+
+def records_to_dataframe(records: list[dict], schema: dict) -> pl.DataFrame:
+    """Build a DataFrame from dicts with a known schema, one column at a time.
+
+    Values are converted to the column's type (e.g., int to float), and
+    keys missing from a record are null.
+    """
+    return pl.DataFrame(
+        [
+            pl.Series(name, [r.get(name) for r in records], dtype=dtype, strict=False)
+            for name, dtype in schema.items()
+        ]
+    )
+
+
+class MixedTypeError(ValueError):
+    """Observation columns have both numbers and text."""
+
+    def __init__(self, columns: list[str]):
+        super().__init__(f"Columns have both numbers and text: {columns}")
+        self.columns = columns
+
+
+def _as_text(value):
+    """Convert an observed value to text (None stays None)."""
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def unpivot_observations(
+    observations: list[dict],
+    columns: list[str],
+    dtype: pl.DataType = pl.Float64,
+    value_name: str = "value",
+) -> pl.DataFrame:
+    """Unpack the 'timeseries' observations of some stations to long format.
+
+    This is the same as exploding each station's lists and unpivoting
+    the columns, but each value is copied once into a preallocated
+    array instead of through list columns. A column a station doesn't
+    have is null for each of the station's times.
+
+    Parameters
+    ----------
+    observations : list[dict]
+        The OBSERVATIONS of each station, with its 'stid'.
+    columns : list[str]
+        The columns to unpack; all have values of ``dtype``.
+    dtype : {pl.Float64, pl.String}
+        Type of the values. Text values are strings; other values are
+        written as JSON (e.g., ``3.0`` is ``"3.0"``).
+    value_name : str
+        Name of the value column.
+
+    Returns
+    -------
+    A DataFrame with the columns 'stid', 'date_time', 'variable', and
+    ``value_name``, ordered by variable, station, and time.
+
+    Raises
+    ------
+    MixedTypeError
+        If ``dtype`` is ``pl.Float64`` and some columns have values that
+        aren't numbers; unpack those columns as ``pl.String``.
+    """
+    lengths = np.array([len(o.get("date_time") or ()) for o in observations])
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    total = int(offsets[-1])
+
+    number = dtype == pl.Float64
+    if number:
+        values = np.full(total * len(columns), np.nan)
+    else:
+        values = [None] * (total * len(columns))
+
+    mixed = []
+    for i, column in enumerate(columns):
+        for obs, offset, n in zip(observations, offsets, lengths):
+            data = obs.get(column)
+            if data is None:
+                continue
+            if len(data) != n:
+                raise ValueError(
+                    f"{column!r} of station {obs['stid']} has {len(data)} values "
+                    f"for {n} times."
+                )
+            start = i * total + offset
+            if not number:
+                values[start : start + n] = [_as_text(v) for v in data]
+                continue
+            try:
+                values[start : start + n] = data
+            except (ValueError, TypeError):
+                mixed.append(column)
+                break
+
+    if mixed:
+        raise MixedTypeError(mixed)
+
+    if number:
+        value = pl.Series(value_name, values, nan_to_null=True)
+    else:
+        value = pl.Series(value_name, values, dtype=pl.String)
+
+    stations = pl.Series("stid", [o["stid"] for o in observations], dtype=pl.String)
+    stid = stations.gather(np.repeat(np.arange(len(observations)), lengths))
+    # Each station's times are parsed once, then repeated for each column.
+    date_time = parse_date_time(
+        pl.Series(
+            "date_time",
+            list(chain.from_iterable(o.get("date_time") or () for o in observations)),
+            dtype=pl.String,
+        )
+    )
+    variable = pl.Series("variable", columns, dtype=pl.String)
+
+    return pl.DataFrame(
+        [
+            pl.concat([stid] * len(columns)),
+            pl.concat([date_time] * len(columns)),
+            variable.gather(np.repeat(np.arange(len(columns)), total)),
+            value,
+        ]
+    )
+
+
+def iter_batches(
+    STATION: Iterable[dict], batch_size: int | None = None
+) -> Iterator[list[dict]]:
+    """Iterate over STATION items in lists of ``batch_size`` stations.
+
+    If ``batch_size`` is None, all stations are in one batch.
+    """
+    if batch_size is None:
+        yield list(STATION)
+        return
+
+    STATION = iter(STATION)
+    while batch := list(islice(STATION, batch_size)):
+        yield batch
+
+
 def station_metadata_to_dataframe(STATION: list[dict]):
     """From STATION, produce the metadata DataFrame."""
     a = []
@@ -88,7 +369,20 @@ def station_metadata_to_dataframe(STATION: list[dict]):
         metadata.pop("LATENCY", None)
         metadata.pop("QC", None)
         a.append(metadata)
-    df = pl.DataFrame(a, infer_schema_length=None).lazy()
+
+    keys = dict.fromkeys(key for metadata in a for key in metadata)
+    if keys.keys() <= STATION_METADATA_SCHEMA.keys():
+        df = records_to_dataframe(a, {k: STATION_METADATA_SCHEMA[k] for k in keys})
+    else:
+        # Only the types of fields not in the schema are inferred.
+        df = pl.DataFrame(
+            a,
+            schema_overrides={
+                k: v for k, v in STATION_METADATA_SCHEMA.items() if k in keys
+            },
+            infer_schema_length=None,
+        )
+    df = df.lazy()
     df = df.with_columns(
         pl.col("STID").cast(pl.String),
         pl.col("ID", "MNET_ID").cast(pl.UInt32),
@@ -111,22 +405,81 @@ def station_metadata_to_dataframe(STATION: list[dict]):
     return df.collect()
 
 
-def parse_stations_timeseries(S: "SynopticAPI") -> pl.DataFrame:
+def parse_stations_timeseries(
+    S: "SynopticAPI", batch_size: int | None = None
+) -> pl.DataFrame:
     """Parse all STATION items for 'timeseries' service into long-format DataFrame.
 
     Parameters
     ----------
     s : SynopticAPI instance
+    batch_size : int, optional
+        Parse the observations of this many stations at a time. The
+        STATION items are only iterated once, so ``S.STATION`` may be a
+        generator that streams the stations from the response.
     """
     # TODO: Need to implement parsing cloud_layer
     # TODO: Do I need to have a `qc_passed` column to be consistent with the Latest service?
 
+    to_concat = []
+    stations = []
+    unparsed = set()
+    for batch in iter_batches(S.STATION, batch_size):
+        # A streamed response may not have its UNITS until the end.
+        units = getattr(S, "UNITS", None) or {}
+        to_concat.append(_timeseries_observations(batch, units, unparsed))
+        stations.extend(batch)
+    _warn_unparsed(unparsed)
+
+    observed = pl.concat(to_concat, how="diagonal_relaxed")
+
+    # Parse the variable name
+    observed = observed.pipe(parse_raw_variable_column)
+
+    # Attach the variable's units
+    observed = observed.pipe(attach_units, S.UNITS)
+
+    # Join the metadata to the observed values
+    metadata = station_metadata_to_dataframe(stations)
+    observed = observed.join(metadata, on="stid", how="full", coalesce=True)
+
+    if "qc" in observed.columns:
+        observed = (
+            observed.unnest("qc")
+            .rename({"status": "qc_passed"})
+            .with_columns(
+                pl.col("qc_passed").replace_strict({"failed": False, "passed": True})
+            )
+        )
+
+    return observed
+
+
+def _warn_unparsed(columns: set[str]):
+    """Warn once about the columns that couldn't be parsed."""
+    if columns:
+        warnings.warn(
+            f"Parsing these columns is not implemented: {sorted(columns)}",
+            UserWarning,
+            stacklevel=3,
+        )
+
+
+def _timeseries_observations(
+    STATION: list[dict], units: dict, unparsed: set[str] | None = None
+) -> pl.DataFrame:
+    """Unpack the 'timeseries' observations of some stations to long format.
+
+    The OBSERVATIONS, QC, LATENCY, and SENSOR_VARIABLES are removed from
+    each station, leaving only the station metadata. Columns that can't
+    be parsed are added to ``unparsed``.
+    """
     observations = []
     qc = []
     latency = []
     sensor_variables = []
 
-    for s in S.STATION:
+    for s in STATION:
         observations.append({"stid": s["STID"]} | s.pop("OBSERVATIONS", {}))
         if "QC" in s:
             qc.append(
@@ -136,83 +489,65 @@ def parse_stations_timeseries(S: "SynopticAPI") -> pl.DataFrame:
         latency.append({"stid": s["STID"]} | s.pop("LATENCY", {}))
         sensor_variables.append({"stid": s["STID"]} | s.pop("SENSOR_VARIABLES", {}))
 
-    df = pl.DataFrame(observations, infer_schema_length=None)
+    schema = timeseries_schema(observations, units, sensor_variables)
 
     cols_with_float = []
     cols_with_string = []
     cols_with_cloud_layer = []
-    cols_with_other = []
 
-    for col, schema in df.schema.items():
+    for col, dtype in schema.items():
         if col in {"date_time", "stid"}:
             continue
-        elif schema == pl.List(pl.Float64):
+        elif dtype == pl.List(pl.Float64):
             cols_with_float.append(col)
-        elif schema == pl.List(pl.String):
+        elif dtype == pl.List(pl.String):
             cols_with_string.append(col)
-        elif col.startswith("cloud_layer"):
-            print(f"WARNING: {col} not implemented.")
-            cols_with_cloud_layer.append(col)
         else:
-            cols_with_other.append(col)
-            print(f"WARNING: Unknown schema for {col=} {schema=}")
+            cols_with_cloud_layer.append(col)
+            if unparsed is not None:
+                unparsed.add(col)
 
     to_concat = []
 
     # Unpack the float observations
+    #   Columns with both numbers and text are unpacked as strings.
     if cols_with_float:
-        observed_float = (
-            df.select(["stid", "date_time"] + cols_with_float)
-            .with_columns(
-                pl.col(cols_with_float).fill_null(
-                    pl.lit(None, dtype=pl.Float64).repeat_by(
-                        pl.col("date_time").list.len()
-                    )  # https://stackoverflow.com/q/78810432/2383070
-                )
-            )
-            .explode(["date_time"] + cols_with_float)
-            .unpivot(cols_with_float, index=["stid", "date_time"])
-        )
-        to_concat.append(observed_float)
+        try:
+            to_concat.append(unpivot_observations(observations, cols_with_float))
+        except MixedTypeError as e:
+            cols_with_string += e.columns
+            cols_with_float = [c for c in cols_with_float if c not in e.columns]
+            if cols_with_float:
+                to_concat.append(unpivot_observations(observations, cols_with_float))
 
     # Unpack the string observations
     #   Put values in column 'value_string'
     if cols_with_string:
-        observed_string = (
-            df.select(["stid", "date_time"] + cols_with_string)
-            .with_columns(
-                pl.col(cols_with_string).fill_null(
-                    pl.lit(None, dtype=pl.String).repeat_by(
-                        pl.col("date_time").list.len()
-                    )  # https://stackoverflow.com/q/78810432/2383070
-                )
+        to_concat.append(
+            unpivot_observations(
+                observations, cols_with_string, pl.String, value_name="value_sting"
             )
-            .explode(["date_time"] + cols_with_string)
-            .unpivot(cols_with_string, index=["stid", "date_time"])
-            .rename({"value": "value_sting"})
         )
-        to_concat.append(observed_string)
 
     # Unpack the cloud layer.
     #   Put sky_condition in 'value_sting' column
     #   and height_agl in 'value' column
-    # TODO if cols_with_cloud_layer:
-    # TODO     observed_cloud_layer = (
-    # TODO         df.select(["stid", "date_time"] + cols_with_cloud_layer)
-    # TODO         .with_columns(
-    # TODO             pl.col(cols_with_cloud_layer).fill_null(
-    # TODO                 pl.lit(None).repeat_by(
-    # TODO                     pl.col("date_time").list.len()
-    # TODO                 )  # https://stackoverflow.com/q/78810432/2383070
-    # TODO             )
-    # TODO         )
-    # TODO         .explode(["date_time"] + cols_with_cloud_layer)
-    # TODO         .unpivot(cols_with_cloud_layer, index=["stid", "date_time"])
-    # TODO         .rename({"value": "value_sting"})
-    # TODO     )
-    # TODO     to_concat.append(observed_cloud_layer)
+    # TODO: cols_with_cloud_layer
 
     # Join all observation values
+    #   None of the stations may have observations (e.g., a batch of
+    #   a streamed response with `showemptystations=1`).
+    if not to_concat:
+        to_concat.append(
+            pl.DataFrame(
+                schema={
+                    "stid": pl.String,
+                    "date_time": pl.Datetime("us", "UTC"),
+                    "variable": pl.String,
+                    "value": pl.Float64,
+                }
+            )
+        )
     observed = pl.concat(to_concat, how="diagonal_relaxed")
 
     # Attach QC flags if available.
@@ -224,6 +559,7 @@ def parse_stations_timeseries(S: "SynopticAPI") -> pl.DataFrame:
             .explode("date_time", "qc_flags")
             # TODO: Do I need to have a `qc_passed` column to be consistent with the Latest service?
         )
+        qc_flags = qc_flags.with_columns(parse_date_time(qc_flags["date_time"]))
         observed = observed.join(
             qc_flags,
             on=["stid", "date_time", "variable"],
@@ -231,19 +567,37 @@ def parse_stations_timeseries(S: "SynopticAPI") -> pl.DataFrame:
             coalesce=True,
         )
 
-    # Cast 'date_time' column from string to datetime
-    observed = observed.with_columns(
-        pl.col("date_time").str.to_datetime(time_zone="UTC")
-    )
+    return observed
+
+
+def parse_stations_latest_nearesttime(
+    S: "SynopticAPI", batch_size: int | None = None
+) -> pl.DataFrame:
+    """Parse STATIONS items for 'latest' and 'nearesttime' service.
+
+    Parameters
+    ----------
+    S : SynopticAPI instance
+    batch_size : int, optional
+        Parse the observations of this many stations at a time.
+    """
+    to_concat = []
+    stations = []
+    unparsed = set()
+    for batch in iter_batches(S.STATION, batch_size):
+        to_concat.append(_latest_nearesttime_observations(batch, unparsed))
+        stations.extend(batch)
+    _warn_unparsed(unparsed)
+
+    # Join all observation values
+    observed = pl.concat(to_concat, how="diagonal_relaxed")
 
     # Parse the variable name
     observed = observed.pipe(parse_raw_variable_column)
-
-    # Attach the variable's units
     observed = observed.pipe(attach_units, S.UNITS)
 
     # Join the metadata to the observed values
-    metadata = station_metadata_to_dataframe(S.STATION)
+    metadata = station_metadata_to_dataframe(stations)
     observed = observed.join(metadata, on="stid", how="full", coalesce=True)
 
     if "qc" in observed.columns:
@@ -258,12 +612,12 @@ def parse_stations_timeseries(S: "SynopticAPI") -> pl.DataFrame:
     return observed
 
 
-def parse_stations_latest_nearesttime(S: "SynopticAPI") -> pl.DataFrame:
-    """Parse STATIONS items for 'latest' and 'nearesttime' service.
+def _latest_nearesttime_observations(
+    STATION: list[dict], unparsed: set[str] | None = None
+) -> pl.DataFrame:
+    """Unpack the 'latest' or 'nearesttime' observations of some stations.
 
-    Parameters
-    ----------
-    S : SynopticAPI instance
+    Columns that can't be parsed are added to ``unparsed``.
     """
     # Unpack Latest/Nearest time JSON into parts
     observations = []
@@ -271,7 +625,7 @@ def parse_stations_latest_nearesttime(S: "SynopticAPI") -> pl.DataFrame:
     latency = []
     sensor_variables = []
 
-    for s in S.STATION:
+    for s in STATION:
         observations.append({"stid": s["STID"]} | s.pop("OBSERVATIONS", {}))
         # TODO: DO I need to handle QC like I do in timeseries?
         qc.append({"stid": s["STID"]} | s.pop("QC", {}))
@@ -315,7 +669,8 @@ def parse_stations_latest_nearesttime(S: "SynopticAPI") -> pl.DataFrame:
                 cols_with_cloud_layer.append(col)
             elif pl.Field("value", pl.Struct) in schema.fields:
                 cols_with_other.append(col)
-                print(f"WARNING: Unknown struct for {col=} {schema=}")
+                if unparsed is not None:
+                    unparsed.add(col)
         else:
             pass
 
@@ -362,86 +717,143 @@ def parse_stations_latest_nearesttime(S: "SynopticAPI") -> pl.DataFrame:
         )
         to_concat.append(observed_cloud_layer)
 
-    # Join all observation values
     observed = pl.concat(to_concat, how="diagonal_relaxed")
 
-    # Cast 'date_time' column from string to datetime
-    observed = observed.with_columns(
-        pl.col("date_time").str.to_datetime(time_zone="UTC")
-    )
-
-    # Parse the variable name
-    observed = observed.pipe(parse_raw_variable_column)
-    observed = observed.pipe(attach_units, S.UNITS)
-
-    # Join the metadata to the observed values
-    metadata = station_metadata_to_dataframe(S.STATION)
-    observed = observed.join(metadata, on="stid", how="full", coalesce=True)
-
-    if "qc" in observed.columns:
-        observed = (
-            observed.unnest("qc")
-            .rename({"status": "qc_passed"})
-            .with_columns(
-                pl.col("qc_passed").replace_strict({"failed": False, "passed": True})
-            )
-        )
-
-    return observed
+    # Parse the 'date_time' of this batch (it's a field of each variable's
+    # struct, so there is one per row).
+    return observed.with_columns(parse_date_time(observed["date_time"]))
 
 
-def parse_stations_precipitation(S: "SynopticAPI") -> pl.DataFrame:
+def parse_stations_precipitation(
+    S: "SynopticAPI", batch_size: int | None = None
+) -> pl.DataFrame:
     """Parse STATIONS portion of JSON object of SynopticAPI instance for 'precipitation' service.
 
     Parameters
     ----------
     s : SynopticAPI instance
+    batch_size : int, optional
+        Parse the observations of this many stations at a time.
     """
-    observations = []
-    qc = []
-    latency = []
-    sensor_variables = []
-
-    for s in S.STATION:
-        observations.append({"stid": s["STID"]} | s.pop("OBSERVATIONS", {}))
-        qc.append({"stid": s["STID"]} | s.pop("QC", {}))
-        latency.append({"stid": s["STID"]} | s.pop("LATENCY", {}))
-        sensor_variables.append({"stid": s["STID"]} | s.pop("SENSOR_VARIABLES", {}))
-
-    df = (
-        pl.DataFrame(observations, infer_schema_length=None)
-        .explode("precipitation")
-        .unnest("precipitation")
-        .with_columns(
-            pl.col("first_report", "last_report").str.to_datetime(time_zone="UTC"),
-            pl.lit(S.UNITS["precipitation"]).alias("units"),
+    to_concat = []
+    stations = []
+    for batch in iter_batches(S.STATION, batch_size):
+        observations = []
+        for s in batch:
+            observations.append({"stid": s["STID"]} | s.pop("OBSERVATIONS", {}))
+            s.pop("QC", None)
+            s.pop("LATENCY", None)
+            s.pop("SENSOR_VARIABLES", None)
+
+        to_concat.append(
+            pl.DataFrame(observations, infer_schema_length=None)
+            .explode("precipitation")
+            .unnest("precipitation")
         )
+        stations.extend(batch)
+
+    df = pl.concat(to_concat, how="diagonal_relaxed").with_columns(
+        pl.col("first_report", "last_report").str.to_datetime(time_zone="UTC"),
+        pl.lit(S.UNITS["precipitation"]).alias("units"),
     )
 
     # Join the metadata to the observed values
-    metadata = station_metadata_to_dataframe(S.STATION)
+    metadata = station_metadata_to_dataframe(stations)
     df = df.join(metadata, on="stid", how="full", coalesce=True)
 
     return df
 
 
-def parse_stations_latency(S: "SynopticAPI") -> pl.DataFrame:
-    """Parse STATION portion of JSON object for the 'latency' service."""
-    observations = []
-    qc = []
-    latency = []
-    sensor_variables = []
+def parse_stations_latency(
+    S: "SynopticAPI", batch_size: int | None = None
+) -> pl.DataFrame:
+    """Parse STATION portion of JSON object for the 'latency' service.
 
-    for s in S.STATION:
-        observations.append({"stid": s["STID"]} | s.pop("OBSERVATIONS", {}))
-        qc.append({"stid": s["STID"]} | s.pop("QC", {}))
-        latency.append({"stid": s["STID"]} | s.pop("LATENCY", {}))
-        sensor_variables.append({"stid": s["STID"]} | s.pop("SENSOR_VARIABLES", {}))
+    Parameters
+    ----------
+    S : SynopticAPI instance
+    batch_size : int, optional
+        Parse the latency of this many stations at a time.
+    """
+    to_concat = []
+    stations = []
+    for batch in iter_batches(S.STATION, batch_size):
+        latency = []
+        for s in batch:
+            latency.append({"stid": s["STID"]} | s.pop("LATENCY", {}))
+            s.pop("OBSERVATIONS", None)
+            s.pop("QC", None)
+            s.pop("SENSOR_VARIABLES", None)
 
-    df = pl.DataFrame(latency).explode("date_time", "values")
+        to_concat.append(pl.DataFrame(latency).explode("date_time", "values"))
+        stations.extend(batch)
+
+    df = pl.concat(to_concat, how="diagonal_relaxed")
 
     # Join the metadata to the observed values
-    metadata = station_metadata_to_dataframe(S.STATION)
+    metadata = station_metadata_to_dataframe(stations)
     df = df.join(metadata, on="stid", how="full", coalesce=True)
 
     return df
+
+
+def parse_stations_metadata(
+    S: "SynopticAPI", batch_size: int | None = None
+) -> pl.DataFrame:
+    """Parse STATION portion of JSON object for the 'metadata' service.
+
+    Parameters
+    ----------
+    S : SynopticAPI instance
+    batch_size : int, optional
+        Parse the metadata of this many stations at a time.
+    """
+    df = pl.concat(
+        [
+            pl.DataFrame(
+                batch,
+                schema_overrides={
+                    "STID": pl.String,
+                    "STATUS": pl.String,
+                    "ID": pl.UInt32,
+                    "MNET_ID": pl.UInt32,
+                    "WIMS_ID": pl.UInt32,
+                },
+                infer_schema_length=None,
+                # TODO: Setting to None is slow, but necessary to parse the "providers" column
+                # TODO: How do you set the schema_overrides for 'providers' to List(Struct({'name': pl.String, 'url': pl.String}))
+            )
+            for batch in iter_batches(S.STATION, batch_size)
+        ],
+        how="diagonal_relaxed",
+    )
+
+    df = (
+        df.with_columns(
+            pl.struct(
+                pl.col("PERIOD_OF_RECORD")
+                .struct.field("start")
+                .cast(pl.String)
+                .str.to_datetime(time_zone="UTC")
+                .alias("PERIOD_OF_RECORD_START"),
+                pl.col("PERIOD_OF_RECORD")
+                .struct.field("end")
+                .cast(pl.String)
+                .str.to_datetime(time_zone="UTC")
+                .alias("PERIOD_OF_RECORD_END"),
+            ).alias("PERIOD_OF_RECORD"),
+            pl.col("ELEVATION", "LATITUDE", "LONGITUDE", "ELEV_DEM")
+            .cast(pl.String)
+            .str.strip_chars()
+            .cast(pl.Float64),
+            is_active=pl.when(pl.col("STATUS") == "ACTIVE")
+            .then(True)
+            .otherwise(pl.when(pl.col("STATUS") == "INACTIVE").then(False)),
+        )
+        .unnest("PERIOD_OF_RECORD")
+        .drop("UNITS", "STATUS")
+        .rename({"RESTRICTED": "is_restricted"})
+    )
+
+    df = df.rename({i: i.lower() for i in df.columns})
+    return df
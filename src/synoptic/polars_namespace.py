@@ -1,3 +1,9 @@
+"""
+🐻‍❄️ The ``df.synoptic`` namespace for SynopticPy DataFrames.
+
+Importing this module registers the namespace with Polars.
+"""
+
 import warnings
 from pathlib import Path
 from typing import Literal
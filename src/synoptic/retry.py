@@ -0,0 +1,197 @@
+"""
+🔁 Retry failed requests and limit the request rate.
+
+A request that fails with a connection error or a status code in
+``RetryPolicy.status_forcelist`` (e.g., 429 Too Many Requests or 503
+Service Unavailable) is retried after a jittered exponential backoff.
+If the response has a ``Retry-After`` header, that wait is used instead.
+
+Every request (threaded or async) first takes a token from one shared
+token bucket, so a large fan-out of requests stays under your account's
+request budget without needing manual sleeps. The rate is unlimited
+unless configured.
+
+Examples
+--------
+>>> import synoptic
+>>> synoptic.configure_retry(total=5, backoff_factor=1)
+>>> synoptic.configure_rate_limit(rate=10, burst=20)  # 10 requests per second
+"""
+
+import asyncio
+import random
+import threading
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a request.
+
+    Parameters
+    ----------
+    total : int
+        Maximum number of retries. Zero disables retries.
+    backoff_factor : float
+        The wait before retry ``n`` (starting at 0) is a random number of
+        seconds between 0 and ``backoff_factor * 2**n``.
+    backoff_max : float
+        Maximum backoff, in seconds, not counting ``Retry-After``.
+    status_forcelist : tuple[int, ...]
+        HTTP status codes that are retried.
+    """
+
+    def __init__(
+        self,
+        total: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30,
+        status_forcelist: tuple[int, ...] = (429, 500, 502, 503, 504),
+    ):
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.status_forcelist = set(status_forcelist)
+
+    def __repr__(self):  # noqa: D105
+        return (
+            f"RetryPolicy(total={self.total}, backoff_factor={self.backoff_factor}, "
+            f"backoff_max={self.backoff_max}, status_forcelist={sorted(self.status_forcelist)})"
+        )
+
+    def is_retryable(self, status_code: int) -> bool:
+        """Whether a response with this status code should be retried."""
+        return status_code in self.status_forcelist
+
+    def backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        """Seconds to wait before the next attempt.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of the failed attempt, starting at 0.
+        retry_after : str, optional
+            The value of the response's ``Retry-After`` header, either
+            seconds or an HTTP date.
+        """
+        if retry_after is not None:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return seconds
+
+        # "Full jitter" backoff spreads out retries from concurrent requests.
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_factor * 2**attempt)
+        )
+
+
+def parse_retry_after(value: str) -> float | None:
+    """Parse a ``Retry-After`` header to seconds, or None if not understood."""
+    value = value.strip()
+    if value.isnumeric():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+class RateLimiter:
+    """A token bucket shared by every thread and async task.
+
+    Parameters
+    ----------
+    rate : float or None
+        Requests per second allowed on average. If None, there is no limit.
+    burst : int
+        Number of requests that may be made at once before the rate
+        limit applies. Defaults to one second of requests.
+    """
+
+    def __init__(self, rate: float | None = None, burst: int | None = None):
+        self._lock = threading.Lock()
+        self.set_rate(rate, burst)
+
+    def set_rate(self, rate: float | None, burst: int | None = None) -> None:
+        """Change the rate limit and refill the bucket."""
+        with self._lock:
+            self.rate = rate
+            self.burst = burst or max(1, int(rate or 1))
+            self._tokens = float(self.burst)
+            self._updated = time.monotonic()
+
+    def __repr__(self):  # noqa: D105
+        return f"RateLimiter(rate={self.rate}, burst={self.burst})"
+
+    def _reserve(self) -> float:
+        """Take one token and return seconds to wait until it is available.
+
+        The bucket may go negative; that reserves a token in the future
+        so that waiting callers are served in order.
+        """
+        if self.rate is None:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        """Block the thread until a request may be made."""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be made."""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
+RETRY = RetryPolicy()
+RATE_LIMITER = RateLimiter()
+
+
+def configure_retry(
+    *,
+    total: int | None = None,
+    backoff_factor: float | None = None,
+    backoff_max: float | None = None,
+    status_forcelist: tuple[int, ...] | None = None,
+) -> RetryPolicy:
+    """Configure how failed requests are retried.
+
+    Arguments not given keep their current value. See ``RetryPolicy``.
+    """
+    if total is not None:
+        RETRY.total = total
+    if backoff_factor is not None:
+        RETRY.backoff_factor = backoff_factor
+    if backoff_max is not None:
+        RETRY.backoff_max = backoff_max
+    if status_forcelist is not None:
+        RETRY.status_forcelist = set(status_forcelist)
+    return RETRY
+
+
+def configure_rate_limit(rate: float | None, burst: int | None = None) -> RateLimiter:
+    """Limit the rate of requests made by this process.
+
+    Parameters
+    ----------
+    rate : float or None
+        Requests per second allowed on average. If None, there is no limit.
+    burst : int
+        Number of requests that may be made at once before the rate
+        limit applies. Defaults to one second of requests.
+    """
+    RATE_LIMITER.set_rate(rate, burst)
+    return RATE_LIMITER
@@ -0,0 +1,318 @@
+"""
+🔭 Scan Synoptic time series data as a Polars LazyFrame.
+
+``scan_timeseries`` returns a LazyFrame that does not request any data
+until it is collected. When it is collected, filters in the query on
+``stid``, ``date_time``, ``variable``, ``latitude``, and ``longitude``
+are turned into the API parameters ``stid``, ``start``/``end``, ``vars``,
+and ``bbox``, so only the data needed is requested. The filters are
+still applied to the returned data, so the result is the same as if
+everything was requested and then filtered.
+
+Examples
+--------
+>>> import polars as pl
+>>> import synoptic
+>>> from datetime import datetime, timezone
+>>> df = (
+...     synoptic.scan_timeseries(state="UT", recent="7d")
+...     .filter(
+...         pl.col("variable") == "air_temp",
+...         pl.col("date_time") >= datetime(2024, 1, 1, tzinfo=timezone.utc),
+...         pl.col("latitude").is_between(40, 41),
+...     )
+...     .select("stid", "date_time", "value")
+...     .collect()
+... )
+"""
+
+import io
+import json
+import math
+from datetime import UTC, datetime, timedelta
+
+import polars as pl
+from polars.io.plugins import register_io_source
+
+from synoptic.services import SynopticAPIError, TimeSeries
+
+# Columns of a TimeSeries DataFrame. Columns a response doesn't have
+# (e.g., ``qc_flags`` without ``qc_flags="on"``) are null.
+TIMESERIES_SCHEMA = {
+    "stid": pl.String,
+    "date_time": pl.Datetime("us", "UTC"),
+    "variable": pl.String,
+    "sensor_index": pl.UInt32,
+    "is_derived": pl.Boolean,
+    "value": pl.Float64,
+    "value_sting": pl.String,
+    "units": pl.String,
+    "id": pl.UInt32,
+    "name": pl.String,
+    "elevation": pl.Float64,
+    "latitude": pl.Float64,
+    "longitude": pl.Float64,
+    "mnet_id": pl.UInt32,
+    "state": pl.String,
+    "timezone": pl.String,
+    "elev_dem": pl.Float64,
+    "period_of_record_start": pl.Datetime("us", "UTC"),
+    "period_of_record_end": pl.Datetime("us", "UTC"),
+    "is_restricted": pl.Boolean,
+    "restricted_metadata": pl.Boolean,
+    "qc_flagged": pl.Boolean,
+    "qc_flags": pl.List(pl.String),
+    "qc_passed": pl.Boolean,
+    "is_active": pl.Boolean,
+}
+
+_comparisons = {"Eq", "Lt", "LtEq", "Gt", "GtEq"}
+_flipped = {"Eq": "Eq", "Lt": "Gt", "LtEq": "GtEq", "Gt": "Lt", "GtEq": "LtEq"}
+
+
+def _literal(node: dict):
+    """Evaluate a serialized literal expression."""
+    expr = pl.Expr.deserialize(io.StringIO(json.dumps(node)), format="json")
+    return pl.select(expr).to_series()
+
+
+def _conjuncts(node: dict) -> list[dict]:
+    """Split a serialized expression on ``&``."""
+    binary = node.get("BinaryExpr")
+    if binary and binary["op"] in ("And", "LogicalAnd"):
+        return _conjuncts(binary["left"]) + _conjuncts(binary["right"])
+    return [node]
+
+
+def _comparisons_of(node: dict) -> list[tuple[str, str, object]]:
+    """``(column, op, value)`` of a comparison of a column to a literal.
+
+    Returns an empty list for an expression that isn't understood.
+    """
+    if binary := node.get("BinaryExpr"):
+        left, op, right = binary["left"], binary["op"], binary["right"]
+        if op not in _comparisons:
+            return []
+        if "Column" in right and "Literal" in left:
+            left, op, right = right, _flipped[op], left
+        if "Column" in left and "Literal" in right:
+            return [(left["Column"], op, _literal(right).item())]
+
+    elif function := node.get("Function"):
+        inputs = function["input"]
+        boolean = function["function"].get("Boolean", {})
+        if not inputs or "Column" not in inputs[0]:
+            return []
+        column = inputs[0]["Column"]
+        if not all("Literal" in i for i in inputs[1:]):
+            return []
+        if "IsIn" in boolean:
+            values = _literal(inputs[1])
+            if values.dtype == pl.List:
+                values = values.explode()
+            return [(column, "In", values.to_list())]
+        if "IsBetween" in boolean:
+            closed = boolean["IsBetween"].get("closed", "Both")
+            lower, upper = _literal(inputs[1]).item(), _literal(inputs[2]).item()
+            return [
+                (column, "GtEq" if closed in ("Both", "Left") else "Gt", lower),
+                (column, "LtEq" if closed in ("Both", "Right") else "Lt", upper),
+            ]
+
+    return []
+
+
+def predicate_constraints(predicate: pl.Expr) -> dict[str, dict]:
+    """Constraints on each column that every row must meet for the predicate.
+
+    Only comparisons of a column to a literal value that are joined by
+    ``&`` are used; anything else is ignored.
+
+    Returns
+    -------
+    A dict of column name to constraints: ``"in"`` (set of allowed
+    values), ``"lower"`` and ``"upper"`` (bounds).
+    """
+    try:
+        tree = json.loads(predicate.meta.serialize(format="json"))
+    except Exception:
+        return {}
+
+    constraints = {}
+    for node in _conjuncts(tree):
+        try:
+            comparisons = _comparisons_of(node)
+        except Exception:
+            continue
+        for column, op, value in comparisons:
+            if value is None:
+                continue
+            c = constraints.setdefault(column, {})
+            if op in ("Eq", "In"):
+                values = {value} if op == "Eq" else set(value)
+                c["in"] = c["in"] & values if "in" in c else values
+            elif op in ("Gt", "GtEq"):
+                c["lower"] = max(c.get("lower", value), value)
+            elif op in ("Lt", "LtEq"):
+                c["upper"] = min(c.get("upper", value), value)
+    return constraints
+
+
+def _utc(x: datetime) -> datetime:
+    """Convert to a naive datetime in UTC."""
+    if x.tzinfo is not None:
+        x = x.astimezone(UTC).replace(tzinfo=None)
+    return x
+
+
+def pushdown_params(params: dict, constraints: dict[str, dict]) -> dict | None:
+    """Narrow normalized TimeSeries parameters to the predicate constraints.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters as normalized by ``TimeSeries`` (``TimeSeries.params``).
+    constraints : dict
+        Output of ``predicate_constraints``.
+
+    Returns
+    -------
+    The new parameters, or None if no data can match.
+    """
+    params = dict(params)
+
+    # Station ID and variable lists.
+    for column, key, case in (("stid", "stid", str.upper), ("variable", "vars", str)):
+        values = constraints.get(column, {}).get("in")
+        if values is None:
+            continue
+        values = {case(str(i)) for i in values}
+        if key in params:
+            values &= {case(i) for i in str(params[key]).split(",")}
+        if not values:
+            return None
+        params[key] = ",".join(sorted(values))
+
+    # Time range.
+    times = constraints.get("date_time", {})
+    if "start" in params and "end" in params:
+        start = datetime.strptime(params["start"], "%Y%m%d%H%M")
+        end = datetime.strptime(params["end"], "%Y%m%d%H%M")
+    elif "recent" in params:
+        end = datetime.now(UTC).replace(tzinfo=None)
+        start = end - timedelta(minutes=int(params["recent"]))
+    else:
+        start = end = None
+
+    if isinstance(times.get("lower"), datetime):
+        lower = _utc(times["lower"])
+        start = lower if start is None else max(start, lower)
+        end = end or datetime.now(UTC).replace(tzinfo=None)
+    if isinstance(times.get("upper"), datetime):
+        upper = _utc(times["upper"])
+        end = upper if end is None else min(end, upper)
+
+    if start is None or end is None:
+        raise SynopticAPIError(
+            "`scan_timeseries` requires `start` and `end`, or `recent`, "
+            "or a filter on 'date_time' with lower and upper bounds."
+        )
+    if start > end:
+        return None
+    if times:
+        params.pop("recent", None)
+        # The API takes whole minutes; round outward to include the bounds.
+        end_minute = end.replace(second=0, microsecond=0)
+        if end_minute < end:
+            end_minute += timedelta(minutes=1)
+        params["start"] = f"{start:%Y%m%d%H%M}"
+        params["end"] = f"{end_minute:%Y%m%d%H%M}"
+
+    # Bounding box.
+    lat = constraints.get("latitude", {})
+    lon = constraints.get("longitude", {})
+    if lat or lon:
+        box = [-180.0, -90.0, 180.0, 90.0]
+        if "bbox" in params:
+            box = [float(i) for i in str(params["bbox"]).split(",")]
+        box = [
+            max(box[0], lon.get("lower", -math.inf)),
+            max(box[1], lat.get("lower", -math.inf)),
+            min(box[2], lon.get("upper", math.inf)),
+            min(box[3], lat.get("upper", math.inf)),
+        ]
+        if box[0] > box[2] or box[1] > box[3]:
+            return None
+        params["bbox"] = ",".join(f"{i:g}" for i in box)
+
+    return params
+
+
+def scan_timeseries(**params) -> pl.LazyFrame:
+    """Lazily scan time series data from the Synoptic API.
+
+    No request is made until the LazyFrame is collected. Filters on
+    ``stid``, ``date_time``, ``variable``, ``latitude``, and
+    ``longitude`` are pushed into the request parameters.
+
+    Parameters
+    ----------
+    **params :
+        Arguments for ``TimeSeries`` (e.g., ``state="UT"``,
+        ``recent="1d"``, ``chunk="7d"``, ``token=...``). A time range is
+        required, either here or as a filter on ``date_time``.
+
+    Returns
+    -------
+    A LazyFrame with the columns of ``TIMESERIES_SCHEMA``.
+    """
+    # Only check and normalize the parameters; no request is made.
+    base = TimeSeries(lazy=True, verbose=False, **params)
+    options = {
+        "chunk": base.chunk,
+        "session": base.session,
+        "max_workers": base.max_workers,
+        "batch_size": base.batch_size,
+        "stream": base.stream,
+        "timeout": base.timeout,
+        "deadline": base.deadline,
+        "memory_budget": base.memory_budget,
+        "over_budget": base.over_budget,
+        "spill_dir": base.spill_dir,
+    }
+
+    def source(
+        with_columns: list[str] | None,
+        predicate: pl.Expr | None,
+        n_rows: int | None,
+        batch_size: int | None,
+    ):
+        request = dict(base.params)
+        if predicate is not None:
+            request = pushdown_params(request, predicate_constraints(predicate))
+        else:
+            request = pushdown_params(request, {})
+
+        if request is None:
+            df = pl.DataFrame(schema=TIMESERIES_SCHEMA)
+        else:
+            df = TimeSeries(verbose=False, **options, **request).df()
+            # Match the schema: add missing columns and drop others.
+            df = df.select(
+                [
+                    pl.col(name).cast(dtype)
+                    if name in df.columns
+                    else pl.lit(None, dtype).alias(name)
+                    for name, dtype in TIMESERIES_SCHEMA.items()
+                ]
+            )
+
+        if predicate is not None:
+            df = df.filter(predicate)
+        if with_columns is not None:
+            df = df.select(with_columns)
+        if n_rows is not None:
+            df = df.head(n_rows)
+        yield df
+
+    return register_io_source(source, schema=TIMESERIES_SCHEMA)
@@ -0,0 +1,488 @@
+"""
+🧪 A local stand-in for the Synoptic Weather API.
+
+The server answers the same endpoints as the real API with synthetic
+JSON in the same form. The number of stations, the length of the time
+series, and the number of variables depend on the request and the
+server settings. Responses can be delayed, and a fraction of requests
+can fail, to load-test connection pooling, retries, chunked requests,
+and the parsers without network access or a token.
+
+Examples
+--------
+Use the server in a ``with`` block; requests go to it until the block ends.
+
+>>> import synoptic
+>>> from synoptic.server import serve
+>>> with serve(stations=10_000, variables=5, latency=0.1, error_rate=0.05):
+...     df = synoptic.TimeSeries(state="UT", recent="1d", token="fake").df()
+
+Or run it from the command line,
+
+.. code-block:: bash
+
+    python -m synoptic.server --port 8765 --stations 10000 --latency 0.1
+
+and point SynopticPy to it with the environment variable
+``SYNOPTIC_API_URL=http://127.0.0.1:8765/v2``.
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import random
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+import synoptic.session
+
+# (variable, units, value generator) for each synthetic variable.
+# Values are a smooth function of the station number and the time so
+# that responses are reproducible.
+VARIABLES = [
+    ("air_temp", "Celsius", lambda i, h: 10 + 10 * math.sin(h / 24 * math.tau) + i % 7),
+    ("relative_humidity", "%", lambda i, h: 50 + 30 * math.cos(h / 24 * math.tau)),
+    ("wind_speed", "m/s", lambda i, h: 5 + 3 * math.sin(h / 6 + i)),
+    ("wind_direction", "Degrees", lambda i, h: (i * 37 + h * 15) % 360),
+    ("pressure", "Pascals", lambda i, h: 85000 + 500 * math.sin(h / 48 * math.tau)),
+    ("dew_point_temperature", "Celsius", lambda i, h: 2 + 4 * math.sin(h / 3.8)),
+    ("wind_gust", "m/s", lambda i, h: 8 + 4 * math.sin(h / 6 + i)),
+    ("solar_radiation", "W/m**2", lambda i, h: max(0, 800 * math.sin(h / 3.8))),
+    ("precip_accum", "Millimeters", lambda i, h: (i + h) % 5 * 0.2),
+    ("snow_depth", "Millimeters", lambda i, h: 100 + i % 50),
+]
+
+
+SERVICES = {
+    "timeseries",
+    "latest",
+    "nearesttime",
+    "precipitation",
+    "latency",
+    "metadata",
+    "qctypes",
+    "variables",
+    "networks",
+    "networktypes",
+}
+
+
+class FakeSynopticAPI:
+    """Synthetic responses for each API service.
+
+    Parameters
+    ----------
+    stations : int
+        Number of stations returned when the request doesn't list
+        station IDs (``stid``).
+    variables : int
+        Number of variables each station reports, up to the number of
+        variables in ``VARIABLES``.
+    interval : int
+        Minutes between observations in a time series.
+    hours : float
+        Length of the time series when the request has no ``start``,
+        ``end``, or ``recent``.
+    latency : float
+        Seconds to wait before each response.
+    error_rate : float
+        Fraction of requests (0 to 1) answered with ``error_status``.
+    error_status : int
+        HTTP status code of injected errors.
+    seed : int
+        Seed of the random number generator for the injected errors.
+    missing : list[str], optional
+        Station IDs that aren't found (e.g., inactive stations).
+    """
+
+    def __init__(
+        self,
+        stations: int = 100,
+        variables: int = 5,
+        interval: int = 60,
+        hours: float = 24,
+        latency: float = 0,
+        error_rate: float = 0,
+        error_status: int = 503,
+        seed: int | None = None,
+        missing: list[str] | None = None,
+    ):
+        self.stations = stations
+        self.variables = VARIABLES[:variables]
+        self.interval = interval
+        self.hours = hours
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.missing = {i.upper() for i in missing or []}
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def respond(self, path: str, params: dict) -> tuple[int, dict]:
+        """Status code and JSON for a request."""
+        with self._lock:
+            self.requests += 1
+            fail = self.random.random() < self.error_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            return self.error_status, {}
+
+        service = path.rstrip("/").rsplit("/", 1)[-1]
+        if service not in SERVICES:
+            return 404, {}
+        return 200, getattr(self, f"_{service}")(params)
+
+    # ------------------------------------------------------------------
+    # Helpers
+
+    def _station_numbers(self, params: dict) -> list[tuple[int, str]]:
+        """Station number and STID of each requested station."""
+        if "stid" in params:
+            stids = [
+                i.upper()
+                for i in params["stid"].split(",")
+                if i and i.upper() not in self.missing
+            ]
+            return [(sum(map(ord, stid)), stid) for stid in stids]
+        n = min(self.stations, int(params.get("limit", self.stations)))
+        return [(i, f"S{i:05d}") for i in range(n)]
+
+    def _requested_variables(self, params: dict) -> list[tuple]:
+        if "vars" not in params:
+            return self.variables
+        names = set(params["vars"].split(","))
+        return [v for v in VARIABLES if v[0] in names]
+
+    def _times(self, params: dict) -> list[datetime]:
+        if "start" in params and "end" in params:
+            start = datetime.strptime(params["start"], "%Y%m%d%H%M")
+            end = datetime.strptime(params["end"], "%Y%m%d%H%M")
+        else:
+            end = datetime.now(UTC).replace(tzinfo=None, second=0)
+            minutes = float(params.get("recent", self.hours * 60))
+            start = end - timedelta(minutes=minutes)
+
+        # Observations are on multiples of the interval since 1970, so
+        # the times don't depend on how a period is split into requests.
+        step = timedelta(minutes=self.interval)
+        t = datetime(1970, 1, 1)
+        t += math.ceil((start - t) / step) * step
+        times = []
+        while t <= end:
+            times.append(t)
+            t += step
+        return times
+
+    @staticmethod
+    def _station_metadata(i: int, stid: str) -> dict:
+        return {
+            "ID": str(i + 1),
+            "STID": stid,
+            "NAME": f"Synthetic Station {stid}",
+            "ELEVATION": f"{1000 + i % 3000:.1f}",
+            "LATITUDE": f"{30 + (i * 0.0137) % 20:.5f}",
+            "LONGITUDE": f"{-120 + (i * 0.0291) % 40:.5f}",
+            "STATUS": "ACTIVE" if i % 10 else "INACTIVE",
+            "MNET_ID": str(1 + i % 300),
+            "STATE": "UT",
+            "TIMEZONE": "America/Denver",
+            "ELEV_DEM": f"{1000 + i % 3000 + 3.5:.1f}",
+            "PERIOD_OF_RECORD": {
+                "start": "2000-01-01T00:00:00Z",
+                "end": f"{datetime.now(UTC):%Y-%m-%dT%H:%M:%SZ}",
+            },
+            "UNITS": {"position": "ft", "elevation": "ft"},
+            "RESTRICTED": False,
+            "QC_FLAGGED": False,
+        }
+
+    def _stations(self, params: dict, observations) -> dict:
+        """Make a STATION response with ``observations(i, variables)`` per station."""
+        variables = self._requested_variables(params)
+        stations = []
+        for i, stid in self._station_numbers(params):
+            station = self._station_metadata(i, stid)
+            station |= observations(i, variables)
+            stations.append(station)
+
+        if not stations:
+            return self._summary(2, "No stations found for this request.", 0)
+        return {
+            "UNITS": {name: units for name, units, _ in variables},
+            "QC_SUMMARY": {"QC_CHECKS_APPLIED": ["sl_range_check"]},
+            "SUMMARY": self._summary(1, "OK", len(stations))["SUMMARY"],
+            "STATION": stations,
+        }
+
+    @staticmethod
+    def _summary(code: int, message: str, n: int) -> dict:
+        return {
+            "SUMMARY": {
+                "NUMBER_OF_OBJECTS": n,
+                "RESPONSE_CODE": code,
+                "RESPONSE_MESSAGE": message,
+                "RESPONSE_TIME": 0,
+            }
+        }
+
+    @staticmethod
+    def _sensor_variables(variables) -> dict:
+        return {
+            "SENSOR_VARIABLES": {
+                name: {f"{name}_set_1": {"position": ""}} for name, _, _ in variables
+            }
+        }
+
+    # ------------------------------------------------------------------
+    # Station services
+
+    def _timeseries(self, params: dict) -> dict:
+        times = self._times(params)
+        if not times:
+            return self._summary(2, "No data found for this request.", 0)
+        epoch = datetime(1970, 1, 1)
+        hours = [(t - epoch).total_seconds() / 3600 for t in times]
+        date_time = [f"{t:%Y-%m-%dT%H:%M:%SZ}" for t in times]
+
+        def observations(i, variables):
+            obs = {"date_time": date_time}
+            for name, _, value in variables:
+                obs[f"{name}_set_1"] = [round(value(i, h), 2) for h in hours]
+            return {"OBSERVATIONS": obs} | self._sensor_variables(variables)
+
+        return self._stations(params, observations)
+
+    def _latest(self, params: dict) -> dict:
+        times = self._times({"recent": self.interval} | params)
+        if "attime" in params:
+            times = [datetime.strptime(params["attime"], "%Y%m%d%H%M")]
+        t = times[-1] if times else datetime.now(UTC).replace(tzinfo=None)
+        h = (t - datetime(1970, 1, 1)).total_seconds() / 3600
+
+        def observations(i, variables):
+            obs = {
+                f"{name}_value_1": {
+                    "value": round(value(i, h), 2),
+                    "date_time": f"{t:%Y-%m-%dT%H:%M:%SZ}",
+                }
+                for name, _, value in variables
+            }
+            return {"OBSERVATIONS": obs} | self._sensor_variables(variables)
+
+        return self._stations(params, observations)
+
+    _nearesttime = _latest
+
+    def _precipitation(self, params: dict) -> dict:
+        times = self._times(params)
+        first = f"{times[0]:%Y-%m-%dT%H:%M:%SZ}" if times else None
+        last = f"{times[-1]:%Y-%m-%dT%H:%M:%SZ}" if times else None
+
+        def observations(i, variables):
+            return {
+                "OBSERVATIONS": {
+                    "precipitation": [
+                        {
+                            "interval": 1,
+                            "report_type": "precip_accum",
+                            "first_report": first,
+                            "last_report": last,
+                            "count": len(times),
+                            "total": round(0.2 * (i % 10), 2),
+                        }
+                    ]
+                }
+            }
+
+        response = self._stations(params, observations)
+        if "UNITS" in response:
+            response["UNITS"] = {"precipitation": "Millimeters"}
+        return response
+
+    def _latency(self, params: dict) -> dict:
+        times = self._times(params)
+        date_time = [f"{t:%Y-%m-%dT%H:%M:%SZ}" for t in times]
+
+        def observations(i, variables):
+            return {
+                "LATENCY": {
+                    "date_time": date_time,
+                    "values": [(i + j) % 30 + 1 for j in range(len(times))],
+                }
+            }
+
+        return self._stations(params, observations)
+
+    def _metadata(self, params: dict) -> dict:
+        if {params.get("complete"), params.get("sensorvars")} & {"1", "true", "on"}:
+            return self._stations(
+                params, lambda i, variables: self._sensor_variables(variables)
+            )
+        return self._stations(params, lambda i, variables: {})
+
+    # ------------------------------------------------------------------
+    # Metadata services
+
+    def _variables(self, params: dict) -> dict:
+        return self._summary(1, "OK", len(VARIABLES)) | {
+            "VARIABLES": [
+                {
+                    name: {
+                        "vid": str(i + 1),
+                        "long_name": name.replace("_", " ").title(),
+                        "unit": units,
+                    }
+                }
+                for i, (name, units, _) in enumerate(VARIABLES)
+            ]
+        }
+
+    def _qctypes(self, params: dict) -> dict:
+        return self._summary(1, "OK", 1) | {
+            "QCTYPES": [
+                {
+                    "ID": "1",
+                    "SOURCE_ID": "1",
+                    "NAME": "Range Check",
+                    "SHORTNAME": "sl_range_check",
+                }
+            ]
+        }
+
+    def _networks(self, params: dict) -> dict:
+        period = {"start": "2000-01-01T00:00:00Z", "end": "2024-01-01T00:00:00Z"}
+        return self._summary(1, "OK", 3) | {
+            "MNET": [
+                {
+                    "ID": str(i),
+                    "SHORTNAME": f"NET{i}",
+                    "LONGNAME": f"Synthetic Network {i}",
+                    "CATEGORY": "1",
+                    "LAST_OBSERVATION": "2024-01-01T00:00:00Z",
+                    "PERIOD_OF_RECORD": period,
+                }
+                for i in range(1, 4)
+            ]
+        }
+
+    def _networktypes(self, params: dict) -> dict:
+        return self._summary(1, "OK", 1) | {
+            "MNETCAT": [
+                {
+                    "ID": "1",
+                    "NAME": "Synthetic",
+                    "PERIOD_OF_RECORD": {
+                        "start": "2000-01-01T00:00:00Z",
+                        "end": "2024-01-01T00:00:00Z",
+                    },
+                }
+            ]
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    api: FakeSynopticAPI
+
+    def do_GET(self):  # noqa: N802
+        url = urlparse(self.path)
+        params = dict(parse_qsl(url.query))
+        status, payload = self.api.respond(url.path, params)
+
+        if status == 200:
+            body = json.dumps(payload).encode()
+            content_type = "application/json"
+        else:
+            body = f"<html>Error {status}</html>".encode()
+            content_type = "text/html"
+
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            if status in (429, 503):
+                self.send_header("Retry-After", "0")
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up (e.g., a timeout) before the response.
+            pass
+
+    def log_message(self, format, *args):  # noqa: D102
+        pass
+
+
+def make_server(
+    host: str = "127.0.0.1", port: int = 0, **settings
+) -> ThreadingHTTPServer:
+    """Create (but don't start) a fake API server.
+
+    Parameters
+    ----------
+    host, port :
+        Address to listen on. Port 0 picks a free port.
+    **settings :
+        Settings for ``FakeSynopticAPI``.
+    """
+    handler = type("Handler", (_Handler,), {"api": FakeSynopticAPI(**settings)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.api = handler.api
+    server.url = f"http://{host}:{server.server_address[1]}/v2"
+    return server
+
+
+@contextlib.contextmanager
+def serve(host: str = "127.0.0.1", port: int = 0, **settings):
+    """Run a fake API server and send all requests to it in a ``with`` block.
+
+    Yields the server; ``server.api`` is the ``FakeSynopticAPI`` and
+    ``server.url`` is the root URL of the API.
+    """
+    server = make_server(host, port, **settings)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    old_url = synoptic.session.API_URL
+    synoptic.session.API_URL = server.url
+    try:
+        yield server
+    finally:
+        synoptic.session.API_URL = old_url
+        server.shutdown()
+        server.server_close()
+
+
+def main(argv: list[str] | None = None):
+    """Run a fake API server from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--stations", type=int, default=100)
+    parser.add_argument("--variables", type=int, default=5)
+    parser.add_argument("--interval", type=int, default=60, help="minutes")
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument("--latency", type=float, default=0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int, default=None)
+    args = vars(parser.parse_args(argv))
+
+    server = make_server(args.pop("host"), args.pop("port"), **args)
+    print(f"Fake Synoptic API at {server.url}")
+    print(f"  export SYNOPTIC_API_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,44 @@
 """Get Synoptic Weather API data as a Polars DataFrame."""
 
-import os
+import contextlib
+import copy
+import itertools
 import re
-import warnings
-from datetime import datetime, timedelta
+import shutil
+import tempfile
+import threading
+import weakref
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
 import polars as pl
 import requests
-import toml
 
 import synoptic.polars_namespace  # noqa: E402, F401
+from synoptic import decode
+from synoptic.budget import estimate_size, format_size, parse_size, plan_budget
+from synoptic.cache import CACHE
+from synoptic.chunking import CHUNK_CONFIG, ChunkPlanner
+from synoptic.deadline import Deadline, DeadlineExceeded, RequestCancelled
 from synoptic.json_parsers import (
     parse_stations_latency,
     parse_stations_latest_nearesttime,
+    parse_stations_metadata,
     parse_stations_precipitation,
     parse_stations_timeseries,
 )
-from synoptic.token import ANSI, Token, configure
-from synoptic.params import validate_params
+from synoptic.token import ANSI, Token
+from synoptic.params import station_selectors, validate_params
+from synoptic.session import api_url, http_get
+from synoptic.singleflight import IN_FLIGHT
 
-# Initialize Token to get any environment or configured value
+# Initialize Token to get any environment or configured value. It is
+# checked when it is first used in a request, not on import.
 TOKEN = Token()
-if TOKEN.token:
-    TOKEN.is_valid()
 
 # Available API Services
 # https://docs.synopticdata.com/services/weather-data-api
@@ -47,6 +60,9 @@ _services_metadata = {
 }
 _services = _services_stations | _services_metadata
 
+# Station selectors that may be split into batches when given a long list.
+_batched_selectors = ("stid", "network", "county")
+
 ServiceType = Literal[
     "timeseries",
     "latest",
@@ -149,6 +165,115 @@ def parse_obrange(x: str | datetime | tuple[datetime, datetime]):
         )
 
 
+def response_json(response) -> dict:
+    """Decode the JSON of an API response with the fastest available decoder.
+
+    Raises a SynopticAPIError, instead of a JSON decode error, when the
+    response is not JSON (e.g., an HTML error page from a proxy).
+    """
+    try:
+        return decode.loads(response.content)
+    except ValueError:
+        raise SynopticAPIError(
+            "\n"
+            f"🛑 FATAL: Synoptic API response is not JSON.\n"
+            f"  ├─ status: {response.status_code}\n"
+            f"  ├─ content: {response.text[:200]!r}\n"
+            f"  └─ url: {response.url}"
+        ) from None
+
+
+def _write_through(chunks: Iterator[bytes], file) -> Iterator[bytes]:
+    """Yield each chunk after writing it to a file."""
+    for chunk in chunks:
+        file.write(chunk)
+        yield chunk
+
+
+def split_time_range(
+    start: datetime, end: datetime, chunk: timedelta
+) -> list[tuple[datetime, datetime]]:
+    """Split a time range into windows no longer than ``chunk``.
+
+    Adjacent windows share their boundary time, so observations at the
+    boundary are returned by both requests and must be de-duplicated.
+
+    Parameters
+    ----------
+    start, end : datetime
+        The time range to split.
+    chunk : timedelta
+        The length of each window. The last window may be shorter.
+    """
+    if chunk <= timedelta(0):
+        raise ValueError(f"Chunk must be a positive duration, not {chunk=}.")
+
+    windows = []
+    window_start = start
+    while True:
+        window_end = min(window_start + chunk, end)
+        windows.append((window_start, window_end))
+        if window_end >= end:
+            return windows
+        window_start = window_end
+
+
+def parse_chunk(chunk: timedelta | int | str | None) -> timedelta | str | None:
+    """Parse a ``chunk`` argument to a timedelta, ``"auto"``, or None."""
+    if chunk == "auto" or chunk is None or isinstance(chunk, timedelta):
+        return chunk
+    if isinstance(chunk, str) and not chunk.isnumeric():
+        return string_to_timedelta(chunk)
+    return timedelta(minutes=int(chunk))
+
+
+def _part_window(part: "SynopticAPI") -> tuple[datetime, datetime, int, float]:
+    """Return a part's time window, number of values, and seconds to get it."""
+    start = datetime.strptime(part.params["start"], "%Y%m%d%H%M")
+    end = datetime.strptime(part.params["end"], "%Y%m%d%H%M")
+    if part._parsed is not None:
+        # A streamed part is parsed as it is received.
+        values = part._parsed.height
+    else:
+        values = sum(
+            len(v)
+            for station in getattr(part, "STATION", [])
+            for k, v in (station.get("OBSERVATIONS") or {}).items()
+            if k != "date_time" and isinstance(v, list)
+        )
+    seconds = sum(
+        part.timers[k].total_seconds()
+        for k in ("api_request", "decode_json", "stream_and_parse")
+        if k in part.timers
+    )
+    return start, end, values, seconds
+
+
+def merge_json(jsons: list[dict]) -> dict:
+    """Merge the JSON returned by several station service requests.
+
+    The ``UNITS`` are combined and each station in ``STATION`` is kept
+    once (the first time it is seen).
+    """
+    units = {}
+    stations = {}
+    for j in jsons:
+        units |= j.get("UNITS", {})
+        for s in j.get("STATION", []):
+            stations.setdefault(s["STID"], s)
+
+    return {
+        "SUMMARY": {
+            "RESPONSE_CODE": 1,
+            "RESPONSE_MESSAGE": "OK",
+            "NUMBER_OF_OBJECTS": len(stations),
+            "NUMBER_OF_REQUESTS": len(jsons),
+        },
+        "UNITS": units,
+        "STATION": list(stations.values()),
+    }
+
+
 class SynopticAPI:
     """
     Request data from Synoptic's Weather API.
@@ -167,6 +292,36 @@ class SynopticAPI:
 
         1. Environment variable ``SYNOPTIC_TOKEN``,
         2. The ``token="..."`` value in ``~/.config/SynopticPy/config.toml``.
+    session : requests.Session, optional
+        The HTTP session used to make the request. If None, uses the
+        shared connection-pooled session (see ``synoptic.configure_session``).
+    max_workers : int
+        Maximum number of concurrent requests when a request is split
+        into several parts (e.g., ``TimeSeries(chunk=...)``).
+    batch_size : int
+        Maximum number of values in a ``stid``, ``network``, or ``county``
+        list for a single request. Longer lists are split into batches
+        that are requested concurrently and merged into one DataFrame.
+    stream : bool or int
+        If True, decode and parse the stations while the response is
+        downloaded, 100 stations at a time, instead of decoding the whole
+        response first. An int sets the number of stations per batch.
+        This limits memory for very large requests. Only for services
+        that return stations (e.g., TimeSeries).
+    lazy : bool
+        If True, don't make the request until ``execute()`` is called or
+        the data is first used (e.g., ``.df()`` or ``.json``). The
+        parameters are still checked and ``url`` is set right away.
+    timeout : float or tuple[float, float], optional
+        Seconds to wait for each attempt to connect to the API and to
+        read the response, as one number or a ``(connect, read)`` tuple.
+        Default is set by ``synoptic.configure_timeout``.
+    deadline : float, timedelta, or Deadline, optional
+        Time limit for the whole request, including retries and every
+        part of a split request. The time starts when the request is
+        made. Raises ``DeadlineExceeded`` when the time is up. Pass a
+        ``synoptic.Deadline`` to share one time limit between requests
+        or to cancel the request from another thread.
     verbose : bool
         If True, prints each step of the request process.
     **params : dict, optional
@@ -182,7 +337,203 @@ class SynopticAPI:
         - Parameters that accept ``0``, ``1``, ``on``, ``off`` can be given as boolean values.
     """
 
+    # Function that parses the STATION items to a DataFrame.
+    _parser = None
+
+    # A part of a split request may have no data (RESPONSE_CODE 2);
+    # the other parts may still have some.
+    _allow_empty = False
+
+    # Attributes of a lazy request that make the request when used.
+    _response_attributes = frozenset(
+        {
+            "json",
+            "response",
+            "SUMMARY",
+            "STATION",
+            "UNITS",
+            "QC_SUMMARY",
+            "VARIABLES",
+            "QCTYPES",
+            "MNET",
+            "MNETCAT",
+        }
+    )
+
     def __init__(
+        self,
+        service: ServiceType,
+        *,
+        token: str | Token | None = None,
+        session: requests.Session | None = None,
+        max_workers: int = 4,
+        batch_size: int = 200,
+        stream: bool | int = False,
+        lazy: bool = False,
+        timeout: float | tuple[float, float] | None = None,
+        deadline: Deadline | float | timedelta | None = None,
+        verbose=True,
+        **params,
+    ):
+        self._setup(service, token=token, verbose=verbose, **params)
+        self.session = session
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.stream = stream
+        self.timeout = timeout
+        self.deadline = deadline
+
+        self._pending = True
+        if not lazy:
+            self.execute()
+
+    def __getattr__(self, name):
+        """Make a lazy request when its data is first used."""
+        # Only called for attributes that don't exist (e.g., `json`
+        # or `STATION` before the request is made).
+        if (
+            name not in self._response_attributes
+            or not self.__dict__.get("_pending")
+            or self.__dict__.get("_executing")
+        ):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        self.execute()
+        return getattr(self, name)
+
+    def execute(self):
+        """Make the request, if it has not been made yet.
+
+        If the request fails, it can be made again by calling
+        ``execute`` (or using its data) again.
+
+        Returns
+        -------
+        This instance, so a lazy request can be made and used at once,
+        e.g., ``TimeSeries(..., lazy=True).execute().df()``.
+        """
+        if not self.__dict__.get("_pending") or self.__dict__.get("_executing"):
+            return self
+
+        self._executing = True
+        deadline = self.deadline
+        try:
+            self._execute()
+        except BaseException:
+            # Forget the failed attempt so the request can be made again.
+            self.deadline = deadline
+            for key in [*self.__dict__.get("json", {}), "json", "response"]:
+                self.__dict__.pop(key, None)
+            self._clear_results()
+            raise
+        finally:
+            self._executing = False
+        self._pending = False
+        return self
+
+    def _execute(self):
+        """Make the request (see ``execute``)."""
+        # The time limit starts now, not when a lazy request was created.
+        self.deadline = Deadline.of(self.deadline)
+        self.deadline.check()
+
+        if self.token is TOKEN:
+            TOKEN.check_once(
+                session=self.session, timeout=self.timeout, deadline=self.deadline
+            )
+
+        parts = self._split_params()
+        if parts:
+            self._get_parts(parts)
+            return
+
+        # An identical request already being made by another thread is
+        # shared instead of making another.
+        try:
+            leader = IN_FLIGHT.do(
+                self._flight_key(), self._request, timeout=self.deadline.remaining()
+            )
+        except TimeoutError:
+            self.deadline.check()
+            raise
+        if leader is not self:
+            self._follow(leader)
+
+    def _request(self):
+        """Make the request (or read it from the cache) and return this instance."""
+        if self.stream and self._parser is not None:
+            self._get_stream()
+            return self
+
+        # ---------------------------------
+        # Read a previous response from the cache
+        timer = datetime.now()
+        cached = CACHE.get(self.service, self.params)
+        if cached is not None:
+            if self.verbose:
+                print(
+                    f"🗄️  Reading Synoptic's {ANSI.text(self.service, ANSI.GREEN)} service response from the cache."
+                )
+            self.response = None
+            self.timers["api_request"] = datetime.now() - timer
+
+            timer = datetime.now()
+            self.json = decode.loads(cached)
+            self.timers["decode_json"] = datetime.now() - timer
+
+            self._attach_json()
+            return self
+
+        # --------------------------------
+        # Make API request (get JSON data)
+        if self.verbose:
+            print(
+                f"🚚💨 Speedy delivery from Synoptic's {ANSI.text(self.service, ANSI.GREEN)} service."
+            )
+
+        timer = datetime.now()
+
+        self.response = http_get(
+            self.endpoint,
+            self.params,
+            session=self.session,
+            timeout=self.timeout,
+            deadline=self.deadline,
+        )
+        self.url = self.response.url
+        self.timers["api_request"] = datetime.now() - timer
+
+        timer = datetime.now()
+        self.json = response_json(self.response)
+        self.timers["decode_json"] = datetime.now() - timer
+
+        self._attach_json()
+        CACHE.put(self.service, self.params, self.response.content)
+        return self
+
+    def _flight_key(self) -> tuple:
+        """Identify identical requests, which may share one response."""
+        return (
+            self.service,
+            tuple(sorted((k, str(v)) for k, v in self.params.items())),
+            self._allow_empty,
+        )
+
+    def _follow(self, leader: "SynopticAPI"):
+        """Use the response and parsed DataFrame of an identical request."""
+        self._leader = leader
+        self.response = leader.response
+        self.url = leader.url
+        self.json = leader.json
+        for key in leader.json:
+            setattr(self, key, getattr(leader, key))
+        self.timers["api_request"] = leader.timers["api_request"]
+
+        if self.verbose:
+            self._print_received()
+
+    def _setup(
         self,
         service: ServiceType,
         *,
@@ -190,6 +541,10 @@ class SynopticAPI:
         verbose=True,
         **params,
     ):
+        """Get the token, parse the parameters, and set the endpoint.
+
+        This does everything to prepare a request except make it.
+        """
         self.help_url = "https://docs.synopticdata.com/services/weather-data-api"
         self.verbose = verbose
         self.service = service
@@ -253,7 +608,7 @@ class SynopticAPI:
                     try:
                         # Try to parse the string as a datetime
                         value = pl.Series([value]).str.to_datetime().item()
-                    except:
+                    except Exception:
                         raise SynopticAPIError(
                             "\n"
                             f"Wrong datetime format for {key}={value}. \n"
@@ -276,27 +631,446 @@ class SynopticAPI:
         self.params = params
         self.timers["parse_params"] = datetime.now() - timer
 
-        # --------------------------------
-        # Make API request (get JSON data)
+        if self.service in _services_stations:
+            self.endpoint = api_url(f"stations/{service}")
+        else:
+            self.endpoint = api_url(service)
+
+        self.url = (
+            requests.Request("GET", self.endpoint, params=self.params).prepare().url
+        )
+        self._clear_results()
+
+    def _clear_results(self):
+        """Clear the state of the request and its results."""
+        self.parts = []
+        self.planner = None
+        self.spilled = None
+        self._leader = None
+        self._parsed = None
+        self._parse_lock = threading.Lock()
+        self._narrowed = {}
+
+    def _split_params(self) -> list[dict]:
+        """Parameters for each part when a request is split into several requests.
+
+        Long ``stid``, ``network``, and ``county`` lists are split into
+        batches of no more than ``batch_size`` values.
+
+        Returns an empty list when the request is not split.
+        """
+        if self.service not in _services_stations:
+            return []
+
+        batches = {}
+        for key in _batched_selectors:
+            values = str(self.params.get(key, "")).split(",")
+            if len(values) > self.batch_size:
+                batches[key] = [
+                    ",".join(values[i : i + self.batch_size])
+                    for i in range(0, len(values), self.batch_size)
+                ]
+
+        if not batches:
+            return []
+
+        return [
+            self.params | dict(zip(batches, batch))
+            for batch in itertools.product(*batches.values())
+        ]
+
+    def _time_range(self) -> tuple[datetime, datetime]:
+        """Start and end of the requested period, from ``start`` and ``end`` or ``recent``."""
+        params = self.params
+        if "recent" in params:
+            end = datetime.now(UTC).replace(tzinfo=None)
+            start = end - timedelta(minutes=int(params["recent"]))
+        elif "start" in params and "end" in params:
+            start = datetime.strptime(params["start"], "%Y%m%d%H%M")
+            end = datetime.strptime(params["end"], "%Y%m%d%H%M")
+        else:
+            raise SynopticAPIError(
+                f"A chunked {type(self).__name__} request requires `start` and `end`, or `recent`."
+            )
+        return start, end
+
+    def _split_time(
+        self, step: timedelta = timedelta(minutes=1)
+    ) -> list[dict] | Iterator[dict]:
+        """Split the time range into windows of length ``self.chunk``.
+
+        Each batch of stations is split into the same windows. For
+        ``chunk="auto"``, the parts are planned by ``self.planner`` while
+        they are received, so an iterator is returned instead of a list.
+
+        Parameters
+        ----------
+        step : timedelta
+            For ``chunk="auto"``, window lengths are a multiple of this.
+        """
+        start, end = self._time_range()
+        batches = [
+            {k: v for k, v in batch.items() if k != "recent"}
+            for batch in SynopticAPI._split_params(self) or [self.params]
+        ]
+
+        def window(i, j):
+            return {"start": f"{i:%Y%m%d%H%M}", "end": f"{j:%Y%m%d%H%M}"}
+
+        if self.chunk != "auto":
+            return [
+                batch | window(i, j)
+                for batch in batches
+                for i, j in split_time_range(start, end, self.chunk)
+            ]
+
         timer = datetime.now()
+        self.planner = ChunkPlanner(
+            start,
+            end,
+            values_per_hour=self._values_per_hour() / len(batches),
+            step=step,
+        )
+        self.timers["plan_chunks"] = datetime.now() - timer
+        return (batch | window(i, j) for i, j in self.planner for batch in batches)
+
+    def _plan_metadata(self) -> "Metadata":
+        """Metadata of the requested stations, to plan the request's size."""
+        selectors = {
+            k: v
+            for k, v in self.params.items()
+            if k in station_selectors and k != "complete"
+        }
+        # Requested once for both the memory budget and chunk="auto".
+        key = tuple(sorted((k, str(v)) for k, v in selectors.items()))
+        cached = self.__dict__.get("_metadata")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        metadata = Metadata(
+            token=self.token,
+            session=self.session,
+            batch_size=self.batch_size,
+            timeout=self.timeout,
+            deadline=self.deadline,
+            verbose=False,
+            sensorvars=1,
+            **selectors,
+        )
+        self._metadata = (key, metadata)
+        return metadata
 
-        if self.service in _services_stations:
-            self.endpoint = f"https://api.synopticdata.com/v2/stations/{service}"
+    def _values_per_hour(self) -> float:
+        """Estimated number of values in one hour of data, for ``chunk="auto"``.
+
+        Each sensor of each station is assumed to report
+        ``CHUNK_CONFIG["obs_per_hour"]`` times an hour.
+        """
+        stations = self._plan_metadata().STATION
+        if "vars" in self.params:
+            sensors = len(stations) * len(str(self.params["vars"]).split(","))
         else:
-            self.endpoint = f"https://api.synopticdata.com/v2/{service}"
+            sensors = sum(
+                len(sensor)
+                for station in stations
+                for sensor in (station.get("SENSOR_VARIABLES") or {}).values()
+            )
+        return max(1, sensors) * CHUNK_CONFIG["obs_per_hour"]
+
+    def _get_parts(self, parts: list[dict] | Iterator[dict]):
+        """Request each part concurrently and merge the returned JSON.
 
+        Each part's stations are parsed to a DataFrame on another thread
+        as soon as it is downloaded, while the other parts download.
+
+        No more than ``max_workers`` parts are requested at once, and the
+        next part is only taken from ``parts`` when one finishes, so the
+        parts may be planned from the ones already received.
+        """
         if self.verbose:
+            count = "adaptive" if self.planner is not None else len(parts)
             print(
-                f"🚚💨 Speedy delivery from Synoptic's {ANSI.text(service, ANSI.GREEN)} service."
+                f"🚚💨 Speedy delivery from Synoptic's {ANSI.text(self.service, ANSI.GREEN)} service"
+                f" in {count} parts."
             )
 
         timer = datetime.now()
 
-        self.response = requests.get(self.endpoint, params=params)
-        self.url = self.response.url
-        self.json = self.response.json()
-        self.timers["api_request"] = datetime.now() - timer
+        # The parts share the time limit. If one part fails, the parts
+        # not yet finished are cancelled.
+        deadline = self.deadline.child()
+
+        def get_part(params):
+            part = type(self)(
+                session=self.session,
+                stream=self.stream,
+                timeout=self.timeout,
+                deadline=deadline,
+                lazy=True,
+                verbose=False,
+                **params,
+            )
+            part._allow_empty = True
+            return part.execute()
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        parser = ThreadPoolExecutor(max_workers=1)
+        failed = False
+        try:
+            parts = iter(parts)
+            futures = [
+                pool.submit(get_part, p)
+                for p in itertools.islice(parts, self.max_workers)
+            ]
+            running = set(futures)
+            index = {f: i for i, f in enumerate(futures)}
+            parsing = []
+            while running:
+                future = next(deadline.as_completed(running))
+                running.remove(future)
+                part = future.result()
+                if self.planner is not None:
+                    self.planner.record(*_part_window(part))
+                if part._is_empty():
+                    # A part with no data has nothing to parse.
+                    pass
+                elif self.spilled is not None:
+                    file = Path(self.spill_dir) / f"part-{index[future]:05d}.parquet"
+                    parsing.append(parser.submit(self._spill_part, part, file))
+                elif self._parser is not None:
+                    # The DataFrame is cached by the part's `df` method.
+                    parsing.append(parser.submit(part.df))
+                for p in itertools.islice(parts, 1):
+                    futures.append(pool.submit(get_part, p))
+                    running.add(futures[-1])
+                    index[futures[-1]] = len(futures) - 1
+            self.parts = [f.result() for f in futures]
+            self.timers["api_request"] = datetime.now() - timer
+
+            results = [future.result() for future in parsing]
+            if self.spilled is not None:
+                self.spilled = sorted(results)
+            self.timers["parse_parts"] = datetime.now() - timer
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            if failed:
+                # Don't wait for the parts still running; they stop at
+                # their next check of the cancelled deadline.
+                deadline.cancel()
+            pool.shutdown(wait=not failed, cancel_futures=failed)
+            parser.shutdown(wait=not failed, cancel_futures=failed)
+
+        self._merge_parts()
+
+    def _is_empty(self) -> bool:
+        """Whether the response has no stations (e.g., "No data found")."""
+        return not getattr(self, "STATION", None)
+
+    def _merge_parts(self):
+        """Merge the JSON of the parts and check the response.
+
+        Parts with no data are skipped. Only when every part is empty is
+        the request an error, as it would be if it wasn't split.
+        """
+        if all(p._is_empty() for p in self.parts):
+            self.json = self.parts[0].json
+        else:
+            self.json = merge_json([p.json for p in self.parts])
+        self._attach_json()
+
+    def _spill_part(self, part: "SynopticAPI", file: Path) -> Path:
+        """Write a part's DataFrame to a Parquet file and free its memory."""
+        part._parse().write_parquet(file)
+        part._parsed = None
+        return file
+
+    def _scan_spilled(self, subset: list[str] | None = None) -> pl.LazyFrame:
+        """Scan the Parquet files the parts were spilled to."""
+        lf = pl.scan_parquet(self.spilled)
+        if subset is not None:
+            lf = lf.unique(subset=subset, keep="first", maintain_order=True)
+        return lf
+
+    def _get_stream(self):
+        """Request the data and parse the stations while they are downloaded."""
+        if self.verbose:
+            print(
+                f"🚚💨 Speedy delivery from Synoptic's {ANSI.text(self.service, ANSI.GREEN)} service"
+                " (streaming)."
+            )
+
+        chunk_size = 2**16
+        with contextlib.ExitStack() as stack:
+            timer = datetime.now()
+            cached = CACHE.open(self.service, self.params)
+            if cached is not None:
+                self.response = None
+                stack.enter_context(cached)
+                chunks = iter(lambda: cached.read(chunk_size), b"")
+            else:
+                self.response = http_get(
+                    self.endpoint,
+                    self.params,
+                    session=self.session,
+                    stream=True,
+                    timeout=self.timeout,
+                    deadline=self.deadline,
+                )
+                self.url = self.response.url
+                stack.callback(self.response.close)
+                chunks = self.deadline.guard(
+                    self.response.iter_content(chunk_size=chunk_size)
+                )
+
+                # Write the response to the cache as it is downloaded.
+                # It is discarded if there is an error before the end.
+                cache = stack.enter_context(CACHE.writer(self.service, self.params))
+                if cache is not None:
+                    chunks = _write_through(chunks, cache)
+            self.timers["api_request"] = datetime.now() - timer
+
+            timer = datetime.now()
+            batch_size = 100 if self.stream is True else int(self.stream)
+            self.json = {"STATION": []}
+            stations = self._stream_stations(chunks)
+            first = next(stations, None)
+            if first is not None:
+                self.STATION = itertools.chain([first], stations)
+                self._parsed = self._parser(batch_size=batch_size)
+            # The observations were removed from each station as it was parsed.
+            self.STATION = self.json["STATION"]
+            self.timers["stream_and_parse"] = datetime.now() - timer
+
+            self._check_summary()
+
+        if self.verbose:
+            self._print_received()
+
+    def _stream_stations(self, chunks):
+        """Yield each STATION item as it is decoded from the chunks of the response.
+
+        The other top-level keys of the JSON are attached to the instance
+        as they are decoded.
+        """
+        try:
+            for key, value in decode.iter_json_stream(chunks, "STATION"):
+                if key == "STATION":
+                    self.json["STATION"].append(value)
+                    yield value
+                else:
+                    self.json[key] = value
+                    setattr(self, key, value)
+                    if key == "SUMMARY":
+                        self._check_summary()
+        except ValueError as e:
+            raise SynopticAPIError(
+                "\n"
+                f"🛑 FATAL: Synoptic API response is not JSON.\n"
+                f"  ├─ error: {e}\n"
+                f"  └─ url: {self.url}"
+            ) from e
 
+    def _parse(self, subset: list[str] | None = None) -> pl.DataFrame:
+        """Parse the STATION items of this request, or its parts, to a DataFrame.
+
+        Parameters
+        ----------
+        subset : list[str]
+            Columns that identify a unique row when concatenating parts.
+        """
+        self.execute()
+        if self._leader is not None:
+            return self._leader._parse(subset=subset)
+
+        # The stations are only parsed once, even when the DataFrame is
+        # shared with identical requests in other threads.
+        with self._parse_lock:
+            if self._parsed is None:
+                if self.spilled is not None:
+                    self._parsed = self._scan_spilled(subset).collect()
+                elif self.parts:
+                    self._parsed = self._concat_parts(subset=subset)
+                else:
+                    self._parsed = self._parser()
+            return self._parsed
+
+    def _push_down_variables(
+        self, variables: str | list[str] | None
+    ) -> "SynopticAPI | None":
+        """Return a lazy copy of this request for only these variables.
+
+        Returns None if no variables are given or the request has been
+        made (the DataFrame is filtered instead). This request's
+        parameters are not changed, so ``df()`` still has every variable.
+        The copy for each set of variables is kept, so it is only
+        requested once.
+        """
+        if variables is None or not self.__dict__.get("_pending"):
+            return None
+        if isinstance(variables, str):
+            variables = [variables]
+
+        if "vars" in self.params:
+            requested = self.params["vars"].split(",")
+            variables = [i for i in requested if i in variables]
+        if not variables:
+            # An empty `vars` would request every variable.
+            raise SynopticAPIError(
+                "No variables to request; none of the variables are in the "
+                f"request's vars={self.params.get('vars')!r}."
+            )
+
+        key = tuple(sorted(variables))
+        if key in self._narrowed:
+            return self._narrowed[key]
+
+        narrowed = copy.copy(self)
+        narrowed.params = self.params | {"vars": ",".join(variables)}
+        narrowed.url = (
+            requests.Request("GET", self.endpoint, params=narrowed.params).prepare().url
+        )
+        narrowed.timers = {}
+        narrowed._clear_results()
+        # Another thread may have made the same copy first.
+        return self._narrowed.setdefault(key, narrowed)
+
+    @staticmethod
+    def _project(
+        df: pl.DataFrame,
+        variables: str | list[str] | None = None,
+        columns: list[str] | None = None,
+    ) -> pl.DataFrame:
+        """Select the rows of some variables and some columns of a DataFrame."""
+        if variables is not None:
+            if isinstance(variables, str):
+                variables = [variables]
+            df = df.filter(pl.col("variable").is_in(variables))
+        if columns is not None:
+            df = df.select(columns)
+        return df
+
+    def _concat_parts(self, subset: list[str] | None = None, **kwargs) -> pl.DataFrame:
+        """Concatenate the DataFrame of each part.
+
+        Parameters
+        ----------
+        subset : list[str]
+            Columns that identify a unique row. Rows duplicated in
+            several parts are dropped.
+        **kwargs :
+            Arguments passed to each part's ``df`` method.
+        """
+        df = pl.concat(
+            [p.df(**kwargs) for p in self.parts if not p._is_empty()],
+            how="diagonal_relaxed",
+        )
+        if subset is not None:
+            df = df.unique(subset=subset, keep="first", maintain_order=True)
+        return df
+
+    def _attach_json(self):
+        """Attach the returned JSON to the instance and check the response."""
         # ----------------------------------------------------
         # Attach each JSON key-value pair as a class attribute
         timer = datetime.now()
@@ -304,30 +1078,38 @@ class SynopticAPI:
             setattr(self, key, value)
         self.timers["attach_keys_as_attribute"] = datetime.now() - timer
 
-        # -------------------
-        # Check returned data
+        self._check_summary()
+        if self.verbose:
+            self._print_received()
+
+    def _check_summary(self):
+        """Raise an error if the SUMMARY says the request failed."""
         # Note: SUMMARY is always returned in the JSON.
+        if self.SUMMARY["RESPONSE_CODE"] == 2 and self._allow_empty:
+            return
         if self.SUMMARY["RESPONSE_CODE"] != 1:
             raise SynopticAPIError(
                 "\n"
                 f"🛑 FATAL: Not a valid Synoptic API request.\n"
                 f"  ├─ message: {self.SUMMARY['RESPONSE_MESSAGE']}\n"
-                f"  └─ url: {self.response.url}\n"
+                f"  └─ url: {self.url}\n"
                 f"See {self.help_url} for help."
             )
 
-        if self.verbose:
-            print(
-                f"📦 Received data from {ANSI.CYAN}{self.SUMMARY.get('NUMBER_OF_OBJECTS'):,}{ANSI.RESET} stations"
-                f" ({self.timers['api_request'].total_seconds():.2f} seconds)."
-            )
+    def _print_received(self):
+        print(
+            f"📦 Received data from {ANSI.CYAN}{self.SUMMARY.get('NUMBER_OF_OBJECTS'):,}{ANSI.RESET} stations"
+            f" ({self.timers['api_request'].total_seconds():.2f} seconds)."
+        )
 
     def __repr__(self):
         """Notebook representation."""
         messages = f"╭─ Synoptic {self.service} service ─────\n"
-        if hasattr(self, "STATION"):
+        if self.__dict__.get("_pending"):
+            messages += "│ (lazy; not requested yet)\n"
+        elif hasattr(self, "STATION"):
             messages += f"│ Stations : {self.SUMMARY.get('NUMBER_OF_OBJECTS'):,}\n"
-        if hasattr(self, "QC_SUMMARY"):
+        if "QC_SUMMARY" in self.__dict__:
             messages += (
                 f"│ QC Checks: {len(self.QC_SUMMARY.get('QC_CHECKS_APPLIED'))}\n"
             )
@@ -360,26 +1142,161 @@ class TimeSeries(SynopticAPI):
     **optional_parameters :
         Additional parameters such as `units`, `precip`, `qc`, etc.
 
+    chunk : timedelta, int, str, or "auto", optional
+        If given, split the time range into windows of this length
+        (e.g., ``'7d'``) and request each window concurrently (see
+        ``max_workers``). Useful for long periods of high-frequency data.
+        If ``"auto"``, the length of each window is chosen from the
+        station metadata and the responses already received (see
+        ``synoptic.configure_chunking``); the plan is in ``planner``.
+    memory_budget : int or str, optional
+        Memory the request may use, in bytes or as a string like
+        ``'2GB'``. The size of the request is estimated from a
+        ``Metadata`` request before any data is requested (see
+        ``estimate``), and ``over_budget`` sets what is done when it
+        doesn't fit.
+    over_budget : {"chunk", "spill", "raise"}
+        When the request doesn't fit ``memory_budget``, either request
+        the data in smaller chunks, write each chunk to a Parquet file
+        in ``spill_dir`` (use ``scan`` to read them), or raise
+        ``MemoryBudgetError``. Default is *"chunk"*.
+    spill_dir : str or Path, optional
+        Directory for the Parquet files of ``over_budget="spill"``.
+        Default is a new temporary directory, which is removed when this
+        object is garbage collected; keep it while using ``scan``. A
+        given ``spill_dir`` is never removed.
+
     Notes
     -----
     - If `recent` is provided, `start` and `end` are not needed.
     - If `start` and `end` are provided, `recent` should not be used.
     """
 
-    def __init__(self, **params):
+    _parser = parse_stations_timeseries
+
+    # Columns that identify a unique row.
+    _row_key = ["stid", "date_time", "variable", "sensor_index", "is_derived"]
+
+    def __init__(
+        self,
+        *,
+        chunk: timedelta | int | str | None = None,
+        memory_budget: int | str | None = None,
+        over_budget: Literal["chunk", "spill", "raise"] = "chunk",
+        spill_dir: str | Path | None = None,
+        **params,
+    ):
+        self.chunk = parse_chunk(chunk)
+        self.memory_budget = memory_budget
+        self.over_budget = over_budget
+        self.spill_dir = spill_dir
+
         super().__init__("timeseries", **params)
 
-    @lru_cache
-    def df(self, with_latency=False) -> pl.DataFrame:
+    def _split_params(self) -> list[dict] | Iterator[dict]:
+        """Split the time range into windows of length ``chunk``."""
+        if self.memory_budget is not None:
+            self._apply_memory_budget()
+        if self.chunk is None:
+            return super()._split_params()
+        return self._split_time()
+
+    def estimate(self) -> dict:
+        """Estimate the size of the request, before it is made.
+
+        The number of values is estimated from a ``Metadata`` request
+        as stations × sensors × hours × observations per hour (see
+        ``synoptic.configure_chunking``).
+
+        Returns
+        -------
+        A dict with the estimated number of ``values``, the
+        ``dataframe_bytes`` of the DataFrame, and the ``request_bytes``
+        of memory needed to receive and parse it in one request.
+        """
+        timer = datetime.now()
+        start, end = self._time_range()
+        estimate = estimate_size(
+            self._values_per_hour(), (end - start) / timedelta(hours=1)
+        )
+        self.timers["estimate"] = datetime.now() - timer
+        return estimate
+
+    def _apply_memory_budget(self):
+        """Chunk, spill, or refuse the request if it doesn't fit the memory budget."""
+        estimate = self.estimate()
+        chunk, spill = plan_budget(
+            estimate, parse_size(self.memory_budget), self.over_budget, self.max_workers
+        )
+        if chunk is None:
+            return
+
+        if not isinstance(self.chunk, timedelta) or self.chunk > chunk:
+            self.chunk = chunk
+        if spill:
+            if self.spill_dir is None:
+                self.spill_dir = Path(tempfile.mkdtemp(prefix="synoptic-spill-"))
+                weakref.finalize(
+                    self, shutil.rmtree, self.spill_dir, ignore_errors=True
+                )
+            self.spill_dir = Path(self.spill_dir)
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            self.spilled = []
+            # A streamed part doesn't hold on to the response body.
+            self.stream = self.stream or True
+
+        if self.verbose:
+            spilling = f", spilled to {self.spill_dir}" if spill else ""
+            print(
+                f"🧮 Estimated {estimate['values']:,} values "
+                f"({format_size(estimate['request_bytes'])}); requesting in "
+                f"chunks of {self.chunk}{spilling}."
+            )
+
+    def scan(self) -> pl.LazyFrame:
+        """Scan the stations timeseries data as a LazyFrame.
+
+        When the data was spilled to Parquet files (``over_budget="spill"``),
+        the files are scanned instead of read into memory.
+        """
+        self.execute()
+        if self.spilled is not None:
+            return self._scan_spilled(self._row_key)
+        return self.df().lazy()
+
+    def df(
+        self,
+        with_latency=False,
+        *,
+        variables: str | list[str] | None = None,
+        columns: list[str] | None = None,
+    ) -> pl.DataFrame:
         """Stations timeseries DataFrame.
 
         Parameters
         ----------
         with_latency : bool
             If True, return data with latency column from the Latency service.
+        variables : str or list[str], optional
+            Only return these variables (e.g., ``["air_temp", "wind_speed"]``).
+            For a lazy request (``lazy=True``), only these variables are
+            requested from the API.
+        columns : list[str], optional
+            Only return these columns.
         """
+        request = self._push_down_variables(variables) or self
+        return self._project(
+            request._df(with_latency, request._generation), variables, columns
+        )
+
+    # Bumped when the DataFrame is replaced (see ``_set_df``), so the
+    # cached ``_df`` of only this instance is stale.
+    _generation = 0
+
+    @lru_cache
+    def _df(self, with_latency=False, generation=0) -> pl.DataFrame:
         timer = datetime.now()
-        df = parse_stations_timeseries(self)
+        df = self._parse(subset=self._row_key)
         self.timers["parse_to_polars_dataframe"] = datetime.now() - timer
 
         if with_latency:
@@ -400,6 +1317,113 @@ class TimeSeries(SynopticAPI):
             )
         return df
 
+    def extend(
+        self,
+        end: datetime | str | None = None,
+        max_lookback: timedelta = timedelta(days=1),
+    ) -> pl.DataFrame:
+        """Request only the data after the last observation and append it.
+
+        The new rows are added to the DataFrame returned by ``df()``.
+        Observations at the same time as one already held are replaced
+        by the new value.
+
+        The new period starts at the oldest last observation of the
+        stations, so no station misses data. A station whose last
+        observation is more than ``max_lookback`` before the newest one
+        is stale and is ignored when choosing the start; its data before
+        the start is not requested again.
+
+        Parameters
+        ----------
+        end : datetime or str, optional
+            The end of the new period. Default is now.
+        max_lookback : timedelta
+            How far before the newest last observation the new period
+            may start.
+
+        Returns
+        -------
+        The extended DataFrame.
+        """
+        timer = datetime.now()
+        df = self.df()
+
+        if df.is_empty():
+            # No data yet; request the whole period again.
+            start, _ = self._time_range()
+        else:
+            # Start from the station with the oldest last observation so
+            # no station misses data, ignoring stale stations.
+            last = df.group_by("stid").agg(pl.col("date_time").max())["date_time"]
+            start = last.filter(last >= last.max() - max_lookback).min()
+            start = start.replace(tzinfo=None)
+        if end is None:
+            end = datetime.now(UTC)
+
+        params = {
+            k: v for k, v in self.params.items() if k not in ("recent", "start", "end")
+        }
+        # The new period gets the same time limit, starting now.
+        deadline = self.deadline
+        if isinstance(deadline, Deadline):
+            deadline = deadline.seconds
+        new = TimeSeries(
+            start=start,
+            end=end.replace(tzinfo=None) if isinstance(end, datetime) else end,
+            chunk=self.chunk,
+            session=self.session,
+            max_workers=self.max_workers,
+            batch_size=self.batch_size,
+            stream=self.stream,
+            timeout=self.timeout,
+            deadline=deadline,
+            # The new rows are appended in memory, so they aren't spilled.
+            memory_budget=self.memory_budget,
+            over_budget="chunk" if self.over_budget == "spill" else self.over_budget,
+            verbose=self.verbose,
+            **params,
+        )
+
+        df = pl.concat([df, new.df()], how="diagonal_relaxed").unique(
+            subset=self._row_key, keep="last", maintain_order=True
+        )
+        if "recent" not in self.params:
+            self.params["end"] = new.params["end"]
+            self.url = (
+                requests.Request("GET", self.endpoint, params=self.params).prepare().url
+            )
+        self._set_df(df)
+        self.timers["extend"] = datetime.now() - timer
+        return df
+
+    def refresh(self) -> pl.DataFrame:
+        """Request the data since the last observation, up to now.
+
+        If the request was made with ``recent``, observations older than
+        the ``recent`` window are dropped, so the DataFrame is a rolling
+        window of the most recent data.
+
+        Returns
+        -------
+        The refreshed DataFrame.
+        """
+        df = self.extend()
+        if "recent" in self.params:
+            oldest = datetime.now(UTC) - timedelta(
+                minutes=int(self.params["recent"])
+            )
+            df = df.filter(pl.col("date_time") >= oldest)
+            self._set_df(df)
+        return df
+
+    def _set_df(self, df: pl.DataFrame):
+        """Replace the DataFrame returned by ``df()``."""
+        self._leader = None
+        with self._parse_lock:
+            self._parsed = df
+        self._generation += 1
+
 
 class Latest(SynopticAPI):
     """Get the most recent data from one or more stations.
@@ -422,14 +1446,35 @@ class Latest(SynopticAPI):
         units, precip, qc, etc.
     """
 
+    _parser = parse_stations_latest_nearesttime
+
     def __init__(self, **params):
         super().__init__("latest", **params)
 
+    def df(
+        self,
+        *,
+        variables: str | list[str] | None = None,
+        columns: list[str] | None = None,
+    ) -> pl.DataFrame:
+        """Stations latest DataFrame.
+
+        Parameters
+        ----------
+        variables : str or list[str], optional
+            Only return these variables (e.g., ``["air_temp", "wind_speed"]``).
+            For a lazy request (``lazy=True``), only these variables are
+            requested from the API.
+        columns : list[str], optional
+            Only return these columns.
+        """
+        request = self._push_down_variables(variables) or self
+        return self._project(request._df(), variables, columns)
+
     @lru_cache
-    def df(self) -> pl.DataFrame:
-        """Stations latest DataFrame."""
+    def _df(self) -> pl.DataFrame:
         timer = datetime.now()
-        df = parse_stations_latest_nearesttime(self)
+        df = self._parse()
         self.timers["parse_to_polars_dataframe"] = datetime.now() - timer
         return df
 
@@ -454,14 +1499,35 @@ class NearestTime(SynopticAPI):
         units, precip, qc, etc.
     """
 
+    _parser = parse_stations_latest_nearesttime
+
     def __init__(self, **params):
         super().__init__("nearesttime", **params)
 
+    def df(
+        self,
+        *,
+        variables: str | list[str] | None = None,
+        columns: list[str] | None = None,
+    ) -> pl.DataFrame:
+        """Stations nearest time DataFrame.
+
+        Parameters
+        ----------
+        variables : str or list[str], optional
+            Only return these variables (e.g., ``["air_temp", "wind_speed"]``).
+            For a lazy request (``lazy=True``), only these variables are
+            requested from the API.
+        columns : list[str], optional
+            Only return these columns.
+        """
+        request = self._push_down_variables(variables) or self
+        return self._project(request._df(), variables, columns)
+
     @lru_cache
-    def df(self) -> pl.DataFrame:
-        """Stations nearest time DataFrame."""
+    def _df(self) -> pl.DataFrame:
         timer = datetime.now()
-        df = parse_stations_latest_nearesttime(self)
+        df = self._parse()
         self.timers["parse_to_polars_dataframe"] = datetime.now() - timer
         return df
 
@@ -494,21 +1560,66 @@ class Precipitation(SynopticAPI):
         Integer hours, or string interval. Default is *"day"*.
     interval_window : int
         Time window in hours
+    chunk : timedelta, int, str, or "auto", optional
+        Split the time range into windows of this length and request
+        each window concurrently, like ``TimeSeries``. Only for
+        ``pmode="intervals"`` with an interval of a fixed length (hours,
+        ``'hour'``, ``'day'``, or ``'week'``); the window length must be
+        a multiple of the interval.
     **optional_parameters
         units, precip, qc, etc.
     """
 
-    def __init__(self, **params):
+    _parser = parse_stations_precipitation
+
+    # Length of each named interval.
+    _intervals = {
+        "hour": timedelta(hours=1),
+        "day": timedelta(days=1),
+        "week": timedelta(weeks=1),
+    }
+
+    def __init__(self, *, chunk: timedelta | int | str | None = None, **params):
         # Don't allow legacy precip service with pmode omitted.
         params.setdefault("pmode", "totals")
+        self.chunk = parse_chunk(chunk)
+
+        if self.chunk is not None:
+            interval = str(params.get("interval", "day"))
+            if params["pmode"] != "intervals" or not (
+                interval.isnumeric() or interval in self._intervals
+            ):
+                raise SynopticAPIError(
+                    "Only `pmode='intervals'` precipitation with an interval of "
+                    "hours, 'hour', 'day', or 'week' can be requested in chunks."
+                )
+            self._interval = self._intervals.get(interval) or timedelta(
+                hours=int(interval)
+            )
+            if self.chunk != "auto" and self.chunk % self._interval:
+                raise SynopticAPIError(
+                    f"The chunk ({self.chunk}) must be a multiple of the interval "
+                    f"({self._interval})."
+                )
 
         super().__init__("precipitation", **params)
 
+    def _split_params(self) -> list[dict] | Iterator[dict]:
+        """Split the time range into windows that are a multiple of the interval."""
+        if self.chunk is None:
+            return super()._split_params()
+        return self._split_time(step=self._interval)
+
+    def _values_per_hour(self) -> float:
+        """Estimated number of precipitation intervals in one hour of data."""
+        stations = len(self._plan_metadata().STATION)
+        return max(1, stations) * timedelta(hours=1) / self._interval
+
     @lru_cache
     def df(self) -> pl.DataFrame:
         """Stations precipitation DataFrame."""
         timer = datetime.now()
-        df = parse_stations_precipitation(self)
+        df = self._parse()
         self.timers["parse_to_polars_dataframe"] = datetime.now() - timer
         return df
 
@@ -548,6 +1659,8 @@ class Latency(SynopticAPI):
         units, precip, qc, etc.
     """
 
+    _parser = parse_stations_latency
+
     def __init__(self, **params):
         super().__init__("latency", **params)
 
@@ -555,7 +1668,7 @@ class Latency(SynopticAPI):
     def df(self) -> pl.DataFrame:
         """Stations latency DataFrame."""
         timer = datetime.now()
-        df = parse_stations_latency(self)
+        df = self._parse()
         self.timers["parse_to_polars_dataframe"] = datetime.now() - timer
         return df
 
@@ -579,6 +1692,8 @@ class Metadata(SynopticAPI):
         Start and end datetime, as a tuple ``(datetime.datetime, datetime.datetime)`` or string ``YYMMDDHHMM,YYMMDDHHMM`
     """
 
+    _parser = parse_stations_metadata
+
     def __init__(self, **params):
         # `start` and `end` are not valid parameters, but `obrange` is.
         # This has confused users, such as https://github.com/blaylockbk/SynopticPy/issues/55.
@@ -597,48 +1712,7 @@ class Metadata(SynopticAPI):
     def df(self) -> pl.DataFrame:
         """Stations metadata DataFrame."""
         timer = datetime.now()
-        df = pl.DataFrame(
-            self.STATION,
-            schema_overrides={
-                "STID": pl.String,
-                "STATUS": pl.String,
-                "ID": pl.UInt32,
-                "MNET_ID": pl.UInt32,
-                "WIMS_ID": pl.UInt32,
-            },
-            infer_schema_length=None,
-            # TODO: Setting to None is slow, but necessary to parse the "providers" column
-            # TODO: How do you set the schema_overrides for 'providers' to List(Struct({'name': pl.String, 'url': pl.String}))
-        )
-
-        df = (
-            df.with_columns(
-                pl.struct(
-                    pl.col("PERIOD_OF_RECORD")
-                    .struct.field("start")
-                    .cast(pl.String)
-                    .str.to_datetime(time_zone="UTC")
-                    .alias("PERIOD_OF_RECORD_START"),
-                    pl.col("PERIOD_OF_RECORD")
-                    .struct.field("end")
-                    .cast(pl.String)
-                    .str.to_datetime(time_zone="UTC")
-                    .alias("PERIOD_OF_RECORD_END"),
-                ).alias("PERIOD_OF_RECORD"),
-                pl.col("ELEVATION", "LATITUDE", "LONGITUDE", "ELEV_DEM")
-                .cast(pl.String)
-                .str.strip_chars()
-                .cast(pl.Float64),
-                is_active=pl.when(pl.col("STATUS") == "ACTIVE")
-                .then(True)
-                .otherwise(pl.when(pl.col("STATUS") == "INACTIVE").then(False)),
-            )
-            .unnest("PERIOD_OF_RECORD")
-            .drop("UNITS", "STATUS")
-            .rename({"RESTRICTED": "is_restricted"})
-        )
-
-        df = df.rename({i: i.lower() for i in df.columns})
+        df = self._parse()
         self.timers["parse_to_polars_dataframe"] = datetime.now() - timer
         return df
 
@@ -792,3 +1866,112 @@ class NetworkTypes(SynopticAPI):
         df = df.rename({i: i.lower() for i in df.columns}).rename({"id": "mnetcat_id"})
         self.timers["parse_to_polars_dataframe"] = datetime.now() - timer
         return df
+
+
+# Service class for each service name.
+_service_classes = {
+    "timeseries": TimeSeries,
+    "latest": Latest,
+    "nearesttime": NearestTime,
+    "precipitation": Precipitation,
+    "qcsegments": QCSegments,
+    "latency": Latency,
+    "metadata": Metadata,
+    "qctypes": QCTypes,
+    "variables": Variables,
+    "networks": Networks,
+    "networktypes": NetworkTypes,
+}
+
+
+def fetch_many(
+    queries: list[SynopticAPI | dict],
+    *,
+    max_workers: int = 8,
+    session: requests.Session | None = None,
+    raise_errors: bool = False,
+    deadline: Deadline | float | timedelta | None = None,
+) -> list[pl.DataFrame | SynopticAPI | Exception]:
+    """Make several requests, to any services, concurrently.
+
+    Parameters
+    ----------
+    queries : list of SynopticAPI instances or dicts
+        Each query is either a lazy service instance (e.g.,
+        ``Latest(stid="wbb", lazy=True)``) or a dict with the name of a
+        ``"service"`` and its parameters (e.g.,
+        ``{"service": "metadata", "state": "UT"}``).
+    max_workers : int
+        Maximum number of requests made at once.
+    session : requests.Session, optional
+        The HTTP session for queries given as a dict. If None, uses the
+        shared connection-pooled session.
+    raise_errors : bool
+        If True, raise the first error instead of returning it, and
+        cancel the requests not yet finished.
+    deadline : float, timedelta, or Deadline, optional
+        Time limit for all the queries together. Queries not finished in
+        time are cancelled and their result is ``DeadlineExceeded``.
+
+    Returns
+    -------
+    A list with the result of each query, in the same order as
+    ``queries``. The result is the query's DataFrame (or the service
+    instance, if the service has no ``df`` method). If a query failed,
+    its result is the exception that was raised, so one failure doesn't
+    stop the other requests.
+
+    Examples
+    --------
+    >>> import synoptic
+    >>> metadata, latest, networks = synoptic.fetch_many(
+    ...     [
+    ...         {"service": "metadata", "state": "UT"},
+    ...         synoptic.Latest(state="UT", lazy=True),
+    ...         {"service": "networks"},
+    ...     ]
+    ... )
+    """
+    # Every query shares the time limit, and is cancelled with `shared`.
+    deadline = Deadline.of(deadline)
+    shared = deadline.child()
+
+    def fetch(query):
+        try:
+            if isinstance(query, dict):
+                query = dict(query)
+                service = query.pop("service").lower()
+                if service not in _service_classes:
+                    raise ValueError(
+                        f"'{service}' is not a valid service. Must be one of {set(_service_classes)}."
+                    )
+                query.setdefault("session", session)
+                query.setdefault("verbose", False)
+                query.setdefault("deadline", shared)
+                query = _service_classes[service](**query)
+            elif query.__dict__.get("_pending") and query.deadline is None:
+                query.deadline = shared
+            query.execute()
+            return query.df() if hasattr(type(query), "df") else query
+        except Exception as e:
+            if raise_errors:
+                raise
+            return e
+
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    futures = [pool.submit(fetch, query) for query in queries]
+    done, error = set(), None
+    try:
+        for future in shared.as_completed(futures):
+            done.add(future)
+            future.result()  # Raise the error of a failed query.
+    except BaseException as e:
+        # Stop the queries not finished.
+        shared.cancel()
+        if raise_errors or not isinstance(e, (DeadlineExceeded, RequestCancelled)):
+            raise
+        error = e
+    finally:
+        # Past the deadline, don't wait for the cancelled queries to stop.
+        pool.shutdown(wait=deadline.error() is None, cancel_futures=True)
+    return [future.result() if future in done else error for future in futures]
@@ -0,0 +1,298 @@
+"""
+🔌 Shared HTTP session for the Synoptic API.
+
+Every request SynopticPy makes goes through one process-wide
+``requests.Session`` so TCP and TLS connections are kept alive and
+reused between requests instead of doing a new handshake each time.
+
+The connection pool can be tuned with :func:`configure_session`, or you
+may provide your own session, either for the whole process with
+:func:`set_session` or for a single request with the ``session=``
+argument of any service class.
+
+Examples
+--------
+>>> import synoptic
+>>> synoptic.configure_session(pool_maxsize=50)
+>>> s = synoptic.Latest(stid="wbb")
+"""
+
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from synoptic.deadline import Deadline
+from synoptic.retry import RATE_LIMITER, RETRY
+
+# Root URL of the Synoptic Weather API. Set the environment variable
+# SYNOPTIC_API_URL to use another server (e.g., ``synoptic.server``).
+API_URL = os.getenv("SYNOPTIC_API_URL", "https://api.synopticdata.com/v2")
+
+# Default connection pool settings.
+#   pool_connections : number of per-host pools to keep.
+#   pool_maxsize : number of connections to keep alive in each per-host pool.
+#   pool_block : if True, limit connections per host to `pool_maxsize`.
+SESSION_CONFIG = {
+    "pool_connections": 4,
+    "pool_maxsize": 16,
+    "pool_block": False,
+    "keep_alive": True,
+}
+
+# Default timeouts, in seconds, for each attempt of a request.
+#   connect : time to wait for a connection to the server.
+#   read : time to wait between bytes of the response.
+TIMEOUT = {
+    "connect": 10.0,
+    "read": 120.0,
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def new_session(
+    *,
+    pool_connections: int | None = None,
+    pool_maxsize: int | None = None,
+    pool_block: bool | None = None,
+    keep_alive: bool | None = None,
+) -> requests.Session:
+    """Create a new connection-pooled session.
+
+    Arguments not given use the values in ``SESSION_CONFIG``.
+
+    Parameters
+    ----------
+    pool_connections : int
+        Number of per-host connection pools to cache.
+    pool_maxsize : int
+        Maximum number of connections kept alive for each host.
+    pool_block : bool
+        If True, no more than ``pool_maxsize`` connections are opened
+        to a host at once; extra requests wait for a free connection.
+    keep_alive : bool
+        If False, close each connection after the response.
+    """
+    config = SESSION_CONFIG | {
+        k: v
+        for k, v in dict(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        ).items()
+        if v is not None
+    }
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config["pool_connections"],
+        pool_maxsize=config["pool_maxsize"],
+        pool_block=config["pool_block"],
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if not config["keep_alive"]:
+        session.headers["Connection"] = "close"
+
+    return session
+
+
+def get_session() -> requests.Session:
+    """Get the shared session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = new_session()
+    return _session
+
+
+def set_session(
+    session: requests.Session | None, *, close: bool = True
+) -> requests.Session | None:
+    """Replace the shared session used by all requests.
+
+    Parameters
+    ----------
+    session : requests.Session or None
+        The session to use for all requests. If None, a new session is
+        created with ``SESSION_CONFIG`` the next time one is needed.
+    close : bool
+        If True, close the session being replaced.
+
+    Returns
+    -------
+    The session that was replaced.
+    """
+    global _session
+    with _session_lock:
+        old, _session = _session, session
+    if close and old is not None and old is not session:
+        old.close()
+    return old
+
+
+def configure_session(
+    *,
+    pool_connections: int | None = None,
+    pool_maxsize: int | None = None,
+    pool_block: bool | None = None,
+    keep_alive: bool | None = None,
+) -> requests.Session:
+    """Configure the connection pool of the shared session.
+
+    The given settings are stored in ``SESSION_CONFIG`` and the shared
+    session is replaced with a new session using those settings.
+
+    Parameters
+    ----------
+    pool_connections : int
+        Number of per-host connection pools to cache.
+    pool_maxsize : int
+        Maximum number of connections kept alive for each host.
+    pool_block : bool
+        If True, no more than ``pool_maxsize`` connections are opened
+        to a host at once; extra requests wait for a free connection.
+    keep_alive : bool
+        If False, close each connection after the response.
+
+    Returns
+    -------
+    The new shared session.
+    """
+    for key, value in dict(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        keep_alive=keep_alive,
+    ).items():
+        if value is not None:
+            SESSION_CONFIG[key] = value
+
+    session = new_session()
+    set_session(session)
+    return session
+
+
+def configure_timeout(
+    *, connect: float | None = None, read: float | None = None
+) -> dict:
+    """Configure the default connect and read timeouts of each request.
+
+    Arguments not given keep their current value. A request's
+    ``timeout=`` argument overrides the defaults.
+
+    Parameters
+    ----------
+    connect : float
+        Seconds to wait for a connection to the server.
+    read : float
+        Seconds to wait between bytes of the response.
+
+    Returns
+    -------
+    The ``TIMEOUT`` settings.
+    """
+    if connect is not None:
+        TIMEOUT["connect"] = connect
+    if read is not None:
+        TIMEOUT["read"] = read
+    return TIMEOUT
+
+
+def api_url(path: str) -> str:
+    """URL of an API endpoint, e.g., ``api_url("stations/latest")``."""
+    return f"{API_URL.rstrip('/')}/{path}"
+
+
+def http_get(
+    url: str,
+    params: dict,
+    *,
+    session: requests.Session | None = None,
+    stream: bool = False,
+    timeout: float | tuple[float, float] | None = None,
+    deadline: Deadline | None = None,
+    retries: int | None = None,
+) -> requests.Response:
+    """Make a GET request, subject to the rate limit and retry policy.
+
+    Connection errors, timeouts, and responses with a retryable status
+    code are retried (see ``synoptic.configure_retry``). Each attempt
+    waits for the shared rate limiter (see ``synoptic.configure_rate_limit``).
+
+    Parameters
+    ----------
+    url : str
+        The URL to request.
+    params : dict
+        The query parameters.
+    session : requests.Session, optional
+        The HTTP session used to make the request. If None, uses the
+        shared session.
+    stream : bool
+        If True, don't download the response body until it is read
+        (e.g., with ``response.iter_content``).
+    timeout : float or tuple[float, float], optional
+        Seconds to wait for each attempt to connect and read, as one
+        number or a ``(connect, read)`` tuple. Default is ``TIMEOUT``.
+    deadline : Deadline, optional
+        Time limit for all attempts together, including downloading the
+        body of a response that isn't streamed. Retries are not made if
+        they can't finish in time.
+    retries : int, optional
+        Maximum number of retries. Default is ``RETRY.total``.
+
+    Returns
+    -------
+    The last response, which may have a failed status code if all
+    retries were used.
+    """
+    session = session or get_session()
+    deadline = deadline or Deadline()
+    if timeout is None:
+        timeout = (TIMEOUT["connect"], TIMEOUT["read"])
+    if retries is None:
+        retries = RETRY.total
+
+    attempt = 0
+    while True:
+        RATE_LIMITER.acquire()
+        try:
+            # Without a time limit, the body is read by `requests` as usual.
+            limited = deadline.expires is not None and not stream
+            response = session.get(
+                url,
+                params=params,
+                stream=stream or limited,
+                timeout=deadline.timeout(timeout),
+            )
+            if limited and response.status_code == 200:
+                _read_body(response, deadline)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt >= retries:
+                raise
+            try:
+                deadline.sleep(RETRY.backoff(attempt))
+            except Exception as stop:
+                raise stop from e
+        else:
+            if attempt >= retries or not RETRY.is_retryable(response.status_code):
+                return response
+            response.close()
+            deadline.sleep(RETRY.backoff(attempt, response.headers.get("Retry-After")))
+        attempt += 1
+
+
+def _read_body(response: requests.Response, deadline: Deadline) -> None:
+    """Download the body of a streamed response, checking the deadline."""
+    try:
+        chunks = deadline.guard(response.iter_content(chunk_size=2**16))
+        response._content = b"".join(chunks)
+    finally:
+        response.close()
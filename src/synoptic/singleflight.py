@@ -0,0 +1,79 @@
+"""
+🛫 Share one request between identical concurrent requests.
+
+When several threads (or async tasks) make the same request at the same
+time, only the first one goes to the network. The others wait for it to
+finish and share its response and parsed DataFrame.
+
+This happens automatically for every service class. Requests are
+identical when they have the same service, parameters, and token.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that have the same key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+
+    def do(
+        self, key: Hashable, fn: Callable[[], T], *, timeout: float | None = None
+    ) -> T:
+        """Call ``fn``, or wait for the result of a call with the same key.
+
+        If ``fn`` raises an exception, every caller waiting for it gets
+        the same exception. A caller waiting for another's call raises
+        ``TimeoutError`` after ``timeout`` seconds.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result(timeout)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()``, or the result of a call with the same key.
+
+        Calls are only shared by tasks on the same event loop. If a
+        waiting task is cancelled, the call continues for the others.
+        """
+        key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None:
+                task = self._tasks[key] = asyncio.ensure_future(fn())
+                task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, key, task):
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+
+
+IN_FLIGHT = SingleFlight()
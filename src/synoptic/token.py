@@ -14,14 +14,27 @@ ask for your API token and store that information in
 ``~/.config/SynopticPy/config.cfg``. You may edit that config file if
 you need.
 
+Importing SynopticPy doesn't make any requests. The configured token is
+checked the first time it is used in a request, and a successful check
+is remembered in ``~/.config/SynopticPy/validated.json`` for
+``VALIDATION_TTL`` seconds, so new processes don't check it again.
+
 """
 
+import hashlib
+import json
 import tomllib
 import os
 import re
+import threading
+import time
 from pathlib import Path
+
 import requests
 
+from synoptic.deadline import Deadline
+from synoptic.session import api_url, http_get
+
 
 class ANSI:
     """ANSI color and escape codes."""
@@ -68,6 +81,10 @@ CONFIG_PATH = Path(
 ).expanduser()
 CONFIG_FILE = CONFIG_PATH / "config.toml"
 
+# A successful token check is remembered on disk for this many seconds.
+VALIDATION_TTL = 24 * 60 * 60
+VALIDATION_FILE = CONFIG_PATH / "validated.json"
+
 DEFAULT_TOML = """# SynopticPy needs to know your public Synoptic API token.
 # That token can be stored in this file or set as
 # an environment variable SYNOPTIC_TOKEN.
@@ -117,6 +134,48 @@ TOKEN_HELP = f"""
 """
 
 
+def _validation_key(token: str) -> str:
+    """Key of a token (and the API it was checked with) in the validation file.
+
+    The token itself is not stored.
+    """
+    return hashlib.sha256(f"{api_url('')}\n{token}".encode()).hexdigest()
+
+
+def _read_validated() -> dict[str, float]:
+    """Time each token in the validation file was checked."""
+    try:
+        return json.loads(VALIDATION_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _validated_recently(token: str) -> bool:
+    """Whether the token was checked within ``VALIDATION_TTL`` seconds."""
+    checked = _read_validated().get(_validation_key(token))
+    return checked is not None and time.time() - checked < VALIDATION_TTL
+
+
+def _remember_valid(token: str) -> None:
+    """Record a successful check of the token in the validation file."""
+    now = time.time()
+    validated = {
+        key: checked
+        for key, checked in _read_validated().items()
+        if now - checked < VALIDATION_TTL
+    }
+    validated[_validation_key(token)] = now
+    try:
+        VALIDATION_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # Replace the file at once so other processes never read part of it.
+        tmp = VALIDATION_FILE.with_name(f".{VALIDATION_FILE.name}.{os.getpid()}")
+        tmp.write_text(json.dumps(validated))
+        os.replace(tmp, VALIDATION_FILE)
+    except OSError:
+        # A read-only config directory only means the token is checked again.
+        pass
+
+
 class Token:
     """Synoptic API Token for validating and storing API access credentials.
 
@@ -143,6 +202,8 @@ class Token:
         self.source = "user"
         self.token = token or self._retrieve_token()
         self.hide = hide
+        self._checked = False
+        self._lock = threading.Lock()
 
     def __str__(self):  # noqa: D105
         return self.token
@@ -198,18 +259,60 @@ class Token:
         self.source = "user input"
         return input("Enter your Synoptic API token: ").strip()
 
-    def is_valid(self, *, verbose=False) -> bool:
-        """Check if the token is valid by making a test request to the API."""
+    def is_valid(
+        self,
+        *,
+        verbose=False,
+        session: requests.Session | None = None,
+        cache: bool = True,
+        timeout: float | tuple[float, float] | None = None,
+        deadline: Deadline | None = None,
+        retries: int | None = None,
+    ) -> bool:
+        """Check if the token is valid by making a test request to the API.
+
+        Parameters
+        ----------
+        verbose : bool
+            If True, print the test result.
+        session : requests.Session, optional
+            The HTTP session used to make the request. If None, uses the
+            shared connection-pooled session.
+        cache : bool
+            If True, a token found valid within ``VALIDATION_TTL``
+            seconds is not checked again, and a successful check is
+            remembered in ``VALIDATION_FILE``.
+        timeout : float or tuple[float, float], optional
+            Seconds to wait for the test request to connect and read.
+        deadline : Deadline, optional
+            Time limit for the test request, including retries.
+        retries : int, optional
+            Maximum number of retries. Default is ``RETRY.total``.
+        """
+        if cache and _validated_recently(self.token):
+            if verbose:
+                print("🔓 Token is valid (checked recently).")
+            return True
+
         if verbose:
             print(f"🧪 Testing token={ANSI.text(self.token, ANSI.GREEN)}")
 
         # Make an simple API request to test token validity.
-        URL = "https://api.synopticdata.com/v2/stations/metadata"
+        URL = api_url("stations/metadata")
         params = dict(stid="WBB", token=self.token)
-        response = requests.get(URL, params).json()
+        response = http_get(
+            URL,
+            params,
+            session=session,
+            timeout=timeout,
+            deadline=deadline,
+            retries=retries,
+        ).json()
         response = response["SUMMARY"]["RESPONSE_MESSAGE"]
 
         if response == "OK":
+            if cache:
+                _remember_valid(self.token)
             if verbose:
                 print("🔓 Token is valid.")
             return True
@@ -220,6 +323,31 @@ class Token:
             )
             return False
 
+    def check_once(
+        self,
+        *,
+        session: requests.Session | None = None,
+        timeout: float | tuple[float, float] | None = None,
+        deadline: Deadline | None = None,
+    ) -> None:
+        """Check the token the first time it is used in this process.
+
+        An invalid token is reported (see ``is_valid``), but the check
+        never raises; if the API can't be reached, the request that uses
+        the token reports the error. The check is made once, without
+        retries, within the ``timeout`` and ``deadline`` of that request.
+        """
+        with self._lock:
+            if self._checked:
+                return
+            self._checked = True
+        try:
+            self.is_valid(
+                session=session, timeout=timeout, deadline=deadline, retries=0
+            )
+        except Exception:
+            pass
+
 
 def configure(
     token: str | None = None,
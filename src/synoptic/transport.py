@@ -0,0 +1,183 @@
+"""
+📼 Record API responses and replay them without the network.
+
+In "record" mode, every response is saved as a gzip-compressed fixture
+file. In "replay" mode, requests are answered from those files and
+nothing is sent to the network, so tests and benchmarks of the parsers
+are fast and deterministic.
+
+Fixtures are named by the service and the request parameters, not
+including the token, so fixtures recorded with one token can be
+replayed with any token (or a fake one).
+
+Examples
+--------
+Record responses once (with network access and a valid token),
+
+>>> import synoptic
+>>> from synoptic.transport import recording, replaying
+>>> with recording("tests/fixtures"):
+...     df = synoptic.TimeSeries(stid="wbb", start="2024-01-01", end="2024-01-02").df()
+
+then replay them anywhere.
+
+>>> with replaying("tests/fixtures"):
+...     df = synoptic.TimeSeries(stid="wbb", start="2024-01-01", end="2024-01-02").df()
+"""
+
+import contextlib
+import gzip
+import io
+import os
+import tempfile
+from pathlib import Path
+from typing import Literal
+from urllib.parse import parse_qsl, urlparse
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from synoptic.cache import ResponseCache
+from synoptic.session import new_session, set_session
+
+
+class ReplayMissError(FileNotFoundError):
+    """There is no recorded response for a request being replayed."""
+
+
+def fixture_file(path: str | Path, url: str) -> Path:
+    """Path of the fixture file for a request URL."""
+    url = urlparse(url)
+    service = url.path.rstrip("/").rsplit("/", 1)[-1]
+    params = dict(parse_qsl(url.query))
+    return Path(path) / f"{service}-{ResponseCache.key(service, params)}.json.gz"
+
+
+class RecordAdapter(BaseAdapter):
+    """A transport adapter that saves each successful response to a file.
+
+    Parameters
+    ----------
+    path : str or Path
+        Directory the fixture files are written to.
+    adapter : requests.adapters.BaseAdapter, optional
+        The adapter that makes the requests. Default is an ``HTTPAdapter``.
+    """
+
+    def __init__(self, path: str | Path, adapter: BaseAdapter | None = None):
+        super().__init__()
+        self.path = Path(path)
+        self.adapter = adapter or HTTPAdapter()
+
+    def send(self, request, **kwargs):  # noqa: D102
+        response = self.adapter.send(request, **kwargs)
+        if response.status_code == 200:
+            # Reading `content` downloads the whole body, even for a
+            # streamed response; `iter_content` then reads from memory.
+            content = response.content
+            self.path.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(content))
+            os.replace(tmp, fixture_file(self.path, request.url))
+        return response
+
+    def close(self):  # noqa: D102
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """A transport adapter that answers requests from fixture files.
+
+    Parameters
+    ----------
+    path : str or Path
+        Directory of fixture files written by ``RecordAdapter``.
+    """
+
+    def __init__(self, path: str | Path):
+        super().__init__()
+        self.path = Path(path)
+
+    def send(self, request, **kwargs):  # noqa: D102
+        file = fixture_file(self.path, request.url)
+        if not file.exists():
+            raise ReplayMissError(f"No recorded response for {request.url}")
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        response.raw = io.BytesIO(gzip.decompress(file.read_bytes()))
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):  # noqa: D102
+        pass
+
+
+def transport_session(
+    mode: Literal["record", "replay"],
+    path: str | Path,
+    *,
+    adapter: BaseAdapter | None = None,
+) -> requests.Session:
+    """Create a session that records or replays responses.
+
+    Pass it to a single request with the ``session=`` argument of any
+    service class.
+
+    Parameters
+    ----------
+    mode : {"record", "replay"}
+        Save the responses of real requests, or answer requests from
+        the saved responses.
+    path : str or Path
+        Directory of the fixture files.
+    adapter : requests.adapters.BaseAdapter, optional
+        For "record" mode, the adapter that makes the requests.
+    """
+    if mode == "record":
+        transport = RecordAdapter(path, adapter)
+    elif mode == "replay":
+        transport = ReplayAdapter(path)
+    else:
+        raise ValueError(f"`mode` must be 'record' or 'replay', not {mode!r}.")
+
+    session = new_session()
+    session.mount("https://", transport)
+    session.mount("http://", transport)
+    return session
+
+
+@contextlib.contextmanager
+def use_transport(
+    mode: Literal["record", "replay"],
+    path: str | Path,
+    *,
+    adapter: BaseAdapter | None = None,
+):
+    """Record or replay the responses of all requests in a ``with`` block.
+
+    The shared session is replaced by a ``transport_session`` until the
+    block ends.
+    """
+    session = transport_session(mode, path, adapter=adapter)
+    old = set_session(session, close=False)
+    try:
+        yield session
+    finally:
+        set_session(old, close=False)
+        session.close()
+
+
+def recording(path: str | Path, *, adapter: BaseAdapter | None = None):
+    """Save the responses of all requests in a ``with`` block."""
+    return use_transport("record", path, adapter=adapter)
+
+
+def replaying(path: str | Path):
+    """Answer all requests in a ``with`` block from saved responses."""
+    return use_transport("replay", path)
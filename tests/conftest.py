@@ -0,0 +1,175 @@
+"""A fake Synoptic API for tests that don't need the network."""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlparse
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+
+def station_metadata(stid: str) -> dict:
+    """Metadata for a made-up station."""
+    return {
+        "STID": stid,
+        "ID": str(sum(map(ord, stid))),
+        "MNET_ID": "153",
+        "NAME": f"Station {stid}",
+        "ELEVATION": "4806.0",
+        "LATITUDE": "40.76623",
+        "LONGITUDE": "-111.84755",
+        "STATUS": "ACTIVE",
+        "STATE": "UT",
+        "TIMEZONE": "America/Denver",
+        "UNITS": {"position": "ft", "elevation": "ft"},
+        "PERIOD_OF_RECORD": {
+            "start": "1997-01-01T00:00:00Z",
+            "end": "2024-01-01T00:00:00Z",
+        },
+    }
+
+
+def summary(stations: list) -> dict:
+    """The SUMMARY of a successful request."""
+    return {
+        "RESPONSE_CODE": 1,
+        "RESPONSE_MESSAGE": "OK",
+        "NUMBER_OF_OBJECTS": len(stations),
+    }
+
+
+def timeseries_json(params: dict) -> dict:
+    """Hourly air temperature from `start` to `end` (inclusive)."""
+    start = datetime.strptime(params["start"], "%Y%m%d%H%M")
+    end = datetime.strptime(params["end"], "%Y%m%d%H%M")
+    times = []
+    while start <= end:
+        times.append(start)
+        start += timedelta(hours=1)
+
+    stations = [
+        station_metadata(stid)
+        | {
+            "OBSERVATIONS": {
+                "date_time": [f"{t:%Y-%m-%dT%H:%M:%SZ}" for t in times],
+                "air_temp_set_1": [float(t.hour) for t in times],
+            }
+        }
+        for stid in params["stid"].split(",")
+    ]
+    return {
+        "SUMMARY": summary(stations),
+        "UNITS": {"air_temp": "Celsius"},
+        "STATION": stations,
+    }
+
+
+def latest_json(params: dict) -> dict:
+    """One air temperature observation for each station."""
+    stations = [
+        station_metadata(stid)
+        | {
+            "OBSERVATIONS": {
+                "air_temp_value_1": {
+                    "value": 1.5,
+                    "date_time": "2024-01-01T00:00:00Z",
+                }
+            }
+        }
+        for stid in params["stid"].split(",")
+    ]
+    return {
+        "SUMMARY": summary(stations),
+        "UNITS": {"air_temp": "Celsius"},
+        "STATION": stations,
+    }
+
+
+SERVICES = {
+    "timeseries": timeseries_json,
+    "latest": latest_json,
+    "nearesttime": latest_json,
+}
+
+
+def fake_response(url: str) -> tuple[int, dict]:
+    """Status code and JSON the fake API returns for a URL."""
+    url = urlparse(url)
+    params = dict(parse_qsl(url.query))
+    service = url.path.rstrip("/").rsplit("/", 1)[-1]
+    return 200, SERVICES[service](params)
+
+
+class FakeAPIAdapter(BaseAdapter):
+    """A requests transport adapter that answers with the fake API.
+
+    Append HTTP status codes to ``errors`` to make the next requests fail.
+    Set ``delay`` to make each response take that many seconds.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+        self.errors = []
+        self.delay = 0
+
+    def send(self, request, **kwargs):  # noqa: D102
+        self.urls.append(request.url)
+        time.sleep(self.delay)
+
+        response = requests.Response()
+        if self.errors:
+            response.status_code = self.errors.pop(0)
+            response._content = b"<html>Service Unavailable</html>"
+            response._content_consumed = True
+            response.headers["Retry-After"] = "0"
+            response.url = request.url
+            response.request = request
+            return response
+
+        status, payload = fake_response(request.url)
+        response.status_code = status
+        response._content = json.dumps(payload).encode()
+        response._content_consumed = True
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):  # noqa: D102
+        pass
+
+
+@pytest.fixture
+def fake_api():
+    """A fake API; use ``fake_api.session`` to make requests to it."""
+    adapter = FakeAPIAdapter()
+    adapter.session = requests.Session()
+    adapter.session.mount("https://", adapter)
+    yield adapter
+    adapter.session.close()
+
+
+@pytest.fixture
+def fake_async_client():
+    """An httpx.AsyncClient that makes requests to the fake API.
+
+    The requested URLs are recorded in ``fake_async_client.urls``.
+    """
+    httpx = pytest.importorskip("httpx")
+    urls = []
+
+    async def handler(request):
+        urls.append(str(request.url))
+        # Let other tasks run, as a real request would.
+        await asyncio.sleep(0.05)
+        status, payload = fake_response(str(request.url))
+        return httpx.Response(status, json=payload)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client.urls = urls
+    return client
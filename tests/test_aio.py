@@ -0,0 +1,85 @@
+"""Tests for the asynchronous service classes."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from synoptic.aio import AsyncLatest, AsyncSynopticAPI, AsyncTimeSeries
+from synoptic.deadline import DeadlineExceeded
+
+
+def test_async_request_is_deferred():
+    """Parameters are parsed immediately, but no request is made."""
+    s = AsyncSynopticAPI("latest", stid=["wbb", "ukbkb"], token="demo", within="1h")
+    assert s.params["stid"] == "wbb,ukbkb"
+    assert s.params["within"] == "60"
+    assert not hasattr(s, "json")
+
+
+def test_async_gather(fake_async_client):
+    """Many requests run concurrently with asyncio.gather."""
+    stids = ["WBB", "UKBKB", "KSLC"]
+
+    async def main():
+        async with fake_async_client as client:
+            return await asyncio.gather(
+                *[
+                    AsyncLatest(stid=i, token="demo", client=client, verbose=False)
+                    for i in stids
+                ]
+            )
+
+    results = asyncio.run(main())
+    assert [s.df()["stid"].item() for s in results] == stids
+    assert all(s.df()["value"].item() == 1.5 for s in results)
+
+
+def test_async_chunk(fake_async_client):
+    """A chunked time series request is split into concurrent requests."""
+
+    async def main():
+        async with fake_async_client as client:
+            return await AsyncTimeSeries(
+                stid="WBB",
+                start=datetime(2024, 1, 1),
+                end=datetime(2024, 1, 3),
+                chunk="1d",
+                token="demo",
+                client=client,
+                verbose=False,
+            )
+
+    s = asyncio.run(main())
+    assert len(s.parts) == 2
+    assert len(s.df()) == 49
+
+
+def test_async_shared_request(fake_async_client):
+    """Identical concurrent requests make one network call."""
+
+    async def main():
+        async with fake_async_client as client:
+            return await asyncio.gather(
+                *[
+                    AsyncLatest(stid="WBB", token="demo", client=client, verbose=False)
+                    for _ in range(4)
+                ]
+            )
+
+    results = asyncio.run(main())
+    assert len(fake_async_client.urls) == 1
+    assert all(s.df() is results[0].df() for s in results)
+
+
+def test_async_deadline(fake_async_client):
+    """An async request stops at its deadline."""
+
+    async def main():
+        async with fake_async_client as client:
+            return await AsyncLatest(
+                stid="wbb", token="demo", client=client, verbose=False, deadline=0.01
+            )
+
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(main())
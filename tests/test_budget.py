@@ -0,0 +1,85 @@
+"""Tests for memory-budgeted requests."""
+
+import gc
+from datetime import datetime, timedelta
+
+import pytest
+
+from synoptic.budget import (
+    MemoryBudgetError,
+    estimate_size,
+    parse_size,
+    plan_budget,
+)
+from synoptic.server import serve
+from synoptic.services import TimeSeries
+
+
+def test_parse_size():
+    """Sizes are given in bytes or with units."""
+    assert parse_size(100) == 100
+    assert parse_size("2GB") == 2 * 10**9
+    assert parse_size("1.5 MiB") == int(1.5 * 2**20)
+    with pytest.raises(ValueError):
+        parse_size("lots")
+
+
+def test_plan_budget():
+    """A request over budget is chunked, spilled, or refused."""
+    # 10 million values: 1.5 GB DataFrame, 2.5 GB to request at once.
+    estimate = estimate_size(values_per_hour=10_000, hours=1000)
+    assert plan_budget(estimate, 3 * 10**9, "chunk", max_workers=4) == (None, False)
+
+    # (2 GB - 1.5 GB) / 4 workers / (10,000 values * 250 bytes per hour)
+    chunk, spill = plan_budget(estimate, 2 * 10**9, "chunk", max_workers=4)
+    assert chunk == timedelta(hours=50) and not spill
+
+    chunk, spill = plan_budget(estimate, 10**9, "spill", max_workers=4)
+    assert chunk == timedelta(hours=100) and spill
+
+    with pytest.raises(MemoryBudgetError):
+        plan_budget(estimate, 10**9, "chunk", max_workers=4)
+    with pytest.raises(MemoryBudgetError):
+        plan_budget(estimate, 2 * 10**9, "raise", max_workers=4)
+
+
+def test_memory_budget(tmp_path):
+    """Requests over budget are chunked or spilled to Parquet files."""
+    kwargs = dict(
+        state="UT",
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 1, 6),
+        token="fake",
+        verbose=False,
+    )
+    # The server's period of record ends "now", which differs between requests.
+    drop = ["period_of_record_end"]
+    key = TimeSeries._row_key
+
+    with serve(stations=10, variables=2, interval=5):
+        # 10 stations * 2 sensors * 12 obs/hour * 120 hours = 28,800 values
+        assert TimeSeries(lazy=True, **kwargs).estimate()["values"] == 28_800
+        df = TimeSeries(**kwargs).df().drop(drop).sort(key)
+
+        s = TimeSeries(memory_budget="7MB", **kwargs)
+        assert len(s.parts) > 1
+        assert s.df().drop(drop).sort(key).equals(df)
+
+        s = TimeSeries(
+            memory_budget="2MB", over_budget="spill", spill_dir=tmp_path, **kwargs
+        )
+        assert len(s.spilled) > 1
+        assert all(file.parent == tmp_path for file in s.spilled)
+        assert s.scan().drop(drop).sort(key).collect().equals(df)
+
+        # A temporary spill_dir is removed with the request.
+        s = TimeSeries(memory_budget="2MB", over_budget="spill", **kwargs)
+        spill_dir = s.spill_dir
+        assert spill_dir.exists()
+        del s
+        gc.collect()
+        assert not spill_dir.exists()
+        assert tmp_path.exists()
+
+        with pytest.raises(MemoryBudgetError):
+            TimeSeries(memory_budget="2MB", over_budget="raise", **kwargs)
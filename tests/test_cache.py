@@ -0,0 +1,86 @@
+"""Tests for the on-disk response cache."""
+
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from synoptic.cache import CACHE, ResponseCache, configure_cache
+from synoptic.services import Latest, TimeSeries
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Enable the response cache in a temporary directory."""
+    path, ttl = CACHE.path, CACHE.ttl
+    yield configure_cache(True, path=tmp_path)
+    configure_cache(False, path=path)
+    CACHE.ttl = ttl
+
+
+def test_key():
+    """The cache key doesn't depend on the token or parameter order."""
+    key = ResponseCache.key
+    assert key("latest", {"stid": "wbb", "vars": "air_temp", "token": "a"}) == key(
+        "latest", {"vars": "air_temp", "stid": "wbb", "token": "b"}
+    )
+    assert key("latest", {"stid": "wbb"}) != key("latest", {"stid": "kslc"})
+    assert key("latest", {"stid": "wbb"}) != key("nearesttime", {"stid": "wbb"})
+
+
+def test_cache_hit(cache, fake_api):
+    """A repeated request is read from the cache."""
+    kwargs = dict(stid="wbb", session=fake_api.session, verbose=False)
+    a = Latest(token="demo", **kwargs)
+    b = Latest(token="other", **kwargs)
+    assert len(fake_api.urls) == 1
+    assert b.response is None
+    assert a.df().equals(b.df())
+
+
+def test_ttl(cache, fake_api):
+    """An expired response is requested again."""
+    kwargs = dict(stid="wbb", token="demo", session=fake_api.session, verbose=False)
+    Latest(**kwargs)
+    file = cache.file("latest", Latest(**kwargs).params)
+    assert len(fake_api.urls) == 1
+
+    expired = time.time() - cache.ttl["latest"] - 1
+    os.utime(file, (expired, expired))
+    Latest(**kwargs)
+    assert len(fake_api.urls) == 2
+
+
+def test_evict(tmp_path):
+    """The least recently used responses are removed above the size limit."""
+    cache = ResponseCache(tmp_path, max_size=100_000, enabled=True)
+    for i in range(5):
+        cache.put("metadata", {"stid": i}, os.urandom(30_000))
+        # Make the access times distinct.
+        t = time.time() - 100 + i
+        os.utime(cache.file("metadata", {"stid": i}), (t, time.time()))
+        cache.get("metadata", {"stid": 0})
+
+    assert cache.size() <= 100_000
+    assert cache.get("metadata", {"stid": 0}) is not None
+    assert cache.get("metadata", {"stid": 1}) is None
+    assert cache.get("metadata", {"stid": 4}) is not None
+
+
+def test_stream_cache(cache, fake_api):
+    """A streamed response is cached while it downloads."""
+    kwargs = dict(
+        stid="wbb,kslc",
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 1, 2),
+        token="demo",
+        session=fake_api.session,
+        verbose=False,
+    )
+    a = TimeSeries(stream=True, **kwargs)
+    b = TimeSeries(stream=True, **kwargs)
+    c = TimeSeries(**kwargs)
+    assert len(fake_api.urls) == 1
+    assert a.df().equals(b.df())
+    assert a.df().equals(c.df())
@@ -0,0 +1,83 @@
+"""Tests for adaptive chunk sizes."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from synoptic.chunking import CHUNK_CONFIG, ChunkPlanner, configure_chunking
+from synoptic.server import serve
+from synoptic.services import Precipitation, SynopticAPIError, TimeSeries
+
+
+@pytest.fixture
+def chunking():
+    """Restore the chunk settings after the test."""
+    config = dict(CHUNK_CONFIG)
+    yield configure_chunking
+    CHUNK_CONFIG.update(config)
+
+
+def test_planner(chunking):
+    """Windows grow or shrink toward the targets, by at most a factor of 2."""
+    chunking(target_values=1000, target_seconds=10, min_chunk=timedelta(hours=1))
+    start = datetime(2024, 1, 1)
+    planner = ChunkPlanner(start, datetime(2024, 3, 1), values_per_hour=100)
+    assert planner.chunk == timedelta(hours=10)
+
+    # Fewer values than estimated: grow, but only double.
+    planner.record(start, start + timedelta(hours=10), values=100, seconds=1)
+    assert planner.chunk == timedelta(hours=20)
+
+    # Slow responses: shrink to meet the time target.
+    planner.record(start, start + timedelta(hours=20), values=200, seconds=40)
+    assert planner.chunk == timedelta(hours=10)
+    assert len(planner.history) == 2
+
+    windows = list(
+        ChunkPlanner(start, start + timedelta(hours=25), values_per_hour=100)
+    )
+    assert windows[0] == (start, start + timedelta(hours=10))
+    assert windows[-1][1] == start + timedelta(hours=25)
+
+
+def test_auto_chunk(chunking):
+    """An auto-chunked request returns the same data as one request."""
+    chunking(target_values=2000, target_seconds=60)
+    kwargs = dict(
+        state="UT",
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 1, 5),
+        token="fake",
+        verbose=False,
+    )
+    with serve(stations=10, variables=2):
+        s = TimeSeries(chunk="auto", **kwargs)
+        df = TimeSeries(**kwargs).df()
+
+    # 10 stations * 2 sensors * 12 obs/hour = 240 values per hour.
+    assert s.planner.history[0]["chunk"] == timedelta(hours=8, minutes=20)
+    assert len(s.parts) > 1
+    assert s.df().sort(s._row_key).equals(df.sort(s._row_key))
+
+
+def test_precipitation_chunk():
+    """Only precipitation intervals can be requested in chunks."""
+    kwargs = dict(stid="wbb", recent="10d", token="fake", verbose=False, lazy=True)
+    with pytest.raises(SynopticAPIError):
+        Precipitation(chunk="1d", **kwargs)
+    with pytest.raises(SynopticAPIError):
+        Precipitation(chunk="36h", pmode="intervals", interval="day", **kwargs)
+
+    with serve(stations=5):
+        p = Precipitation(
+            state="UT",
+            start=datetime(2024, 1, 1),
+            end=datetime(2024, 1, 11),
+            pmode="intervals",
+            interval=24,
+            chunk="2d",
+            token="fake",
+            verbose=False,
+        )
+        assert len(p.parts) == 5
+        assert p.df()["stid"].n_unique() == 5
@@ -0,0 +1,110 @@
+"""Tests for request timeouts, deadlines, and cancellation."""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from synoptic.deadline import Deadline, DeadlineExceeded, RequestCancelled
+from synoptic.server import serve
+from synoptic.services import Latest, TimeSeries, fetch_many
+
+
+def test_deadline():
+    """A child deadline has the same expiry and is cancelled with its parent."""
+    deadline = Deadline(10)
+    assert 9 < deadline.remaining() <= 10
+    connect, read = deadline.timeout((3, 60))
+    assert connect == 3 and 9 < read <= 10
+
+    with pytest.raises(DeadlineExceeded):
+        deadline.sleep(20)
+
+    child = deadline.child()
+    assert child.expires == deadline.expires
+    child.cancel()
+    assert not deadline.cancelled
+    deadline.child().check()
+
+    deadline.cancel()
+    with pytest.raises(RequestCancelled):
+        child.check()
+
+    with pytest.raises(DeadlineExceeded):
+        Deadline(0).check()
+    assert Deadline().remaining() is None
+
+
+def test_body_deadline(fake_api):
+    """Reading the response counts toward the deadline."""
+    fake_api.delay = 0.2
+    kwargs = dict(stid="wbb", token="demo", session=fake_api.session, verbose=False)
+    with pytest.raises(DeadlineExceeded):
+        Latest(deadline=0.1, **kwargs)
+    Latest(deadline=5, **kwargs)
+
+
+def test_timeout_and_retries():
+    """A slow server is given up on, instead of retried, at the deadline."""
+    with serve(stations=5, latency=1) as server:
+        timer = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            Latest(state="UT", token="fake", verbose=False, timeout=0.2, deadline=0.5)
+        assert time.monotonic() - timer < 0.9
+        assert server.api.requests <= 3
+
+
+def test_parts_deadline():
+    """The deadline is shared by every part of a chunked request."""
+    kwargs = dict(
+        state="UT",
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 1, 11),
+        chunk="1d",
+        max_workers=2,
+        token="fake",
+        verbose=False,
+    )
+    with serve(stations=5, latency=0.3):
+        timer = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            TimeSeries(deadline=0.5, **kwargs)
+        assert time.monotonic() - timer < 0.9
+
+
+def test_cancel():
+    """A request can be cancelled from another thread."""
+    deadline = Deadline()
+    with serve(stations=5, latency=0.3):
+        s = TimeSeries(
+            state="UT",
+            start=datetime(2024, 1, 1),
+            end=datetime(2024, 1, 11),
+            chunk="1d",
+            max_workers=2,
+            token="fake",
+            verbose=False,
+            deadline=deadline,
+            lazy=True,
+        )
+        threading.Timer(0.1, deadline.cancel).start()
+        timer = time.monotonic()
+        with pytest.raises(RequestCancelled):
+            s.execute()
+        assert time.monotonic() - timer < 0.3
+
+
+def test_fetch_many_deadline():
+    """Queries not finished by the deadline are returned as errors."""
+    with serve(stations=5, latency=0.5):
+        results = fetch_many(
+            [
+                {"service": "latest", "stid": "wbb", "token": "fake"},
+                {"service": "latest", "stid": "kslc", "token": "fake"},
+            ],
+            max_workers=1,
+            deadline=0.8,
+        )
+    assert not isinstance(results[0], Exception)
+    assert isinstance(results[1], DeadlineExceeded)
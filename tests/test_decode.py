@@ -0,0 +1,46 @@
+"""Tests for decoding JSON responses."""
+
+import pytest
+
+from synoptic import decode
+from synoptic.services import Latest
+
+
+def test_loads():
+    """Decode JSON from bytes or str with any backend."""
+    assert decode.loads(b'{"SUMMARY": {"RESPONSE_CODE": 1}}') == {
+        "SUMMARY": {"RESPONSE_CODE": 1}
+    }
+    assert decode.loads('{"a": [1.5, null]}') == {"a": [1.5, None]}
+
+
+def test_loads_error():
+    """Invalid JSON raises a ValueError with any backend."""
+    with pytest.raises(ValueError):
+        decode.loads(b"<html></html>")
+
+
+def test_decode_timer(fake_api):
+    """Download and decode time are reported separately."""
+    s = Latest(stid="wbb", token="demo", session=fake_api.session, verbose=False)
+    assert "api_request" in s.timers
+    assert "decode_json" in s.timers
+
+
+def test_iter_json_stream():
+    """Stream the STATION items of a document split into small chunks."""
+    content = (
+        b'{"SUMMARY": {"RESPONSE_CODE": 1}, '
+        b'"STATION": [{"STID": "WBB", "ELEVATION": 4806.0}, {"STID": "\xc3\xa9"}], '
+        b'"UNITS": {"air_temp": "Celsius"}}'
+    )
+    chunks = [content[i : i + 7] for i in range(0, len(content), 7)]
+    assert list(decode.iter_json_stream(chunks)) == [
+        ("SUMMARY", {"RESPONSE_CODE": 1}),
+        ("STATION", {"STID": "WBB", "ELEVATION": 4806.0}),
+        ("STATION", {"STID": "é"}),
+        ("UNITS", {"air_temp": "Celsius"}),
+    ]
+
+    with pytest.raises(ValueError):
+        list(decode.iter_json_stream([content[:50]]))
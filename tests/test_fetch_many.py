@@ -0,0 +1,44 @@
+"""Tests for fetching many queries at once."""
+
+import polars as pl
+import pytest
+
+from synoptic.services import Latest, TimeSeries, fetch_many
+
+
+def test_fetch_many(fake_api):
+    """Results are returned in order and errors are collected."""
+    results = fetch_many(
+        [
+            {"service": "latest", "stid": "WBB", "token": "demo"},
+            TimeSeries(
+                stid="kslc",
+                start="2024-01-01",
+                end="2024-01-01 06:00",
+                token="demo",
+                session=fake_api.session,
+                lazy=True,
+            ),
+            {"service": "metadata", "start": "2024-01-01", "token": "demo"},
+            {"service": "not_a_service"},
+        ],
+        session=fake_api.session,
+    )
+    assert len(fake_api.urls) == 2
+    assert isinstance(results[0], pl.DataFrame)
+    assert results[0]["stid"].item() == "WBB"
+    assert len(results[1]) == 7
+    assert isinstance(results[2], ValueError)
+    assert isinstance(results[3], ValueError)
+
+
+def test_fetch_many_raise_errors(fake_api):
+    """Errors may be raised instead of collected."""
+    with pytest.raises(ValueError):
+        fetch_many(
+            [
+                Latest(stid="wbb", token="demo", session=fake_api.session, lazy=True),
+                {"service": "not_a_service"},
+            ],
+            raise_errors=True,
+        )
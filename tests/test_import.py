@@ -0,0 +1,66 @@
+"""Tests for the time to `import synoptic`."""
+
+import subprocess
+import sys
+
+# Microseconds `import synoptic` may take, including the modules it
+# imports (the cumulative time from -X importtime).
+IMPORT_BUDGET_US = 50_000
+
+
+def run(code: str) -> subprocess.CompletedProcess:
+    """Run Python code in a new interpreter with import times on stderr."""
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_time():
+    """`import synoptic` stays within its budget and imports nothing heavy."""
+    result = run(
+        "import sys, synoptic; "
+        "print(sorted({'polars', 'requests', 'toml', 'synoptic.services'} & set(sys.modules)))"
+    )
+    assert result.stdout.strip() == "[]"
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    assert times["synoptic"] < IMPORT_BUDGET_US, (
+        f"`import synoptic` took {times['synoptic']} us, "
+        f"more than the budget of {IMPORT_BUDGET_US} us."
+    )
+
+
+def test_lazy_names():
+    """Public names are imported when first used."""
+    result = run(
+        "import synoptic; "
+        "print(synoptic.TimeSeries.__module__, synoptic.Deadline.__module__, "
+        "synoptic.scan_timeseries.__name__, synoptic.services.__name__)"
+    )
+    assert result.stdout.splitlines()[-1].split() == [
+        "synoptic.services",
+        "synoptic.deadline",
+        "scan_timeseries",
+        "synoptic.services",
+    ]
+
+
+def test_namespace_registered():
+    """`df.synoptic` works whether Polars is imported before or after synoptic."""
+    for code in (
+        "import synoptic; import polars as pl",
+        "import polars as pl; import synoptic",
+    ):
+        result = run(
+            f"{code}; import sys; "
+            "print(type(pl.DataFrame().synoptic).__name__, 'synoptic.services' in sys.modules)"
+        )
+        assert result.stdout.splitlines()[-1] == "SynopticFrame False"
@@ -0,0 +1,207 @@
+"""Tests for parsing Synoptic's JSON without the network."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import polars as pl
+
+import pytest
+
+from synoptic.json_parsers import (
+    CLOUD_LAYER,
+    MixedTypeError,
+    _timeseries_observations,
+    parse_stations_timeseries,
+    records_to_dataframe,
+    station_metadata_to_dataframe,
+    timeseries_schema,
+    unpivot_observations,
+)
+
+
+def test_timeseries_schema():
+    """Column types come from the variable, units, and first value."""
+    observations = [
+        {
+            "stid": "WBB",
+            "date_time": ["2024-01-01T00:00:00Z", "2024-01-01T01:00:00Z"],
+            "air_temp_set_1": [1, 2.5],
+            "wind_cardinal_direction_set_1d": ["N", None],
+            "new_variable_set_1": [None, "text"],
+            "cloud_layer_1_set_1d": [None, None],
+        },
+        {"stid": "UKBKB", "date_time": [], "snow_depth_set_1": [None]},
+    ]
+    sensor_variables = [{"air_temp": {"air_temp_set_1": {}}}]
+    schema = timeseries_schema(observations, {"air_temp": "Celsius"}, sensor_variables)
+    assert schema == {
+        "stid": pl.String,
+        "date_time": pl.List(pl.String),
+        "air_temp_set_1": pl.List(pl.Float64),
+        "wind_cardinal_direction_set_1d": pl.List(pl.String),
+        "new_variable_set_1": pl.List(pl.String),
+        "cloud_layer_1_set_1d": pl.List(CLOUD_LAYER),
+        "snow_depth_set_1": pl.List(pl.Float64),
+    }
+
+    df = records_to_dataframe(observations, schema)
+    assert df.schema == schema
+    assert df["air_temp_set_1"].to_list() == [[1.0, 2.5], None]
+
+
+def test_station_metadata_schema():
+    """Known metadata fields aren't inferred; others still are."""
+    station = {
+        "STID": "WBB",
+        "ID": "1",
+        "MNET_ID": "153",
+        "ELEVATION": "4806.0",
+        "LATITUDE": "40.76623",
+        "LONGITUDE": "-111.84755",
+        "STATUS": "ACTIVE",
+        "ELEV_DEM": 4805,
+        "RESTRICTED": False,
+        "PERIOD_OF_RECORD": {"start": "1997-01-01T00:00:00Z", "end": None},
+        "UNITS": {"position": "ft", "elevation": "ft"},
+    }
+    df = station_metadata_to_dataframe([station])
+    assert df["elev_dem"].to_list() == [4805.0]
+    assert df["id"].dtype == pl.UInt32
+    assert df["period_of_record_end"].to_list() == [None]
+
+    df = station_metadata_to_dataframe([station | {"PROVIDERS": [{"name": "U"}]}])
+    assert df["providers"].to_list() == [[{"name": "U"}]]
+
+
+def test_unpivot_observations():
+    """Lists of each station are unpacked to one row per variable and time."""
+    t0, t1, t2 = (datetime(2024, 1, 1, h, tzinfo=timezone.utc) for h in range(3))
+    observations = [
+        {
+            "stid": "WBB",
+            "date_time": ["2024-01-01T00:00:00Z", "2024-01-01T01:00:00Z"],
+            "air_temp_set_1": [1, None],
+        },
+        {
+            "stid": "UKBKB",
+            "date_time": ["2024-01-01T02:00:00Z"],
+            "snow_depth_set_1": [4.0],
+        },
+    ]
+    df = unpivot_observations(observations, ["air_temp_set_1", "snow_depth_set_1"])
+    assert df.rows() == [
+        ("WBB", t0, "air_temp_set_1", 1.0),
+        ("WBB", t1, "air_temp_set_1", None),
+        ("UKBKB", t2, "air_temp_set_1", None),
+        ("WBB", t0, "snow_depth_set_1", None),
+        ("WBB", t1, "snow_depth_set_1", None),
+        ("UKBKB", t2, "snow_depth_set_1", 4.0),
+    ]
+
+    df = unpivot_observations(
+        [
+            {
+                "stid": "WBB",
+                "date_time": ["2024-01-01 00:00"],
+                "weather_summary_set_1d": ["Sunny"],
+            }
+        ],
+        ["weather_summary_set_1d"],
+        pl.String,
+        value_name="value_sting",
+    )
+    assert df.columns == ["stid", "date_time", "variable", "value_sting"]
+    assert df["value_sting"].to_list() == ["Sunny"]
+    assert df["date_time"].to_list() == [t0]
+
+
+def test_mixed_number_column():
+    """A number column with text is kept as text, not nulled."""
+    observations = [
+        {
+            "stid": "WBB",
+            "date_time": ["2024-01-01T00:00:00Z", "2024-01-01T01:00:00Z"],
+            "air_temp_set_1": ["2.5", 3.0],
+            "snow_depth_set_1": [1.0, "T"],
+            "pressure_set_1": [{"x": 1}, None],
+        },
+    ]
+    columns = ["air_temp_set_1", "snow_depth_set_1", "pressure_set_1"]
+    with pytest.raises(MixedTypeError) as e:
+        unpivot_observations(observations, columns)
+    assert e.value.columns == ["snow_depth_set_1", "pressure_set_1"]
+
+    # Numeric strings are numbers when a column has no other text.
+    df = unpivot_observations(observations, ["air_temp_set_1"])
+    assert df["value"].to_list() == [2.5, 3.0]
+
+    stations = [
+        {"STID": "WBB", "OBSERVATIONS": observations[0] | {}, "SENSOR_VARIABLES": {}}
+    ]
+    stations[0]["OBSERVATIONS"].pop("stid")
+    df = _timeseries_observations(stations, {}).sort("variable", "date_time")
+    # The first value is text, so the column is read as text (see timeseries_schema).
+    assert df.filter(pl.col("variable") == "air_temp_set_1")[
+        "value_sting"
+    ].to_list() == ["2.5", "3.0"]
+    assert df.filter(pl.col("variable") == "snow_depth_set_1")[
+        "value_sting"
+    ].to_list() == ["1.0", "T"]
+    assert df.filter(pl.col("variable") == "pressure_set_1")[
+        "value_sting"
+    ].to_list() == ['{"x": 1}', None]
+
+
+def station(stid: str, **observations) -> dict:
+    """Build a STATION item with some OBSERVATIONS (none if not given)."""
+    station = {
+        "STID": stid,
+        "ID": "1",
+        "MNET_ID": "153",
+        "ELEVATION": "4806.0",
+        "LATITUDE": "40.76623",
+        "LONGITUDE": "-111.84755",
+        "STATUS": "ACTIVE",
+        "PERIOD_OF_RECORD": {"start": "1997-01-01T00:00:00Z", "end": None},
+        "UNITS": {"position": "ft", "elevation": "ft"},
+    }
+    if observations:
+        station["OBSERVATIONS"] = observations
+    return station
+
+
+def test_unparsed_columns_warn_once():
+    """Columns that can't be parsed are warned about once, not once per batch."""
+    stations = [
+        station(
+            stid,
+            date_time=["2024-01-01T00:00:00Z"],
+            air_temp_set_1=[1.0],
+            cloud_layer_1_set_1d=[{"sky_condition": "CLR"}],
+        )
+        for stid in ("WBB", "UKBKB")
+    ]
+    S = SimpleNamespace(STATION=stations, UNITS={"air_temp": "Celsius"})
+    with pytest.warns(UserWarning, match="cloud_layer_1_set_1d") as record:
+        df = parse_stations_timeseries(S, batch_size=1)
+    assert len(record) == 1
+    assert df["stid"].unique().sort().to_list() == ["UKBKB", "WBB"]
+
+
+def test_batch_without_observations():
+    """A batch of stations without observations is parsed like the whole response."""
+
+    def stations():
+        return [
+            station("WBB", date_time=["2024-01-01T00:00:00Z"], air_temp_set_1=[1.0]),
+            station("UKBKB"),
+            station("NAA"),
+        ]
+
+    units = {"air_temp": "Celsius"}
+    df = parse_stations_timeseries(SimpleNamespace(STATION=stations(), UNITS=units))
+    batched = parse_stations_timeseries(
+        SimpleNamespace(STATION=stations(), UNITS=units), batch_size=1
+    )
+    assert batched.sort("stid").equals(df.sort("stid"))
+    assert len(df.filter(pl.col("variable").is_not_null())) == 1
@@ -0,0 +1,50 @@
+"""Tests for lazy requests."""
+
+import pytest
+
+from synoptic.services import Latest, SynopticAPIError, TimeSeries
+
+
+def test_lazy_execute(fake_api):
+    """A lazy request is only made when executed."""
+    s = Latest(stid="wbb", token="demo", session=fake_api.session, lazy=True)
+    assert not fake_api.urls
+    assert "stid=wbb" in s.url
+    assert "not requested" in repr(s)
+
+    assert s.execute() is s
+    assert s.execute() is s
+    assert len(fake_api.urls) == 1
+    assert s.SUMMARY["NUMBER_OF_OBJECTS"] == 1
+
+
+def test_lazy_on_access(fake_api):
+    """A lazy request is made on first use of its data."""
+    kwargs = dict(stid="wbb", token="demo", session=fake_api.session, lazy=True)
+
+    s = Latest(**kwargs)
+    assert s.json["SUMMARY"]["RESPONSE_CODE"] == 1
+    assert len(fake_api.urls) == 1
+
+    s = TimeSeries(start="2024-01-01", end="2024-01-01 06:00", **kwargs)
+    assert len(s.df()) == 7
+    assert len(fake_api.urls) == 2
+
+
+def test_lazy_unknown_attribute(fake_api):
+    """Only the response's attributes make a lazy request."""
+    s = Latest(stid="wbb", token="demo", session=fake_api.session, lazy=True)
+    assert not hasattr(s, "nonexistent")
+    assert not fake_api.urls
+
+
+def test_lazy_retry(fake_api):
+    """A lazy request that failed can be made again."""
+    s = Latest(stid="wbb", token="demo", session=fake_api.session, lazy=True)
+    fake_api.errors.append(400)
+    with pytest.raises(SynopticAPIError):
+        s.execute()
+    assert "json" not in s.__dict__
+
+    assert s.SUMMARY["NUMBER_OF_OBJECTS"] == 1
+    assert len(fake_api.urls) == 2
@@ -0,0 +1,52 @@
+"""Tests for retries and rate limiting."""
+
+import time
+
+import pytest
+
+from synoptic.retry import RateLimiter, RetryPolicy, configure_retry, parse_retry_after
+from synoptic.services import Latest, SynopticAPIError
+
+
+def test_backoff_is_jittered_and_capped():
+    """Backoff is random, grows with each attempt, and is capped."""
+    policy = RetryPolicy(backoff_factor=1, backoff_max=5)
+    assert all(0 <= policy.backoff(0) <= 1 for _ in range(100))
+    assert all(0 <= policy.backoff(10) <= 5 for _ in range(100))
+    assert len({policy.backoff(3) for _ in range(10)}) > 1
+
+
+def test_retry_after():
+    """The Retry-After header is used when given."""
+    assert RetryPolicy().backoff(0, retry_after="7") == 7
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+
+
+def test_rate_limiter():
+    """Requests beyond the burst are spaced by the rate."""
+    limiter = RateLimiter(rate=50, burst=5)
+    timer = time.monotonic()
+    for _ in range(15):
+        limiter.acquire()
+    assert time.monotonic() - timer >= 10 / 50 * 0.9
+
+
+def test_retry_server_errors(fake_api):
+    """Transient server errors are retried."""
+    fake_api.errors = [503, 429]
+    s = Latest(stid="wbb", token="demo", session=fake_api.session, verbose=False)
+    assert len(fake_api.urls) == 3
+    assert s.SUMMARY["RESPONSE_CODE"] == 1
+
+
+def test_retries_exhausted(fake_api):
+    """A clear error is raised when all retries fail."""
+    configure_retry(total=1)
+    fake_api.errors = [503, 503, 503]
+    try:
+        with pytest.raises(SynopticAPIError, match="not JSON"):
+            Latest(stid="wbb", token="demo", session=fake_api.session, verbose=False)
+    finally:
+        configure_retry(total=3)
+    assert len(fake_api.urls) == 2
@@ -0,0 +1,124 @@
+"""Tests for scanning time series data as a LazyFrame."""
+
+from datetime import datetime, timezone
+
+import polars as pl
+import pytest
+
+import synoptic.scan
+from synoptic.budget import MemoryBudgetError
+from synoptic.scan import pushdown_params, predicate_constraints, scan_timeseries
+from synoptic.server import serve
+from synoptic.services import SynopticAPIError, TimeSeries
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_predicate_constraints():
+    """Comparisons joined by ``&`` become constraints."""
+    predicate = (
+        (pl.col("stid").is_in(["WBB", "KSLC"]))
+        & (pl.col("variable") == "air_temp")
+        & (pl.col("date_time") >= utc(2024, 1, 5))
+        & (utc(2024, 1, 6) > pl.col("date_time"))
+        & pl.col("latitude").is_between(40, 41)
+        & (pl.col("value") > 0)
+    )
+    c = predicate_constraints(predicate)
+    assert c["stid"] == {"in": {"WBB", "KSLC"}}
+    assert c["variable"] == {"in": {"air_temp"}}
+    assert c["date_time"]["lower"] == utc(2024, 1, 5)
+    assert c["date_time"]["upper"] == utc(2024, 1, 6)
+    assert c["latitude"] == {"lower": 40, "upper": 41}
+
+    # An `|` can't be pushed down.
+    assert (
+        predicate_constraints((pl.col("stid") == "A") | (pl.col("stid") == "B")) == {}
+    )
+
+
+def test_pushdown_params():
+    """Constraints narrow the request parameters."""
+    params = {"stid": "WBB,KSLC", "start": "202401010000", "end": "202401100000"}
+    new = pushdown_params(
+        params,
+        {
+            "stid": {"in": {"wbb", "ukbkb"}},
+            "date_time": {"lower": utc(2024, 1, 5), "upper": utc(2024, 1, 6, 0, 0, 30)},
+            "latitude": {"lower": 40},
+        },
+    )
+    assert new["stid"] == "WBB"
+    assert new["start"] == "202401050000"
+    assert new["end"] == "202401060001"
+    assert new["bbox"] == "-180,40,180,90"
+
+    assert pushdown_params(params, {"stid": {"in": {"UKBKB"}}}) is None
+    with pytest.raises(SynopticAPIError):
+        pushdown_params({"stid": "WBB"}, {})
+
+
+def test_scan_timeseries():
+    """Filters are pushed into a single request."""
+    with serve(stations=20, variables=3) as server:
+        lf = scan_timeseries(
+            state="UT", start="2024-01-01", end="2024-01-10", token="fake"
+        )
+        assert server.api.requests == 0
+        df = (
+            lf.filter(
+                pl.col("variable") == "air_temp",
+                pl.col("date_time") >= utc(2024, 1, 5),
+                pl.col("date_time") < utc(2024, 1, 6),
+                pl.col("stid").is_in(["S00001", "S00002"]),
+            )
+            .select("stid", "date_time", "value")
+            .collect()
+        )
+        assert server.api.requests == 1
+    assert df.columns == ["stid", "date_time", "value"]
+    assert df["stid"].unique().sort().to_list() == ["S00001", "S00002"]
+    assert len(df) == 2 * 24
+
+
+def test_scan_memory_budget():
+    """The memory budget applies to the request made by the scan."""
+    with serve(stations=10, variables=2, interval=5):
+        lf = scan_timeseries(
+            state="UT",
+            start="2024-01-01",
+            end="2024-01-06",
+            token="fake",
+            memory_budget="2MB",
+            over_budget="raise",
+        )
+        with pytest.raises(MemoryBudgetError):
+            lf.collect()
+
+
+def test_scan_string_columns(monkeypatch):
+    """Text values and QC flags are kept, not dropped."""
+
+    class FakeTimeSeries(TimeSeries):
+        def __init__(self, **params):
+            super().__init__(**params | {"lazy": True})
+
+        def df(self):
+            return pl.DataFrame(
+                {
+                    "stid": ["WBB", "WBB"],
+                    "date_time": [utc(2024, 1, 1), utc(2024, 1, 1)],
+                    "variable": ["air_temp", "weather_summary"],
+                    "value": [1.5, None],
+                    "value_sting": [None, "Sunny"],
+                    "qc_flags": [["sl_range_check"], None],
+                }
+            )
+
+    monkeypatch.setattr(synoptic.scan, "TimeSeries", FakeTimeSeries)
+    df = scan_timeseries(stid="WBB", recent=60, token="fake").collect()
+    assert df["value_sting"].to_list() == [None, "Sunny"]
+    assert df["qc_flags"].to_list() == [["sl_range_check"], None]
+    assert df["qc_passed"].to_list() == [None, None]
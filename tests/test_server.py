@@ -0,0 +1,60 @@
+"""Tests for the local stand-in API server."""
+
+from datetime import datetime
+
+import pytest
+
+from synoptic.retry import RETRY, configure_retry
+from synoptic.server import serve
+from synoptic.services import (
+    Latency,
+    Latest,
+    Metadata,
+    Networks,
+    Precipitation,
+    SynopticAPIError,
+    TimeSeries,
+    Variables,
+)
+
+
+def test_serve():
+    """Each service parses the synthetic responses."""
+    kwargs = dict(token="fake", verbose=False)
+    period = dict(start=datetime(2024, 1, 1), end=datetime(2024, 1, 2))
+    with serve(stations=50, variables=3) as server:
+        df = TimeSeries(state="UT", **period, **kwargs).df()
+        assert len(df) == 50 * 25 * 3
+        assert df["variable"].unique().sort().to_list() == [
+            "air_temp",
+            "relative_humidity",
+            "wind_speed",
+        ]
+
+        df = TimeSeries(stid="wbb", vars="air_temp", **period, **kwargs).df()
+        assert df["stid"].unique().to_list() == ["WBB"]
+        assert df["variable"].unique().to_list() == ["air_temp"]
+
+        assert len(Latest(state="UT", **kwargs).df()) == 50 * 3
+        assert len(Metadata(state="UT", **kwargs).df()) == 50
+        assert len(Precipitation(state="UT", **period, **kwargs).df()) == 50
+        assert len(Latency(state="UT", **period, **kwargs).df()) == 50 * 25
+        assert len(Networks(**kwargs).df()) == 3
+        assert len(Variables(**kwargs).df())
+        assert server.api.requests == 8
+
+
+def test_serve_errors():
+    """Injected errors are retried."""
+    total = RETRY.total
+    configure_retry(total=20, backoff_factor=0)
+    try:
+        with serve(stations=5, error_rate=0.5, seed=1) as server:
+            Latest(state="UT", token="fake", verbose=False)
+            assert server.api.requests > 1
+        with serve(error_rate=1):
+            configure_retry(total=1)
+            with pytest.raises(SynopticAPIError):
+                Latest(state="UT", token="fake", verbose=False)
+    finally:
+        configure_retry(total=total, backoff_factor=0.5)
@@ -1,5 +1,6 @@
 """Tests for the Latest service class."""
 
+from synoptic.server import serve
 from synoptic.services import Latest
 from datetime import timedelta
 
@@ -66,3 +67,31 @@ def test_showemptystations():
     """Test bounding box with showemptystations."""
     df = Latest(bbox=[-120, 40, -119, 41], showemptystations=True).df()
     assert len(df)
+
+
+def test_stid_batches(fake_api):
+    """A long list of stations is requested in batches."""
+    stids = [f"S{i:04d}" for i in range(450)]
+    s = Latest(
+        stid=stids,
+        batch_size=200,
+        token="demo",
+        session=fake_api.session,
+        verbose=False,
+    )
+    assert len(fake_api.urls) == 3
+    assert len(s.parts) == 3
+    assert s.SUMMARY["NUMBER_OF_OBJECTS"] == 450
+
+    df = s.df()
+    assert df["stid"].to_list() == stids
+
+
+def test_stid_batch_not_found():
+    """A batch of stations that aren't found doesn't fail the other batches."""
+    stids = [f"S{i:04d}" for i in range(5)]
+    with serve(missing=stids[3:]):
+        s = Latest(stid=stids, batch_size=3, token="fake", verbose=False)
+    assert len(s.parts) == 2
+    assert s.SUMMARY["NUMBER_OF_OBJECTS"] == 3
+    assert s.df()["stid"].unique(maintain_order=True).to_list() == stids[:3]
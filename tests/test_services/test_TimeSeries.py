@@ -1,8 +1,14 @@
 """Tests for the TimeSeries Class."""
 
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 
-from synoptic.services import TimeSeries
+import polars as pl
+import pytest
+
+from synoptic.budget import MemoryBudgetError
+from synoptic.server import serve
+from synoptic.services import SynopticAPIError, TimeSeries, split_time_range
 
 
 def test_string_date_input():
@@ -104,3 +110,201 @@ def test_convert_LATITUDE_with_white_space():
     ).df()
 
     assert len(df)
+
+
+def test_split_time_range():
+    """Split a time range into windows that share their boundary."""
+    windows = split_time_range(
+        datetime(2024, 1, 1), datetime(2024, 1, 20), timedelta(days=7)
+    )
+    assert windows == [
+        (datetime(2024, 1, 1), datetime(2024, 1, 8)),
+        (datetime(2024, 1, 8), datetime(2024, 1, 15)),
+        (datetime(2024, 1, 15), datetime(2024, 1, 20)),
+    ]
+
+
+def test_chunk(fake_api):
+    """Request a long time range in chunks and drop duplicate boundary rows."""
+    s = TimeSeries(
+        stid="WBB,UKBKB",
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 1, 20),
+        chunk="7d",
+        token="demo",
+        session=fake_api.session,
+        verbose=False,
+    )
+    assert len(fake_api.urls) == 3
+    assert s.SUMMARY["NUMBER_OF_OBJECTS"] == 2
+
+    # Each part was parsed while the others downloaded.
+    assert "parse_parts" in s.timers
+    assert all(p._parsed is not None for p in s.parts)
+
+    df = s.df()
+    n_hours = 19 * 24 + 1
+    assert len(df) == 2 * n_hours
+    assert df.select("stid", "date_time").is_duplicated().sum() == 0
+
+
+def test_chunk_without_data():
+    """A window with no data doesn't fail the chunked request."""
+    kwargs = dict(
+        stid="wbb",
+        start=datetime(2024, 1, 1, 1),
+        end=datetime(2024, 1, 4),
+        token="fake",
+        verbose=False,
+    )
+    # The server's period of record ends "now", which differs between requests.
+    drop = ["period_of_record_end"]
+    key = TimeSeries._row_key
+
+    # Observations every 2 days, so the middle 1-day window has none.
+    with serve(interval=2880):
+        df = TimeSeries(**kwargs).df().drop(drop).sort(key)
+        for stream in (False, True):
+            s = TimeSeries(chunk="1d", stream=stream, **kwargs)
+            assert len(s.parts) == 3
+            assert s.parts[1].SUMMARY["RESPONSE_CODE"] == 2
+            assert s.df().drop(drop).sort(key).equals(df)
+
+        # Only when every window is empty is it an error.
+        with pytest.raises(SynopticAPIError, match="No data found"):
+            TimeSeries(chunk="1h", **kwargs | {"end": datetime(2024, 1, 1, 3)})
+
+
+def test_stream(fake_api):
+    """Parsing while streaming the response gives the same DataFrame."""
+    kwargs = dict(
+        stid=[f"S{i:03d}" for i in range(25)],
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 1, 3),
+        token="demo",
+        session=fake_api.session,
+        verbose=False,
+    )
+    s = TimeSeries(stream=10, **kwargs)
+    assert s.SUMMARY["NUMBER_OF_OBJECTS"] == 25
+    assert "OBSERVATIONS" not in s.STATION[0]
+    assert s.df().equals(TimeSeries(**kwargs).df())
+
+
+def test_extend(fake_api):
+    """Only the new period is requested and appended to the DataFrame."""
+    s = TimeSeries(
+        stid="WBB,UKBKB",
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 1, 1, 12),
+        token="demo",
+        session=fake_api.session,
+        verbose=False,
+    )
+    assert len(s.df()) == 2 * 13
+
+    df = s.extend(end=datetime(2024, 1, 2))
+    assert len(fake_api.urls) == 2
+    assert "start=202401011200" in fake_api.urls[-1]
+    assert len(df) == 2 * 25
+    assert df.select("stid", "date_time").is_duplicated().sum() == 0
+    assert s.df().equals(df)
+    assert s.params["end"] == "202401020000"
+    assert "end=202401020000" in s.url
+
+    # Without any data, the whole period is requested again.
+    s._set_df(df.clear())
+    assert len(s.extend(end=datetime(2024, 1, 2))) == 2 * 25
+    assert "start=202401010000" in fake_api.urls[-1]
+
+
+def test_extend_options():
+    """The new period is requested with the same options, like the memory budget."""
+    with serve(stations=10, variables=2, interval=5):
+        s = TimeSeries(
+            state="UT",
+            start=datetime(2024, 1, 1),
+            end=datetime(2024, 1, 1, 6),
+            token="fake",
+            verbose=False,
+            memory_budget="2MB",
+            over_budget="raise",
+            deadline=0.5,
+        )
+        # The time limit starts again for the new period.
+        time.sleep(0.5)
+        s.extend(end=datetime(2024, 1, 1, 12))
+        with pytest.raises(MemoryBudgetError):
+            s.extend(end=datetime(2024, 1, 6))
+
+
+def test_extend_stale_station(fake_api):
+    """A station without recent data doesn't make the whole period requested again."""
+    kwargs = dict(
+        stid="WBB,UKBKB",
+        token="demo",
+        session=fake_api.session,
+        verbose=False,
+    )
+    s = TimeSeries(start=datetime(2024, 1, 1), end=datetime(2024, 1, 3), **kwargs)
+    other = TimeSeries(start=datetime(2024, 1, 1), end=datetime(2024, 1, 2), **kwargs)
+    df = s.df()
+    other_df = other.df()
+
+    # UKBKB stopped reporting two days before WBB.
+    stale = df.filter(
+        (pl.col("stid") == "WBB")
+        | (pl.col("date_time") <= datetime(2024, 1, 1, tzinfo=timezone.utc))
+    )
+    s._set_df(stale)
+    s.extend(end=datetime(2024, 1, 3, 6))
+    assert "start=202401030000" in fake_api.urls[-1]
+
+    s._set_df(stale)
+    s.extend(end=datetime(2024, 1, 3, 6), max_lookback=timedelta(days=3))
+    assert "start=202401010000" in fake_api.urls[-1]
+
+    # Only this instance's DataFrame was replaced.
+    assert other.df() is other_df
+
+
+def test_variables_pushdown():
+    """Variables selected in `df` are the only ones requested by a lazy request."""
+    kwargs = dict(
+        stid="wbb",
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 1, 2),
+        token="fake",
+        verbose=False,
+    )
+    with serve(variables=3) as server:
+        s = TimeSeries(lazy=True, **kwargs)
+        df = s.df(variables="air_temp", columns=["stid", "date_time", "value"])
+        assert server.api.requests == 1
+        assert df.columns == ["stid", "date_time", "value"]
+        assert len(df) == 25
+
+        # The same variables, in any order, are only requested once.
+        for _ in range(3):
+            assert len(s.df(variables="air_temp")) == 25
+        assert server.api.requests == 1
+        assert len(s.df(variables=["wind_speed", "air_temp"])) == 2 * 25
+        assert len(s.df(variables=["air_temp", "wind_speed"])) == 2 * 25
+        assert server.api.requests == 2
+
+        # The lazy request itself still has every variable.
+        assert "vars" not in s.params
+        assert len(s.df()) == 3 * 25
+        assert server.api.requests == 3
+
+        # No request is made for variables that aren't in `vars`.
+        s = TimeSeries(lazy=True, vars="air_temp", **kwargs)
+        with pytest.raises(SynopticAPIError):
+            s.df(variables="wind_speed")
+        assert server.api.requests == 3
+
+        # Not lazy: all variables are requested, then filtered.
+        s = TimeSeries(**kwargs)
+        assert "vars" not in s.params
+        assert len(s.df(variables=["air_temp", "wind_speed"])) == 2 * 25
+        assert len(s.df()) == 3 * 25
@@ -0,0 +1,36 @@
+"""Tests for the shared HTTP session."""
+
+import requests
+
+import synoptic.session as sess
+
+
+def test_get_session_is_shared():
+    """The same session is returned for every request."""
+    assert sess.get_session() is sess.get_session()
+
+
+def test_configure_session():
+    """Configuring the session replaces the shared session."""
+    old = sess.get_session()
+    new = sess.configure_session(pool_maxsize=50, pool_block=True)
+    try:
+        assert new is sess.get_session()
+        assert new is not old
+        adapter = new.get_adapter("https://api.synopticdata.com")
+        assert adapter._pool_maxsize == 50
+        assert adapter._pool_block is True
+    finally:
+        sess.SESSION_CONFIG.update(pool_maxsize=16, pool_block=False)
+        sess.set_session(None)
+
+
+def test_set_session():
+    """A user-provided session is used by all requests."""
+    mine = requests.Session()
+    sess.set_session(mine)
+    try:
+        assert sess.get_session() is mine
+    finally:
+        sess.set_session(None)
+    assert sess.get_session() is not mine
@@ -0,0 +1,79 @@
+"""Tests for sharing identical concurrent requests."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from synoptic.services import Latest
+from synoptic.singleflight import SingleFlight
+
+
+def test_do():
+    """Concurrent calls with the same key share one call."""
+    flight = SingleFlight()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        time.sleep(0.2)
+        return len(calls)
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: flight.do("key", fn), range(8)))
+    assert results == [1] * 8
+    assert flight.do("key", fn) == 2
+
+
+def test_do_error():
+    """Every caller waiting for a failed call gets its exception."""
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fn():
+        started.set()
+        time.sleep(0.2)
+        raise RuntimeError("failed")
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flight.do, "key", fn)
+        started.wait()
+        follower = pool.submit(flight.do, "key", fn)
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError):
+                future.result()
+
+
+def test_do_async():
+    """Concurrent tasks with the same key share one call."""
+    flight = SingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return len(calls)
+
+    async def main():
+        return await asyncio.gather(*[flight.do_async("key", fn) for _ in range(5)])
+
+    assert asyncio.run(main()) == [1] * 5
+
+
+def test_shared_request(fake_api):
+    """Identical requests from several threads make one network call."""
+    fake_api.delay = 0.2
+
+    def latest(_):
+        return Latest(
+            stid="wbb", within=30, token="demo", session=fake_api.session, verbose=False
+        )
+
+    with ThreadPoolExecutor(6) as pool:
+        results = list(pool.map(latest, range(6)))
+    assert len(fake_api.urls) == 1
+
+    dfs = [s.df() for s in results]
+    assert all(df is dfs[0] for df in dfs)
@@ -0,0 +1,82 @@
+"""Tests for checking the API token."""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import synoptic.services
+import synoptic.token
+from synoptic.deadline import DeadlineExceeded
+from synoptic.retry import configure_retry
+from synoptic.server import serve
+from synoptic.services import Latest, SynopticAPIError
+from synoptic.token import Token
+
+
+def test_import_makes_no_request(tmp_path):
+    """Importing synoptic with a configured token doesn't call the API."""
+    with serve(stations=1) as server:
+        env = os.environ | {
+            "SYNOPTIC_TOKEN": "configured",
+            "SYNOPTIC_API_URL": server.url,
+            "SYNOPTICPY_CONFIG_PATH": str(tmp_path),
+        }
+        subprocess.run([sys.executable, "-c", "import synoptic"], env=env, check=True)
+        assert server.api.requests == 0
+
+
+def test_validation_cache(tmp_path, monkeypatch):
+    """A valid token is remembered on disk until the TTL passes."""
+    monkeypatch.setattr(synoptic.token, "VALIDATION_FILE", tmp_path / "validated.json")
+    with serve(stations=1) as server:
+        assert Token("abc").is_valid()
+        assert server.api.requests == 1
+        assert Token("abc").is_valid()
+        assert server.api.requests == 1
+        assert '"abc"' not in (tmp_path / "validated.json").read_text()
+
+        assert Token("abc").is_valid(cache=False)
+        assert server.api.requests == 2
+
+        monkeypatch.setattr(synoptic.token, "VALIDATION_TTL", 0)
+        assert Token("abc").is_valid()
+        assert server.api.requests == 3
+
+
+def test_checked_on_first_request(tmp_path, monkeypatch):
+    """The default token is checked once, when it is first used."""
+    monkeypatch.setattr(synoptic.token, "VALIDATION_FILE", tmp_path / "validated.json")
+    monkeypatch.setattr(synoptic.services, "TOKEN", Token("configured"))
+    with serve(stations=1) as server:
+        Latest(stid="WBB", verbose=False)
+        assert server.api.requests == 2
+        Latest(stid="UKBKB", verbose=False)
+        assert server.api.requests == 3
+
+
+def test_check_without_retries(tmp_path, monkeypatch):
+    """The token check is advisory, so it isn't retried."""
+    monkeypatch.setattr(synoptic.token, "VALIDATION_FILE", tmp_path / "validated.json")
+    monkeypatch.setattr(synoptic.services, "TOKEN", Token("configured"))
+    configure_retry(total=1, backoff_factor=0)
+    try:
+        with serve(stations=1, error_rate=1) as server:
+            with pytest.raises(SynopticAPIError):
+                Latest(stid="WBB", verbose=False)
+            assert server.api.requests == 3
+    finally:
+        configure_retry(total=3, backoff_factor=0.5)
+
+
+def test_check_within_deadline(tmp_path, monkeypatch):
+    """The token check counts toward the deadline of the request."""
+    monkeypatch.setattr(synoptic.token, "VALIDATION_FILE", tmp_path / "validated.json")
+    monkeypatch.setattr(synoptic.services, "TOKEN", Token("configured"))
+    with serve(stations=1, latency=1):
+        timer = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            Latest(stid="WBB", verbose=False, deadline=0.5)
+        assert time.monotonic() - timer < 0.9
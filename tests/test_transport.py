@@ -0,0 +1,42 @@
+"""Tests for recording and replaying responses."""
+
+from datetime import datetime
+
+import pytest
+
+from synoptic.services import Latest, TimeSeries
+from synoptic.transport import (
+    ReplayMissError,
+    recording,
+    replaying,
+    transport_session,
+)
+
+
+def test_record_replay(tmp_path, fake_api):
+    """Recorded responses are replayed without the network."""
+    kwargs = dict(
+        stid="WBB",
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 1, 2),
+        verbose=False,
+    )
+    with recording(tmp_path, adapter=fake_api):
+        recorded = TimeSeries(token="demo", **kwargs).df()
+    assert len(fake_api.urls) == 1
+    assert len(list(tmp_path.glob("timeseries-*.json.gz"))) == 1
+
+    # A different token replays the same fixture.
+    with replaying(tmp_path):
+        replayed = TimeSeries(token="other", **kwargs).df()
+        streamed = TimeSeries(token="other", stream=True, **kwargs).df()
+    assert len(fake_api.urls) == 1
+    assert replayed.equals(recorded)
+    assert streamed.equals(recorded)
+
+
+def test_replay_miss(tmp_path):
+    """A request that was not recorded raises an error."""
+    session = transport_session("replay", tmp_path)
+    with pytest.raises(ReplayMissError):
+        Latest(stid="wbb", token="demo", session=session, verbose=False)